@@ -4,13 +4,13 @@ import argparse
 import sys
 from plane_client import PlaneAPI, load_env_manual
 
-def check_data():
+def check_data(argv=None):
     load_env_manual()
     
     parser = argparse.ArgumentParser(description="Check Plane API data and structure")
     parser.add_argument("--project", type=str, default=os.environ.get("PLANE_SOURCE_PROJECT"), help="Project name or ID")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.project:
         print("Error: Project name or ID is required.")
@@ -4,14 +4,14 @@ import json
 import argparse
 from plane_client import PlaneAPI, load_env_manual
 
-def check_names():
+def check_names(argv=None):
     load_env_manual()
     
     parser = argparse.ArgumentParser(description="Check Plane projects and modules sample data")
     parser.add_argument("--project", type=str, default=os.environ.get("PLANE_SOURCE_PROJECT"), help="Project name or ID")
     parser.add_argument("--module", type=str, help="Module name to sample (e.g., ETC)")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.project:
         print("Error: Project name or ID is required.")
@@ -5,13 +5,13 @@ import sys
 import time
 from plane_client import PlaneAPI, load_env_manual
 
-def debug_data():
+def debug_data(argv=None):
     load_env_manual()
     
     parser = argparse.ArgumentParser(description="Debug Plane Data for Estimates and Attachments")
     parser.add_argument("--project", type=str, default=os.environ.get("PLANE_SOURCE_PROJECT"), help="Project name or ID")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.project:
         print("Error: Project name or ID is required.")
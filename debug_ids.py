@@ -4,14 +4,14 @@ import argparse
 import sys
 from plane_client import PlaneAPI, load_env_manual
 
-def debug_ids():
+def debug_ids(argv=None):
     load_env_manual()
     
     parser = argparse.ArgumentParser(description="Debug Plane IDs and Module issue mapping")
     parser.add_argument("--project", type=str, default=os.environ.get("PLANE_SOURCE_PROJECT"), help="Project name or ID")
     parser.add_argument("--module", type=str, help="Module name or ID")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.project:
         print("Error: Project name or ID is required.")
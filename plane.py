@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Plane CLI
+=========
+모든 도구를 하나의 진입점으로 묶은 CLI 입니다.
+선택한 서브커맨드의 모듈만 지연 import 하므로 `plane --help` 나 스냅샷 기반 명령은
+requests 를 불러오지 않고 바로 시작합니다.
+
+Usage:
+    plane migrate --source "소스" --target "대상" --module "모듈명"
+    plane jobs jobs.jsonl --jobs 4 --rate 1.5
+    plane report --project "프로젝트명" [--snapshot snapshot.json.gz]
+    plane health --project "프로젝트명" -2
+    plane bulk --project "프로젝트명" --action list-started
+    plane transfer export --project "소스" --label bug -o bugs.jsonl
+    plane snapshot --project "프로젝트명" -o snapshot.json.gz
+    plane serve --project "프로젝트명" --port 8765
+    plane loadtest --mock --duration 3
+    plane check projects --project "프로젝트명"
+"""
+
+import importlib
+import os
+import sys
+
+# 서브커맨드 → (모듈, 진입 함수, 설명)
+COMMANDS: dict[str, tuple[str, str, str]] = {
+    "migrate": ("plane_migrate", "main", "프로젝트 간 모듈/이슈 복제"),
+    "jobs": ("plane_jobs", "main", "job 파일의 여러 복제 작업을 공유 요청 예산으로 동시 실행"),
+    "bundle": ("plane_bundle", "main", "모듈 복제 번들 export / 여러 대상으로 import"),
+    "transfer": ("plane_transfer", "main", "조건에 맞는 작업 아이템 JSONL export / 재개 가능한 import"),
+    "report": ("plane_report", "main", "프로젝트 진행 현황 리포트"),
+    "health": ("plane_health", "main", "프로젝트 건강도(정합성) 체크"),
+    "bulk": ("plane_bulk", "main", "상태별 티켓 조회 및 벌크 작업"),
+    "snapshot": ("plane_snapshot", "main", "프로젝트 데이터를 로컬 스냅샷 파일로 저장"),
+    "columnar": ("plane_columnar", "main", "스냅샷을 mmap 컬럼 형식(.plcol)으로 변환"),
+    "serve": ("plane_serve", "main", "warm cache 를 유지하는 로컬 조회 데몬"),
+    "webhook": ("plane_webhook", "main", "webhook 이벤트를 스냅샷에 반영하는 수신기"),
+    "loadtest": ("plane_loadtest", "main", "동시 실행 수별 처리량 / 지연 / 오류 측정 및 권장 설정"),
+    "mock": ("plane_mock", "main", "로컬 테스트 / CI 용 Plane API mock 서버"),
+    "check": ("", "", "사전 검증 및 디버깅 도구 (plane check --help 참고)"),
+}
+
+# check 하위 명령 → (모듈, 진입 함수, 설명)
+CHECKS: dict[str, tuple[str, str, str]] = {
+    "projects": ("check_projects", "check_names", "프로젝트/모듈 목록 및 모듈 이슈 샘플 저장"),
+    "data": ("check_api_data", "check_data", "멤버, 주기, 추정치 데이터 구조 확인"),
+    "states": ("check_cto_states", "debug_states", "상태(State) 및 특정 이슈 상태 확인"),
+    "estimates": ("debug_estimates", "debug_data", "추정치 및 첨부 이미지 디버깅"),
+    "ids": ("debug_ids", "debug_ids", "모듈 이슈 ID 매칭 디버깅"),
+}
+
+
+def _usage(prog: str, table: dict[str, tuple[str, str, str]], title: str) -> str:
+    lines = [f"usage: {prog} <command> [options]", "", title]
+    for name, (_, _, desc) in table.items():
+        lines.append(f"  {name:<10} {desc}")
+    lines.append("")
+    lines.append(f"각 명령의 옵션은 '{prog} <command> --help' 로 확인하세요.")
+    return "\n".join(lines)
+
+
+def _dispatch(prog: str, table: dict[str, tuple[str, str, str]], title: str,
+              argv: list[str]) -> None:
+    if not argv or argv[0] in ("-h", "--help"):
+        print(_usage(prog, table, title))
+        return
+    name, rest = argv[0], argv[1:]
+    if name not in table:
+        print(f"Error: 알 수 없는 명령 '{name}'\n", file=sys.stderr)
+        print(_usage(prog, table, title), file=sys.stderr)
+        sys.exit(2)
+
+    if table is COMMANDS and name == "check":
+        _dispatch(f"{prog} check", CHECKS, "checks:", rest)
+        return
+
+    module_name, func_name, _ = table[name]
+    # 하위 도구의 argparse 가 도움말에 'plane <command>' 를 표시하도록 설정
+    sys.argv[0] = f"{prog} {name}"
+    func = getattr(importlib.import_module(module_name), func_name)
+    if func.__code__.co_argcount:
+        func(rest)
+    else:
+        func()
+
+
+def main(argv: list[str] | None = None):
+    # 하위 모듈은 이 스크립트와 같은 디렉터리에 있으므로 어디서 실행하든 import 가능하도록 보장
+    here = os.path.dirname(os.path.realpath(__file__))
+    if here not in sys.path:
+        sys.path.insert(0, here)
+    try:
+        _dispatch("plane", COMMANDS, "commands:", sys.argv[1:] if argv is None else argv)
+    except BrokenPipeError:
+        # 출력을 받는 쪽(head 등)이 먼저 종료된 경우 traceback 없이 종료
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
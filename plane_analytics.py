@@ -0,0 +1,273 @@
+"""
+Plane Burndown / Cycle-time Analytics
+=====================================
+작업 아이템별 활동(Activity) 내역을 로컬 캐시에 보관하고(작업 아이템 ID + updated_at 기준),
+변경된 아이템의 활동만 동시에 다시 조회하여 모듈별 / 담당자별 번다운과 사이클 타임 분포를 계산합니다.
+
+캐시에는 상태 전이 이력만 압축해 저장하므로, 이후 실행은 변경된 아이템 수만큼만 API 를 호출합니다.
+"""
+
+import gzip
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+from plane_snapshot import link_id
+
+if TYPE_CHECKING:
+    from plane_client import PlaneAPI
+
+CACHE_VERSION = 1
+SPARK = "▁▂▃▄▅▆▇█"
+
+
+def _to_date(ts: str | None) -> date | None:
+    if not ts:
+        return None
+    try:
+        return date.fromisoformat(ts[:10])
+    except ValueError:
+        return None
+
+
+class ActivityCache:
+    """작업 아이템별 상태 전이 이력 캐시 (프로젝트당 파일 하나)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.items: dict[str, dict] = {}
+        if os.path.exists(path):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                self.items = data.get("items", {})
+
+    @classmethod
+    def for_project(cls, cache_dir: str, project_id: str) -> "ActivityCache":
+        os.makedirs(cache_dir, exist_ok=True)
+        return cls(os.path.join(cache_dir, f"activities_{project_id}.json.gz"))
+
+    def is_fresh(self, wi: dict) -> bool:
+        entry = self.items.get(wi["id"])
+        return entry is not None and entry.get("updated_at") == wi.get("updated_at")
+
+    def put(self, wi: dict, transitions: list[list[str]]) -> None:
+        self.items[wi["id"]] = {"updated_at": wi.get("updated_at"), "transitions": transitions}
+
+    def prune(self, live_ids: set[str]) -> int:
+        """삭제된 작업 아이템 항목 제거"""
+        stale = [wid for wid in self.items if wid not in live_ids]
+        for wid in stale:
+            del self.items[wid]
+        return len(stale)
+
+    def save(self) -> None:
+        tmp_path = self.path + ".tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "items": self.items}, f)
+        os.replace(tmp_path, self.path)
+
+
+def compact_transitions(activities: list[dict], state_ids_by_name: dict[str, str]) -> list[list[str]]:
+    """활동 목록에서 상태 변경만 [시각, 새 상태 ID] 로 추려 시간순 정렬"""
+    transitions = []
+    for act in activities:
+        if act.get("field") != "state":
+            continue
+        state_id = act.get("new_identifier") or state_ids_by_name.get(act.get("new_value"))
+        if state_id and act.get("created_at"):
+            transitions.append([act["created_at"], state_id])
+    transitions.sort()
+    return transitions
+
+
+def refresh_activity_cache(api: "PlaneAPI", project_id: str, work_items: list[dict], states: list[dict],
+                           cache: ActivityCache, workers: int = 8, save_every: int = 200) -> tuple[int, int]:
+    """updated_at 이 바뀐 작업 아이템의 활동만 동시에 조회해 캐시 갱신 → (조회 수, 재사용 수)"""
+    state_ids_by_name = {s["name"]: s["id"] for s in states}
+    changed = [wi for wi in work_items if not cache.is_fresh(wi)]
+    reused = len(work_items) - len(changed)
+    if not changed:
+        return 0, reused
+
+    fetched = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(api.list_activities, project_id, wi["id"]): wi for wi in changed}
+        for future in as_completed(futures):
+            wi = futures[future]
+            try:
+                activities = future.result()
+            except Exception as e:
+                # 실패한 아이템은 캐시에 넣지 않아 다음 실행에서 다시 조회됨
+                print(f"  ⚠ 활동 조회 실패 ({wi.get('name', wi['id'])}): {e}", file=sys.stderr)
+                continue
+            cache.put(wi, compact_transitions(activities, state_ids_by_name))
+            fetched += 1
+            # 중단되더라도 이미 받은 활동은 재사용할 수 있도록 주기적으로 저장
+            if fetched % save_every == 0:
+                cache.save()
+    cache.save()
+    return fetched, reused
+
+
+def item_facts(wi: dict, entry: dict | None, state_group_map: dict[str, str]) -> dict:
+    """작업 아이템의 생성일, 착수일(started 최초 진입), 완료일(completed 최종 진입)"""
+    started_at = completed_at = None
+    for ts, state_id in (entry or {}).get("transitions", []):
+        group = state_group_map.get(state_id)
+        if group == "started" and started_at is None:
+            started_at = _to_date(ts)
+        elif group == "completed":
+            completed_at = _to_date(ts)
+        elif group in ("backlog", "unstarted"):
+            # 다시 열린 경우 이전 완료 기록은 무효
+            completed_at = None
+
+    current_group = state_group_map.get(wi.get("state"))
+    if current_group == "completed":
+        completed_at = completed_at or _to_date(wi.get("completed_at"))
+    else:
+        completed_at = None
+    return {
+        "created_at": _to_date(wi.get("created_at")),
+        "started_at": started_at,
+        "completed_at": completed_at,
+        "group": current_group,
+    }
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """선형 보간 백분위수 (sorted_values 는 오름차순)"""
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * q
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def cycle_time_stats(facts: list[dict]) -> dict:
+    """착수 → 완료 일수 분포 (착수 기록이 없으면 생성일 기준)"""
+    days = sorted(
+        (f["completed_at"] - (f["started_at"] or f["created_at"])).days
+        for f in facts
+        if f["completed_at"] and (f["started_at"] or f["created_at"])
+    )
+    return {
+        "count": len(days),
+        "p50": round(percentile(days, 0.5), 1),
+        "p75": round(percentile(days, 0.75), 1),
+        "p90": round(percentile(days, 0.9), 1),
+        "mean": round(sum(days) / len(days), 1) if days else 0.0,
+        "max": days[-1] if days else 0,
+    }
+
+
+def burndown(facts: list[dict], start: date, end: date) -> list[tuple[date, int]]:
+    """일자별 남은 작업 수 (그날까지 생성되었고 그날 끝까지 완료되지 않은 아이템)"""
+    series = []
+    day = start
+    while day <= end:
+        remaining = sum(
+            1 for f in facts
+            if f["group"] != "cancelled"
+            and (f["created_at"] is None or f["created_at"] <= day)
+            and (f["completed_at"] is None or f["completed_at"] > day)
+        )
+        series.append((day, remaining))
+        day += timedelta(days=1)
+    return series
+
+
+def sparkline(values: list[int]) -> str:
+    if not values:
+        return ""
+    top = max(values) or 1
+    return "".join(SPARK[min(len(SPARK) - 1, v * (len(SPARK) - 1) // top)] for v in values)
+
+
+def iter_analytics(api: "PlaneAPI", project: dict, cache_dir: str = ".plane_cache",
+                   workers: int = 8, days: int = 30):
+    """모듈별 / 담당자별 cycle_time 및 burndown 레코드를 반환"""
+    pid = project["id"]
+    project_name = project["name"]
+    states = api.list_states(pid)
+    state_group_map = {s["id"]: s["group"] for s in states}
+    work_items = api.list_work_items(pid)
+
+    cache = ActivityCache.for_project(cache_dir, pid)
+    fetched, reused = refresh_activity_cache(api, pid, work_items, states, cache, workers)
+    cache.prune({wi["id"] for wi in work_items})
+    cache.save()
+    yield {"type": "cache", "project": project_name, "fetched": fetched, "reused": reused}
+
+    facts_by_id = {wi["id"]: item_facts(wi, cache.items.get(wi["id"]), state_group_map) for wi in work_items}
+
+    member_map = {}
+    for m in api.list_members():
+        user = m.get("member", m)
+        if user.get("id"):
+            full_name = f"{user.get('first_name', '')} {user.get('last_name', '')}".strip()
+            member_map[user["id"]] = full_name or user.get("email", "Unknown")
+
+    today = date.today()
+    window_start = today - timedelta(days=days - 1)
+
+    groups: list[tuple[str, str, list[dict], dict]] = []
+    for m in api.list_modules(pid):
+        rows = api.list_module_work_items(pid, m["id"])
+        ids = [link_id(r) for r in rows]
+        groups.append(("module", m["name"], [facts_by_id[i] for i in ids if i in facts_by_id], m))
+
+    by_assignee: dict[str, list[dict]] = {}
+    for wi in work_items:
+        for aid in wi.get("assignees") or []:
+            by_assignee.setdefault(member_map.get(aid, "Unknown"), []).append(facts_by_id[wi["id"]])
+    for name, facts in sorted(by_assignee.items()):
+        groups.append(("assignee", name, facts, {}))
+
+    for scope, name, facts, module in groups:
+        yield {"type": "cycle_time", "project": project_name, "scope": scope, "name": name,
+               "items": len(facts), **cycle_time_stats(facts)}
+
+        start = max(window_start, _to_date(module.get("start_date")) or window_start)
+        target = _to_date(module.get("target_date"))
+        series = burndown(facts, start, today)
+        initial = series[0][1] if series else 0
+        for day, remaining in series:
+            ideal = None
+            if target and target > start:
+                ideal = round(max(0.0, initial * (1 - (day - start).days / (target - start).days)), 1)
+            yield {"type": "burndown", "project": project_name, "scope": scope, "name": name,
+                   "date": day.isoformat(), "remaining": remaining, "ideal": ideal}
+
+
+# CSV 출력 컬럼
+ANALYTICS_FIELDS = ["type", "project", "scope", "name", "items", "count", "p50", "p75", "p90", "mean", "max",
+                    "date", "remaining", "ideal", "fetched", "reused"]
+
+
+def print_analytics(records) -> None:
+    """text 형식: 모듈/담당자별 사이클 타임과 번다운 추이를 한 줄씩 요약"""
+    current = None
+    series: list[int] = []
+
+    def flush():
+        if current and series:
+            print(f"      burndown {sparkline(series)}  {series[0]} → {series[-1]}")
+
+    for r in records:
+        if r["type"] == "cache":
+            print(f"  활동 캐시: {r['fetched']}개 조회, {r['reused']}개 재사용")
+        elif r["type"] == "cycle_time":
+            flush()
+            if current is None or current[0] != r["scope"]:
+                print("\n  📂 모듈별" if r["scope"] == "module" else "\n  👤 담당자별")
+            current = (r["scope"], r["name"])
+            series = []
+            print(f"    • {r['name']:<20} | 완료 {r['count']}/{r['items']} | cycle time p50 {r['p50']}d, p90 {r['p90']}d, max {r['max']}d")
+        elif r["type"] == "burndown":
+            series.append(r["remaining"])
+    flush()
@@ -0,0 +1,188 @@
+"""
+Plane Attachment Transfer
+=========================
+작업 아이템 첨부 파일을 소스 다운로드 URL 에서 대상 업로드 URL 로 고정 크기 청크 단위로 스트리밍 복사합니다.
+파일 전체를 메모리에 올리지 않으므로 메모리 사용량은 파일 크기와 무관하게 (청크 크기 × 동시 전송 수) 로 제한됩니다.
+전송 중 SHA-256 을 계산하고, 업로드 후 대상 파일을 다시 내려받아 같은 방식으로 검증합니다.
+"""
+
+import hashlib
+import mimetypes
+import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator
+import requests
+from plane_client import PlaneAPI, inherit_context
+
+CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+
+def attachment_meta(attachment: dict) -> tuple[str, str, int | None]:
+    """첨부 응답에서 (파일명, MIME 타입, 크기) 추출 (attributes 중첩 여부 모두 지원)"""
+    attrs = attachment.get("attributes") or {}
+    name = attrs.get("name") or attachment.get("name") or attachment.get("asset", "attachment").rsplit("/", 1)[-1]
+    mime_type = attrs.get("type") or attachment.get("type") or mimetypes.guess_type(name)[0] or "application/octet-stream"
+    size = attrs.get("size") or attachment.get("size")
+    return name, mime_type, int(size) if size is not None else None
+
+
+class MultipartStream:
+    """multipart/form-data 본문을 청크 단위로 생성하는 iterable
+
+    requests 는 __len__ 이 있는 iterable 을 Content-Length 와 함께 그대로 스트리밍하므로
+    (chunked 인코딩을 지원하지 않는 S3 presigned POST 에도 사용 가능) 본문 전체를 만들지 않습니다.
+    """
+
+    def __init__(self, fields: dict, filename: str, mime_type: str, size: int, chunks: Iterator[bytes]):
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self.size = size
+        self._chunks = chunks
+        self.sha256 = hashlib.sha256()
+        self.sent = 0
+
+        head = []
+        for key, value in fields.items():
+            head.append(
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{key}"\r\n\r\n'
+                f"{value}\r\n"
+            )
+        safe_name = filename.replace('"', "%22").replace("\r", "").replace("\n", "")
+        head.append(
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{safe_name}"\r\n'
+            f"Content-Type: {mime_type}\r\n\r\n"
+        )
+        self._head = "".join(head).encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+
+    def __len__(self) -> int:
+        return len(self._head) + self.size + len(self._tail)
+
+    def __iter__(self):
+        yield self._head
+        for chunk in self._chunks:
+            if not chunk:
+                continue
+            self.sha256.update(chunk)
+            self.sent += len(chunk)
+            if self.sent > self.size:
+                raise IOError(f"소스 파일이 예상 크기({self.size} bytes)보다 큽니다.")
+            yield chunk
+        if self.sent != self.size:
+            raise IOError(f"소스 파일 크기 불일치: 예상 {self.size} bytes, 수신 {self.sent} bytes")
+        yield self._tail
+
+
+def _spool(chunks: Iterator[bytes]) -> tuple[tempfile.SpooledTemporaryFile, int]:
+    """크기를 알 수 없는 스트림을 임시 파일에 받아 크기 확인 (메모리는 CHUNK_SIZE 까지만 사용)"""
+    spool = tempfile.SpooledTemporaryFile(max_size=CHUNK_SIZE)
+    size = 0
+    for chunk in chunks:
+        spool.write(chunk)
+        size += len(chunk)
+    spool.seek(0)
+    return spool, size
+
+
+def _iter_file(f) -> Iterator[bytes]:
+    while True:
+        chunk = f.read(CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+def hash_download(api: PlaneAPI, project_id: str, work_item_id: str, attachment_id: str) -> tuple[str, int]:
+    """첨부 파일을 스트리밍으로 내려받으며 (sha256, 크기) 계산"""
+    digest = hashlib.sha256()
+    size = 0
+    with api.open_attachment(project_id, work_item_id, attachment_id) as resp:
+        for chunk in resp.iter_content(CHUNK_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def copy_attachment(src_api: PlaneAPI, tgt_api: PlaneAPI, src_pid: str, src_wid: str,
+                    tgt_pid: str, tgt_wid: str, attachment: dict, verify: bool = True,
+                    storage: requests.Session | None = None) -> dict:
+    """첨부 파일 하나를 스트리밍 복사하고 결과(name, size, sha256, attachment_id)를 반환"""
+    name, mime_type, size = attachment_meta(attachment)
+    storage = storage or requests.Session()
+
+    with src_api.open_attachment(src_pid, src_wid, attachment["id"]) as download:
+        length = download.headers.get("Content-Length")
+        if length is not None and not download.headers.get("Content-Encoding"):
+            size = int(length)
+        chunks = download.iter_content(CHUNK_SIZE)
+        spool = None
+        if size is None:
+            spool, size = _spool(chunks)
+            chunks = _iter_file(spool)
+        try:
+            slot = tgt_api.create_attachment_upload(tgt_pid, tgt_wid, name, mime_type, size)
+            upload = slot.get("upload_data") or {}
+            attachment_id = slot.get("asset_id") or (slot.get("attachment") or {}).get("id") or slot.get("id")
+            if not upload.get("url") or not attachment_id:
+                raise IOError(f"업로드 슬롯 응답 형식을 알 수 없습니다: {list(slot)}")
+
+            body = MultipartStream(upload.get("fields") or {}, name, mime_type, size, chunks)
+            # presigned URL 이므로 API Key 헤더가 없는 별도 세션으로 전송
+            resp = storage.post(upload["url"], data=body, headers={"Content-Type": body.content_type},
+                                timeout=(10, 600))
+            resp.raise_for_status()
+        finally:
+            if spool is not None:
+                spool.close()
+
+    tgt_api.complete_attachment_upload(tgt_pid, tgt_wid, attachment_id)
+    checksum = body.sha256.hexdigest()
+
+    if verify:
+        tgt_checksum, tgt_size = hash_download(tgt_api, tgt_pid, tgt_wid, attachment_id)
+        if tgt_checksum != checksum or tgt_size != size:
+            raise IOError(f"체크섬 불일치: {name} (소스 {checksum[:12]}/{size}B, 대상 {tgt_checksum[:12]}/{tgt_size}B)")
+
+    return {"name": name, "size": size, "sha256": checksum, "attachment_id": attachment_id}
+
+
+def copy_work_item_attachments(src_api: PlaneAPI, tgt_api: PlaneAPI, src_pid: str, tgt_pid: str,
+                               id_pairs: list[tuple[str, str]], workers: int = 4,
+                               verify: bool = True) -> tuple[int, int, int]:
+    """(소스 ID, 대상 ID) 목록의 첨부 파일을 동시에 복사 → (성공 수, 실패 수, 전송 바이트)"""
+    jobs: list[tuple[str, str, dict]] = []
+    for src_wid, tgt_wid in id_pairs:
+        try:
+            for attachment in src_api.list_attachments(src_pid, src_wid):
+                jobs.append((src_wid, tgt_wid, attachment))
+        except requests.HTTPError as e:
+            print(f"    ⚠ 첨부 목록 조회 실패 ({src_wid}): {e}")
+
+    if not jobs:
+        return 0, 0, 0
+
+    print(f"  첨부 파일 복사 중 ({len(jobs)}개, 동시 {workers}개)...")
+    copied = failed = total_bytes = 0
+    storage = requests.Session()
+    with ThreadPoolExecutor(max_workers=workers, **inherit_context()) as pool:
+        futures = {
+            pool.submit(copy_attachment, src_api, tgt_api, src_pid, src_wid, tgt_pid, tgt_wid,
+                        attachment, verify, storage): attachment
+            for src_wid, tgt_wid, attachment in jobs
+        }
+        for future in as_completed(futures):
+            name = attachment_meta(futures[future])[0]
+            try:
+                result = future.result()
+            except (requests.RequestException, IOError) as e:
+                failed += 1
+                print(f"    ✗ {name}: {e}")
+                continue
+            copied += 1
+            total_bytes += result["size"]
+            verified = " (검증됨)" if verify else ""
+            print(f"    ✓ {name} ({result['size']:,} bytes){verified}")
+    return copied, failed, total_bytes
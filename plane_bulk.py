@@ -8,9 +8,14 @@ Plane Bulk Action Tool
 import argparse
 import sys
 import os
-from plane_client import PlaneAPI, load_env_manual
+from typing import TYPE_CHECKING
+from plane_env import load_env_manual
+from plane_output import FORMATS, write_records
 
-def bulk_archive_completed(api: PlaneAPI, project_name: str, dry_run: bool = True):
+if TYPE_CHECKING:
+    from plane_client import PlaneAPI
+
+def bulk_archive_completed(api: "PlaneAPI", project_name: str, dry_run: bool = True):
     print(f"\n  [Bulk Action] Archiving Completed Issues in {project_name}")
     
     project = api.find_project_by_name(project_name)
@@ -44,7 +49,44 @@ def bulk_archive_completed(api: PlaneAPI, project_name: str, dry_run: bool = Tru
         print(f"  ⚠ 실제 일괄 삭제/아카이브 로직은 사용자 환경에 맞춰 API를 직접 호출하도록 구현이 필요합니다.")
         print(f"  ⚠ 현재 버전에서는 대상 목록 확인 기능만 제공합니다.")
 
-def bulk_list_issues(api: PlaneAPI, project_name: str, group_filter: str):
+# CSV 출력 컬럼
+BULK_FIELDS = ["type", "project", "id", "work_item_id", "name", "group", "state"]
+
+
+def iter_group_issues(api: "PlaneAPI", project: dict, group_filter: str):
+    """상태 그룹이 일치하는 작업 아이템을 페이지 단위로 조회하며 바로 반환"""
+    if hasattr(api, "group_issues"):
+        # 컬럼 스냅샷은 상태 컬럼에서 일치하는 행만 복원
+        yield from api.group_issues(project, group_filter)
+        return
+    pid = project['id']
+    states = api.list_states(pid)
+    state_group_map = {s['id']: s['group'] for s in states}
+    state_name_map = {s['id']: s['name'] for s in states}
+
+    for wi in api.iter_work_items(pid):
+        if state_group_map.get(wi.get('state')) != group_filter:
+            continue
+        yield {
+            'type': 'work_item',
+            'project': project['name'],
+            'id': wi.get('identifier') or wi.get('sequence_id') or 'N/A',
+            'work_item_id': wi.get('id'),
+            'name': wi.get('name', 'Untitled'),
+            'group': group_filter,
+            'state': state_name_map.get(wi.get('state')),
+        }
+
+
+def bulk_list_issues(api: "PlaneAPI", project_name: str, group_filter: str, fmt: str = "text", stream=None):
+    if fmt != "text":
+        project = api.find_project_by_name(project_name)
+        if not project:
+            print(f"  ✗ 프로젝트 '{project_name}'를 찾을 수 없습니다.", file=sys.stderr)
+            return
+        write_records(fmt, BULK_FIELDS, iter_group_issues(api, project, group_filter), stream)
+        return
+
     print(f"\n  [Bulk Action] Listing '{group_filter}' Issues in {project_name}")
     
     project = api.find_project_by_name(project_name)
@@ -52,22 +94,17 @@ def bulk_list_issues(api: PlaneAPI, project_name: str, group_filter: str):
         print(f"  ✗ 프로젝트 '{project_name}'를 찾을 수 없습니다.")
         return
     
-    pid = project['id']
-    work_items = api.list_work_items(pid)
-    states = api.list_states(pid)
-    state_group_map = {s['id']: s['group'] for s in states}
-    
-    targets = [wi for wi in work_items if state_group_map.get(wi.get('state')) == group_filter]
-    
-    print(f"  - 발견된 티켓 ({group_filter}): {len(targets)}개")
-    
-    if not targets:
+    # 건수를 목록보다 먼저 출력하므로 text 출력 줄만 모아 둠
+    lines = [f"    • {t['id']}: {t['name']}" for t in iter_group_issues(api, project, group_filter)]
+    print(f"  - 발견된 티켓 ({group_filter}): {len(lines)}개")
+
+    if not lines:
         return
 
-    for t in targets:
-        print(f"    • {t.get('identifier') or t.get('sequence_id') or 'N/A'}: {t.get('name', 'Untitled')}")
+    for line in lines:
+        print(line)
 
-def main():
+def main(argv: list[str] | None = None):
     load_env_manual()
     parser = argparse.ArgumentParser(description="Plane Bulk Action Tool")
     parser.add_argument("--project", type=str, default=os.environ.get("PLANE_SOURCE_PROJECT"), help="대상 프로젝트")
@@ -75,16 +112,19 @@ def main():
                         choices=['list-backlog', 'list-unstarted', 'list-started', 'list-completed', 'archive-completed'], 
                         default='list-completed', help="수행할 작업")
     parser.add_argument("--execute", action="store_true", help="실제 작업 수행 (archive-completed 등에 사용)")
+    parser.add_argument("--snapshot", type=str, default=None, help="API 대신 사용할 스냅샷 파일 (plane_snapshot.py 로 생성)")
+    parser.add_argument("--format", type=str, choices=FORMATS, default="text", help="목록 출력 형식 (jsonl/csv/json 은 레코드 단위 스트리밍)")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
-    api = PlaneAPI(os.environ.get("PLANE_BASE_URL"), os.environ.get("PLANE_API_KEY"), os.environ.get("PLANE_WORKSPACE_SLUG"))
+    from plane_snapshot import open_reader
+    api = open_reader(args.snapshot, os.environ.get("PLANE_BASE_URL"), os.environ.get("PLANE_API_KEY"), os.environ.get("PLANE_WORKSPACE_SLUG"))
     
     if args.action == 'archive-completed':
         bulk_archive_completed(api, args.project, not args.execute)
     elif args.action.startswith('list-'):
         group_name = args.action.replace('list-', '')
-        bulk_list_issues(api, args.project, group_name)
+        bulk_list_issues(api, args.project, group_name, args.format)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Plane Migration Bundle
+======================
+소스 모듈 트리(모듈에 속한 작업 아이템 + 하위 아이템), 주기 소속, 댓글, 활동, 첨부 파일 정보를 압축 파일 하나로 내보내고(export),
+번들을 하나 이상의 대상 프로젝트에 동시에 재생합니다(import). 소스는 한 번만 읽고,
+번들 파일은 옮겨서 나중에 소스 인스턴스 없이 적용할 수 있습니다.
+
+Usage:
+    python plane_bundle.py export --project "소스프로젝트" --module "템플릿" --output template.bundle.json.gz
+    python plane_bundle.py import template.bundle.json.gz --target "A" --target "B" --jobs 4
+
+첨부 파일은 번들에 파일 정보만 담기므로, import 시 소스 인스턴스에 접근할 수 있을 때만 복사합니다.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import TYPE_CHECKING
+from plane_env import load_env_manual
+from plane_snapshot import link_id
+
+if TYPE_CHECKING:
+    from plane_client import PlaneAPI
+
+BUNDLE_VERSION = 1
+
+
+class Bundle:
+    """번들 데이터를 migrate 가 소스에서 읽는 PlaneAPI 조회 메서드와 같은 형태로 제공하는 읽기 모델
+
+    attachment_source 를 주면 첨부 파일 내용은 그 클라이언트(소스 인스턴스)에서 내려받습니다.
+    """
+
+    def __init__(self, data: dict, attachment_source: "PlaneAPI | None" = None):
+        self.data = data
+        self.exported_at: str | None = data.get("exported_at")
+        self.base_url: str = data["source"]["base_url"]
+        self.workspace_slug: str = data["source"]["workspace_slug"]
+        self.project: dict = data["project"]
+        self.attachment_source = attachment_source
+        self.request_count = 0
+        self._items = {wi["id"]: wi for wi in data["work_items"]}
+
+    @classmethod
+    def load(cls, path: str, attachment_source: "PlaneAPI | None" = None) -> "Bundle":
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != BUNDLE_VERSION:
+            raise ValueError(f"지원하지 않는 번들 버전입니다: {data.get('version')}")
+        return cls(data, attachment_source)
+
+    def save(self, path: str) -> None:
+        tmp_path = path + ".tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(self.data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @property
+    def module_names(self) -> list[str]:
+        return [m["name"] for m in self.data["modules"]]
+
+    @property
+    def attachment_count(self) -> int:
+        return sum(len(rows) for rows in self.data["attachments"].values())
+
+    # -- PlaneAPI 호환 조회 메서드 (소스 쪽) --
+    def list_projects(self) -> list[dict]:
+        return [self.project]
+
+    def find_project_by_name(self, name: str) -> dict | None:
+        if self.project.get("name") == name or self.project.get("identifier") == name:
+            return self.project
+        return None
+
+    def get_project(self, project_id: str) -> dict:
+        return self.project
+
+    def list_modules(self, project_id: str) -> list[dict]:
+        return self.data["modules"]
+
+    def list_module_work_items(self, project_id: str, module_id: str) -> list[dict]:
+        return [self._items[wid] for wid in self.data["module_links"].get(module_id, []) if wid in self._items]
+
+    def list_work_items(self, project_id: str) -> list[dict]:
+        return list(self._items.values())
+
+    def get_work_item(self, project_id: str, work_item_id: str) -> dict:
+        return self._items[work_item_id]
+
+    def list_states(self, project_id: str) -> list[dict]:
+        return self.data["states"]
+
+    def list_labels(self, project_id: str) -> list[dict]:
+        return self.data["labels"]
+
+    def list_cycles(self, project_id: str) -> list[dict]:
+        return self.data["cycles"]
+
+    def list_cycle_work_items(self, project_id: str, cycle_id: str) -> list[dict]:
+        return [self._items[wid] for wid in self.data.get("cycle_links", {}).get(cycle_id, []) if wid in self._items]
+
+    def list_members(self) -> list[dict]:
+        return self.data["members"]
+
+    def list_estimates(self, project_id: str) -> list[dict]:
+        return self.data["estimates"]
+
+    def list_estimate_points(self, project_id: str, estimate_id: str) -> list[dict]:
+        return self.data["estimate_points"].get(estimate_id, [])
+
+    def list_comments(self, project_id: str, work_item_id: str) -> list[dict]:
+        return self.data["comments"].get(work_item_id, [])
+
+    def list_activities(self, project_id: str, work_item_id: str) -> list[dict]:
+        return self.data["activities"].get(work_item_id, [])
+
+    def list_attachments(self, project_id: str, work_item_id: str) -> list[dict]:
+        return self.data["attachments"].get(work_item_id, [])
+
+    def open_attachment(self, project_id: str, work_item_id: str, attachment_id: str, **kwargs):
+        if self.attachment_source is None:
+            raise IOError("번들에는 첨부 파일 내용이 없습니다 (소스 인스턴스 접속 정보 필요)")
+        return self.attachment_source.open_attachment(project_id, work_item_id, attachment_id, **kwargs)
+
+
+def collect_module_tree(module_rows: list[dict], children: dict[str, list[dict]]) -> list[str]:
+    """모듈 직속 아이템 ID + 모든 하위 아이템 ID (부모 → 자식 순)"""
+    ordered: list[str] = []
+    seen: set[str] = set()
+    stack = [wid for wid in (link_id(r) for r in module_rows) if wid]
+    while stack:
+        wid = stack.pop(0)
+        if wid in seen:
+            continue
+        seen.add(wid)
+        ordered.append(wid)
+        stack.extend(child["id"] for child in children.get(wid, []))
+    return ordered
+
+
+def export_bundle(api: "PlaneAPI", project_name: str, module_names: list[str] | None = None,
+                  workers: int = 8) -> Bundle:
+    """소스 모듈 트리와 댓글 / 활동 / 첨부 파일 정보를 한 번에 읽어 Bundle 생성"""
+    project = api.find_project_by_name(project_name)
+    if not project:
+        raise ValueError(f"프로젝트 '{project_name}'를 찾을 수 없습니다.")
+    pid = project["id"]
+
+    modules = api.list_modules(pid)
+    if module_names:
+        missing = set(module_names) - {m["name"] for m in modules}
+        if missing:
+            raise ValueError(f"모듈을 찾을 수 없습니다: {', '.join(sorted(missing))}")
+        modules = [m for m in modules if m["name"] in module_names]
+    print(f"  • 모듈 {len(modules)}개: {', '.join(m['name'] for m in modules)}")
+
+    # 프로젝트 작업 아이템을 한 번만 조회해 부모 → 자식 색인으로 하위 트리 수집
+    all_items = {wi["id"]: wi for wi in api.list_work_items(pid)}
+    children: dict[str, list[dict]] = {}
+    for wi in all_items.values():
+        if wi.get("parent"):
+            children.setdefault(wi["parent"], []).append(wi)
+
+    module_links: dict[str, list[str]] = {}
+    item_ids: set[str] = set()
+    for m in modules:
+        rows = api.list_module_work_items(pid, m["id"])
+        module_links[m["id"]] = [wid for wid in (link_id(r) for r in rows) if wid]
+        item_ids.update(collect_module_tree(rows, children))
+
+    work_items = []
+    for wid in item_ids:
+        # 목록 조회 이후 생성된 아이템은 개별 조회
+        work_items.append(all_items.get(wid) or api.get_work_item(pid, wid))
+    print(f"  • 작업 아이템 {len(work_items)}개 (하위 포함)")
+
+    def details(wid: str) -> tuple[str, list[dict], list[dict], list[dict]]:
+        return wid, api.list_comments(pid, wid), api.list_activities(pid, wid), api.list_attachments(pid, wid)
+
+    comments: dict[str, list[dict]] = {}
+    activities: dict[str, list[dict]] = {}
+    attachments: dict[str, list[dict]] = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for wid, wi_comments, wi_activities, wi_attachments in pool.map(details, sorted(item_ids)):
+            if wi_comments:
+                comments[wid] = wi_comments
+            if wi_activities:
+                activities[wid] = wi_activities
+            if wi_attachments:
+                attachments[wid] = wi_attachments
+
+    # 주기 소속은 번들에 포함된 작업 아이템만 기록
+    cycles = api.list_cycles(pid)
+    cycle_links = {
+        c["id"]: [wid for wid in map(link_id, api.list_cycle_work_items(pid, c["id"])) if wid in item_ids]
+        for c in cycles
+    }
+
+    estimates = api.list_estimates(pid)
+    estimate_ids = {e["id"] for e in estimates}
+    if project.get("estimate"):
+        estimate_ids.add(project["estimate"])
+    data = {
+        "version": BUNDLE_VERSION,
+        "exported_at": datetime.now().isoformat(timespec="seconds"),
+        "source": {"base_url": api.base_url, "workspace_slug": api.workspace_slug},
+        "project": api.get_project(pid),
+        "members": api.list_members(),
+        "states": api.list_states(pid),
+        "labels": api.list_labels(pid),
+        "cycles": cycles,
+        "cycle_links": cycle_links,
+        "estimates": estimates,
+        "estimate_points": {eid: api.list_estimate_points(pid, eid) for eid in estimate_ids},
+        "modules": modules,
+        "module_links": module_links,
+        "work_items": work_items,
+        "comments": comments,
+        "activities": activities,
+        "attachments": attachments,
+    }
+    bundle = Bundle(data)
+    print(f"  • 댓글 {sum(len(v) for v in comments.values())}개, "
+          f"활동 {sum(len(v) for v in activities.values())}개, 첨부 파일 {bundle.attachment_count}개")
+    return bundle
+
+
+def import_bundle(bundle: Bundle, targets: list[str], base_url: str, api_key: str, workspace: str,
+                  workers: int = 4, **job_options) -> list:
+    """번들의 모듈을 대상 프로젝트마다 job 으로 만들어 공유 요청 예산 아래에서 동시에 복제"""
+    from plane_jobs import Job, run_jobs
+
+    project_name = bundle.project["name"]
+    jobs = [Job(len(targets) * mi + ti + 1, project_name, target, module)
+            for mi, module in enumerate(bundle.module_names)
+            for ti, target in enumerate(targets)]
+    jobs.sort(key=lambda j: j.index)
+    return run_jobs(jobs, base_url, api_key, workspace, workers=workers, source_reader=bundle, **job_options)
+
+
+def main(argv: list[str] | None = None):
+    load_env_manual()
+    parser = argparse.ArgumentParser(description="Plane 모듈 복제 번들 (export / import)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    exp = sub.add_parser("export", help="소스 모듈을 번들 파일로 저장")
+    exp.add_argument("--project", type=str, default=os.environ.get("PLANE_SOURCE_PROJECT"), help="소스 프로젝트 이름")
+    exp.add_argument("--module", type=str, action="append", help="내보낼 모듈 이름 (여러 번 지정 가능, 없으면 전체)")
+    exp.add_argument("--output", "-o", type=str, required=True, help="번들 파일 경로 (.json.gz)")
+    exp.add_argument("--workers", type=int, default=8, help="댓글 / 활동 동시 조회 수")
+
+    imp = sub.add_parser("import", help="번들을 대상 프로젝트에 복제")
+    imp.add_argument("bundle", type=str, help="번들 파일 경로")
+    imp.add_argument("--target", type=str, action="append", help="대상 프로젝트 이름 (여러 번 지정 가능)")
+    imp.add_argument("--jobs", type=int, default=4, help="동시에 실행할 (대상, 모듈) 작업 수")
+    imp.add_argument("--rate", type=float, default=float(os.environ.get("PLANE_RATE_LIMIT", "1.0")), help="전체 작업이 공유하는 초당 요청 수")
+    imp.add_argument("--burst", type=int, default=5, help="순간적으로 허용할 최대 요청 수")
+    imp.add_argument("--log-dir", type=str, default="logs/jobs", help="작업별 로그를 저장할 폴더")
+    imp.add_argument("--dry-run", action="store_true", help="실제 생성 없이 계획만 출력")
+    imp.add_argument("--skip-attachments", action="store_true", help="첨부 파일을 복사하지 않음")
+    imp.add_argument("--source-api-key", type=str, default=os.environ.get("PLANE_SOURCE_API_KEY"), help="첨부 파일을 내려받을 소스 인스턴스 API Key (없으면 첨부 파일 생략)")
+
+    for p in (exp, imp):
+        p.add_argument("--base-url", type=str, default=os.environ.get("PLANE_BASE_URL"), help="Plane URL (import 시 대상)")
+        p.add_argument("--api-key", type=str, default=os.environ.get("PLANE_API_KEY"), help="API Key (import 시 대상)")
+        p.add_argument("--workspace", type=str, default=os.environ.get("PLANE_WORKSPACE_SLUG"), help="Workspace Slug (import 시 대상)")
+
+    args = parser.parse_args(argv)
+    if not args.api_key:
+        print("Error: API Key가 필요합니다.")
+        sys.exit(1)
+
+    from plane_client import PlaneAPI
+
+    if args.command == "export":
+        if not args.project:
+            print("Error: --project 가 필요합니다.")
+            sys.exit(1)
+        api = PlaneAPI(args.base_url, args.api_key, args.workspace)
+        print(f"  번들 내보내는 중: {args.project}")
+        try:
+            bundle = export_bundle(api, args.project, args.module, args.workers)
+        except ValueError as e:
+            print(f"  ✗ {e}")
+            sys.exit(1)
+        bundle.save(args.output)
+        print(f"  ✓ 저장됨: {args.output} ({os.path.getsize(args.output):,} bytes, 요청 {api.request_count}회)")
+        return
+
+    if not args.target:
+        print("Error: --target 을 하나 이상 지정해야 합니다.")
+        sys.exit(1)
+    bundle = Bundle.load(args.bundle)
+    print(f"  번들: {bundle.project['name']} / {', '.join(bundle.module_names)} (exported_at: {bundle.exported_at})")
+    copy_attachments = not args.skip_attachments and bundle.attachment_count > 0
+    if copy_attachments:
+        if args.source_api_key:
+            bundle.attachment_source = PlaneAPI(bundle.base_url, args.source_api_key, bundle.workspace_slug)
+        else:
+            print(f"  ⚠ 첨부 파일 {bundle.attachment_count}개는 소스 접속 정보(--source-api-key)가 없어 복사하지 않습니다.")
+            copy_attachments = False
+
+    try:
+        jobs = import_bundle(bundle, args.target, args.base_url, args.api_key, args.workspace, workers=args.jobs,
+                             rate=args.rate, burst=args.burst, log_dir=args.log_dir, dry_run=args.dry_run,
+                             copy_attachments=copy_attachments)
+    except KeyboardInterrupt:
+        print("\n\n중단됨.")
+        sys.exit(1)
+
+    failed = [j for j in jobs if j.status != "done"]
+    print(f"\n  완료 {len(jobs) - len(failed)}개, 실패 {len(failed)}개")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,485 @@
+import contextvars
+import hashlib
+import heapq
+import itertools
+import json
 import os
+import queue
+import random
+import re
+import sys
+import tempfile
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Any, Optional
-
-def load_env_manual(file_path=".env"):
-    if not os.path.exists(file_path):
-        return
-    with open(file_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" in line:
-                key, value = line.split("=", 1)
-                os.environ[key.strip()] = value.strip().strip('"').strip("'")
+from typing import Any, Callable, Optional
+from urllib.parse import urljoin
+from urllib3.exceptions import NewConnectionError
+from plane_env import load_env_manual
+import plane_profile
+
+
+class RateLimiter:
+    """여러 클라이언트가 공유하는 token bucket (초당 rate 개, 최대 burst 개까지 누적)
+
+    대기 중인 요청은 (priority, 도착 순서) 로 줄을 서며, priority 값이 작을수록 먼저 토큰을 받습니다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._cond = threading.Condition()
+        self._waiting: list[tuple[int, int]] = []
+        self._seq = itertools.count()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def _take(self) -> float:
+        """토큰 하나를 가져오면 0, 없으면 다시 시도하기까지 기다릴 초"""
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def acquire(self, priority: int = 0) -> None:
+        with self._cond:
+            entry = (priority, next(self._seq))
+            heapq.heappush(self._waiting, entry)
+            try:
+                while True:
+                    if self._waiting[0] == entry:
+                        wait = self._take()
+                        if wait <= 0:
+                            return
+                        self._cond.wait(wait)
+                    else:
+                        self._cond.wait()
+            finally:
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+                self._cond.notify_all()
+
+    def penalize(self, seconds: float) -> None:
+        """429 응답 시 모든 클라이언트가 seconds 동안 요청을 멈추도록 토큰을 비움"""
+        with self._cond:
+            self._refill()
+            self.tokens = min(self.tokens, 0) - seconds * self.rate
+            self._cond.notify_all()
+
+
+class SharedRateLimiter(RateLimiter):
+    """같은 호스트의 여러 프로세스가 파일 하나(fcntl 잠금)로 공유하는 token bucket
+
+    프로세스 안에서는 RateLimiter 와 같이 priority 순으로 줄을 서고, 맨 앞 요청만 공유 파일에서 토큰을 가져갑니다.
+    토큰을 기다리는 프로세스가 여럿이면 최근 사용량(반감기 FAIR_HALF_LIFE 초)이 가장 적은 프로세스가 먼저 받으므로
+    요청이 많은 작업이 다른 작업을 굶기지 않습니다. penalize(429)는 모든 프로세스에 적용됩니다.
+    """
+
+    FAIR_HALF_LIFE = 10.0
+    ACTIVE_WINDOW = 2.0  # 이 시간 안에 토큰을 요청한 프로세스만 대기 중으로 간주
+    MAX_WAIT = 0.5  # 대기 중에도 이 간격으로 다시 확인 (대기 표시 갱신)
+
+    def __init__(self, path: str, rate: float, burst: int = 1):
+        import fcntl  # Windows 에는 없으므로 필요할 때만 import
+
+        super().__init__(rate, burst)
+        self.path = path
+        self.member = str(os.getpid())
+        self._flock = fcntl.flock
+        self._lock_ex, self._lock_un = fcntl.LOCK_EX, fcntl.LOCK_UN
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file = open(path, "a+b")
+
+    def _update(self, change: Callable[[dict, float], float]) -> float:
+        """파일 잠금 안에서 공유 상태를 읽고 change(state, now) 적용 후 저장"""
+        self._flock(self._file.fileno(), self._lock_ex)
+        try:
+            self._file.seek(0)
+            raw = self._file.read()
+            try:
+                state = json.loads(raw) if raw else {}
+            except ValueError:
+                state = {}
+            now = time.time()
+            tokens = state.get("tokens", float(self.capacity))
+            elapsed = max(0.0, now - state.get("updated", now))
+            state["tokens"] = min(self.capacity, tokens + elapsed * self.rate)
+            state["updated"] = now
+            members = state.setdefault("members", {})
+            for name in [n for n, m in members.items() if now - m["seen"] > 60]:
+                # 종료된 프로세스 정리
+                del members[name]
+            result = change(state, now)
+            self._file.seek(0)
+            self._file.truncate()
+            self._file.write(json.dumps(state).encode("utf-8"))
+            self._file.flush()
+            return result
+        finally:
+            self._flock(self._file.fileno(), self._lock_un)
+
+    def _take(self) -> float:
+        def change(state: dict, now: float) -> float:
+            members = state["members"]
+            decay = 0.5 ** (max(0.0, now - state.get("decayed", now)) / self.FAIR_HALF_LIFE)
+            state["decayed"] = now
+            for m in members.values():
+                m["usage"] *= decay
+            me = members.setdefault(self.member, {"usage": 0.0})
+            me["seen"] = now
+            if state["tokens"] < 1:
+                me["waiting"] = True
+                return min(self.MAX_WAIT, (1 - state["tokens"]) / self.rate)
+            # 토큰이 있어도 더 적게 쓴 프로세스가 기다리고 있으면 양보
+            for name, m in members.items():
+                if (name != self.member and m.get("waiting") and now - m["seen"] < self.ACTIVE_WINDOW
+                        and m["usage"] < me["usage"]):
+                    me["waiting"] = True
+                    return min(self.MAX_WAIT, 1 / self.rate)
+            state["tokens"] -= 1
+            me["usage"] += 1
+            me["waiting"] = False
+            return 0.0
+
+        return self._update(change)
+
+    def penalize(self, seconds: float) -> None:
+        def change(state: dict, now: float) -> float:
+            state["tokens"] = min(state["tokens"], 0) - seconds * self.rate
+            return 0.0
+
+        with self._cond:
+            self._update(change)
+            self._cond.notify_all()
+
+
+_host_limiters: dict[str, RateLimiter] = {}
+_host_limiters_lock = threading.Lock()
+
+
+def host_limiter(base_url: str, api_key: str, burst: int | None = None) -> RateLimiter | None:
+    """PLANE_SHARED_RATE(초당 요청 수)가 설정되어 있으면 같은 인스턴스 + key 를 쓰는 호스트의 모든 프로세스가
+    공유하는 limiter 를 반환 (프로세스 안에서는 하나의 객체를 공유). 설정이 없으면 None"""
+    rate = os.environ.get("PLANE_SHARED_RATE")
+    if not rate:
+        return None
+    burst = burst or int(os.environ.get("PLANE_SHARED_BURST", "5"))
+    digest = hashlib.sha256(f"{base_url.rstrip('/')}|{api_key}".encode("utf-8")).hexdigest()[:16]
+    directory = os.environ.get("PLANE_SHARED_RATE_DIR") or os.path.join(tempfile.gettempdir(), "plane-ratelimit")
+    path = os.path.join(directory, f"{digest}.json")
+    with _host_limiters_lock:
+        if path not in _host_limiters:
+            try:
+                _host_limiters[path] = SharedRateLimiter(path, float(rate), burst)
+            except ImportError:
+                print("  ⚠ 이 플랫폼에서는 프로세스 간 공유 limiter 를 쓸 수 없어 프로세스 안에서만 제한합니다.",
+                      file=sys.stderr)
+                _host_limiters[path] = RateLimiter(float(rate), burst)
+        return _host_limiters[path]
+
+
+class LookupCache:
+    """여러 클라이언트가 공유하는 조회 결과 캐시 (프로젝트, 멤버, 상태, 레이블 등 잘 바뀌지 않는 목록)
+
+    같은 키를 동시에 요청하면 한 스레드만 API 를 호출하고 나머지는 그 결과를 기다립니다.
+    반환된 목록은 공유되므로 호출자는 수정하지 않아야 합니다.
+    """
+
+    def __init__(self):
+        self._values: dict[tuple, Any] = {}
+        self._locks: dict[tuple, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._values:
+                return self._values[key]
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                if key in self._values:
+                    return self._values[key]
+            value = loader()
+            with self._lock:
+                self._values[key] = value
+            return value
+
+
+def parse_api_keys(value: str | None) -> list[str]:
+    """API Key 설정값 → key 목록
+
+    쉼표로 구분한 여러 key(`key1,key2`) 또는 `@파일경로`(한 줄에 key 하나, # 주석 허용)를 지원합니다.
+    """
+    if not value:
+        return []
+    value = value.strip()
+    if value.startswith("@"):
+        with open(os.path.expanduser(value[1:]), "r", encoding="utf-8") as f:
+            lines = [line.strip() for line in f]
+        return [line for line in lines if line and not line.startswith("#")]
+    return [k.strip() for k in value.split(",") if k.strip()]
+
+
+def mask_key(key: str) -> str:
+    """로그용 key 표시 (Plane key 는 접두어가 같으므로 끝 4자리만)"""
+    return f"…{key[-4:]}" if len(key) > 8 else "…"
+
+
+class KeyPool:
+    """여러 API Key 에 요청을 나누는 pool (Plane 의 rate limit 은 key 단위)
+
+    최근 window 초 동안 요청 수가 가장 적은 key 를 고르고, 429 를 받은 key 는 cooldown 동안 쓰지 않습니다.
+    per_key_rpm 을 주면 key 별 요청 수가 그 값에 도달했을 때 다른 key 로 넘어가거나 여유가 생길 때까지 기다립니다.
+    """
+
+    def __init__(self, keys: list[str], per_key_rpm: int | None = None, window: float = 60.0):
+        if not keys:
+            raise ValueError("API Key 가 없습니다.")
+        self.keys = list(dict.fromkeys(keys))
+        self.per_key_rpm = per_key_rpm
+        self.window = window
+        self._recent: dict[str, deque] = {k: deque() for k in self.keys}
+        self._cooldown_until = {k: 0.0 for k in self.keys}
+        self._strikes = {k: 0 for k in self.keys}
+        self.totals = {k: 0 for k in self.keys}
+        self._cond = threading.Condition()
+
+    def acquire(self) -> str:
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                best = None
+                wake = None
+                for key in self.keys:
+                    recent = self._recent[key]
+                    while recent and recent[0] <= now - self.window:
+                        recent.popleft()
+                    if self._cooldown_until[key] > now:
+                        ready = self._cooldown_until[key]
+                    elif self.per_key_rpm and len(recent) >= self.per_key_rpm:
+                        ready = recent[0] + self.window
+                    else:
+                        if best is None or len(recent) < len(self._recent[best]):
+                            best = key
+                        continue
+                    wake = ready if wake is None else min(wake, ready)
+                if best is not None:
+                    self._recent[best].append(now)
+                    self.totals[best] += 1
+                    return best
+                self._cond.wait(max(0.01, wake - now))
+
+    def report_429(self, key: str, retry_after: float | None = None) -> float:
+        """429 를 받은 key 를 잠시 쉬게 함 (연속 429 일수록 길게) → cooldown 초"""
+        with self._cond:
+            self._strikes[key] += 1
+            cooldown = retry_after or min(300.0, 2.0 * 2 ** (self._strikes[key] - 1))
+            self._cooldown_until[key] = max(self._cooldown_until[key], time.monotonic() + cooldown)
+            self._cond.notify_all()
+            return cooldown
+
+    def report_ok(self, key: str) -> None:
+        if self._strikes[key]:
+            with self._cond:
+                self._strikes[key] = 0
+
+    def status(self) -> list[dict]:
+        now = time.monotonic()
+        with self._cond:
+            return [
+                {
+                    "key": mask_key(k),
+                    "recent": len(self._recent[k]),
+                    "total": self.totals[k],
+                    "cooldown": round(max(0.0, self._cooldown_until[k] - now), 1),
+                }
+                for k in self.keys
+            ]
+
+
+def _retry_after(resp: requests.Response) -> float | None:
+    try:
+        return float(resp.headers.get("Retry-After", ""))
+    except ValueError:
+        return None
+
+
+class LatencyTracker:
+    """최근 GET 응답 시간으로 hedge 지연(p95)을 계산"""
+
+    def __init__(self, window: int = 200, min_samples: int = 20, floor: float = 0.5):
+        self.min_samples = min_samples
+        self.floor = floor
+        self._samples: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def hedge_delay(self) -> float | None:
+        """표본이 충분하면 max(floor, p95), 아니면 None (hedge 하지 않음)"""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return max(self.floor, ordered[int(0.95 * (len(ordered) - 1))])
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """연속 실패로 회로가 열려 요청을 보내지 않고 바로 실패"""
+
+
+class CircuitBreaker:
+    """5xx / timeout / 연결 오류가 failure_threshold 번 연속되면 reset_timeout 동안 요청을 차단
+
+    차단 시간이 지나면 요청 하나만 통과시켜(half-open) 성공하면 닫고, 실패하면 다시 차단합니다.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.probing = False
+        self._lock = threading.Lock()
+
+    def before(self) -> None:
+        with self._lock:
+            if self.opened_at is None:
+                return
+            remaining = self.opened_at + self.reset_timeout - time.monotonic()
+            if remaining > 0:
+                raise CircuitOpenError(f"Plane API 연속 실패로 요청을 차단 중입니다 ({remaining:.0f}s 후 재시도)")
+            if self.probing:
+                raise CircuitOpenError("Plane API 상태 확인 요청이 진행 중입니다")
+            self.probing = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.probing or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self.probing = False
+
+    def release(self) -> None:
+        """결과를 판단할 수 없는 예외로 끝난 probe 를 해제"""
+        with self._lock:
+            self.probing = False
+
+
+# 5xx / timeout 시 재시도해도 안전한 메서드 (POST 는 연결 자체가 안 된 경우만 재시도)
+IDEMPOTENT_METHODS = ("GET", "PATCH", "DELETE")
+
+
+def _not_sent(e: requests.RequestException) -> bool:
+    """요청이 서버에 전달되기 전에 실패했는지 (연결 timeout / 연결 거부) → POST 도 재시도해도 안전"""
+    if isinstance(e, CircuitOpenError):
+        return False
+    if isinstance(e, requests.ConnectTimeout):
+        return True
+    # 연결 거부 / DNS 실패는 urllib3 NewConnectionError 가 MaxRetryError.reason 으로 감싸져 옴
+    reason = getattr(e.args[0], "reason", None) if e.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def inherit_context() -> dict:
+    """ThreadPoolExecutor 인자: 현재 스레드의 contextvars 를 worker 스레드에도 적용
+
+    plane jobs 의 job 별 출력 바인딩처럼 호출 스레드에 묶인 상태를 첨부 복사 / 조회 worker 도 따르게 합니다.
+    """
+    return {"initializer": _apply_context, "initargs": (contextvars.copy_context(),)}
+
+
+def _apply_context(context: contextvars.Context) -> None:
+    for var, value in context.items():
+        var.set(value)
+
+
+UUID_SEGMENT = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+
+
+def _sleep(seconds: float, name: str) -> None:
+    """재시도 대기 (profile 이 켜져 있으면 대기 구간으로 기록)"""
+    with plane_profile.span(name, "wait"):
+        time.sleep(seconds)
+
+
+def _backoff(attempt: int, base: float = 0.5, cap: float = 20.0) -> float:
+    """full jitter 지수 백오프"""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+PAGE_CURSOR = re.compile(r"^(\d+):(\d+):0$")
+
+
+def page_cursors(page: dict, next_cursor: str, per_page: int) -> list[str]:
+    """`per_page:page:offset` 커서와 total_pages 로 남은 페이지 커서 목록 생성 (형태가 다르면 빈 목록)"""
+    match = PAGE_CURSOR.match(str(next_cursor))
+    total_pages = page.get("total_pages")
+    if not match or not isinstance(total_pages, int) or int(match.group(1)) != per_page:
+        return []
+    return [f"{per_page}:{n}:0" for n in range(int(match.group(2)), total_pages)]
+
 
 class PlaneAPI:
-    """Plane REST API v1 클라이언트 (Self-hosted 지원)"""
+    """Plane REST API v1 클라이언트 (Self-hosted 지원)
 
-    def __init__(self, base_url: str, api_key: str, workspace_slug: str):
+    limiter 를 주면 모든 요청이 공유 token bucket 을 거치고(priority 가 작을수록 우선),
+    limiter 가 없고 PLANE_SHARED_RATE 가 설정되어 있으면 같은 호스트의 모든 프로세스가 공유하는 limiter 를 씁니다.
+    lookup_cache 를 주면 프로젝트/멤버/상태/레이블/주기/추정치 조회 결과를 클라이언트 간에 공유합니다.
+    api_key 에 여러 key(`key1,key2` 또는 `@파일`)를 주거나 key_pool 을 주면 요청을 key 들에 나눠 보냅니다.
+
+    모든 요청에는 timeout(연결, 읽기)이 적용되고, 5xx / timeout / 429 는 백오프 후 재시도하고(요청당 최대 retries 번 시도),
+    연속 실패 시 breaker 가 요청을 바로 실패시킵니다. hedge 가 켜져 있으면 GET 응답이 최근 p95 보다
+    늦을 때 같은 요청을 한 번 더 보내고 먼저 온 응답을 사용합니다.
+
+    목록 조회는 첫 페이지 응답에 전체 페이지 수가 있고 커서가 `per_page:page:offset` 형태이면
+    나머지 페이지를 page_workers 개씩 동시에 요청합니다 (1 이면 항상 순차 조회).
+    """
+
+    def __init__(self, base_url: str, api_key: str, workspace_slug: str,
+                 limiter: RateLimiter | None = None, priority: int = 0,
+                 lookup_cache: LookupCache | None = None, key_pool: KeyPool | None = None,
+                 timeout: tuple[float, float] = (10, 60), hedge: bool = True,
+                 breaker: CircuitBreaker | None = None, page_workers: int = 8, retries: int = 5):
         self.base_url = base_url.rstrip("/")
         self.workspace_slug = workspace_slug
+        # limiter 가 없으면 PLANE_SHARED_RATE 설정 시 호스트 공유 limiter 사용
+        self.limiter = limiter or host_limiter(self.base_url, api_key)
+        self.priority = priority
+        self.lookup_cache = lookup_cache
+        self.timeout = timeout
+        self.hedge = hedge
+        self.page_workers = max(1, page_workers)
+        self.retries = max(1, retries)
+        self.breaker = breaker or CircuitBreaker()
+        self.latency = LatencyTracker()
+        self.request_count = 0
+        self.hedge_count = 0
+        self.throttle_count = 0  # 429 응답 수
+        self.backoff_until = 0.0  # 429 백오프가 끝나는 시각 (time.monotonic 기준, 진행 표시용)
+        keys = key_pool.keys if key_pool else parse_api_keys(api_key)
+        if key_pool is None and len(keys) > 1:
+            key_pool = KeyPool(keys)
+        self.key_pool = key_pool
         self.session = requests.Session()
         self.session.headers.update({
-            "X-API-Key": api_key,
+            "X-API-Key": keys[0] if keys else api_key,
             "Content-Type": "application/json",
         })
 
@@ -32,57 +488,206 @@ class PlaneAPI:
 
     def _request(self, method: str, path: str, **kwargs) -> Any:
         url = self._url(path)
-        max_retries = 5
+        max_retries = self.retries
         base_delay = 2
         
         for i in range(max_retries):
-            resp = self.session.request(method, url, **kwargs)
+            self.breaker.before()
+            try:
+                if method == "GET" and self.hedge:
+                    resp, key = self._hedged_get(url, **kwargs)
+                else:
+                    resp, key = self._send(method, url, **kwargs)
+            except (requests.Timeout, requests.ConnectionError) as e:
+                self.breaker.record_failure()
+                if i == max_retries - 1 or not (method in IDEMPOTENT_METHODS or _not_sent(e)):
+                    raise
+                wait = _backoff(i)
+                print(f"  ⚠ {type(e).__name__}. {wait:.1f}s 후 재시도...", file=sys.stderr)
+                _sleep(wait, "재시도 대기")
+                continue
+            except BaseException:
+                self.breaker.release()
+                raise
+
+            if resp.status_code >= 500:
+                self.breaker.record_failure()
+                if method in IDEMPOTENT_METHODS and i < max_retries - 1:
+                    wait = _backoff(i)
+                    print(f"  ⚠ 서버 오류 ({resp.status_code}). {wait:.1f}s 후 재시도...", file=sys.stderr)
+                    _sleep(wait, "재시도 대기")
+                    continue
+            else:
+                self.breaker.record_success()
+
             if resp.status_code == 429:
+                self.throttle_count += 1
+                if i == max_retries - 1:
+                    # 마지막 시도면 기다리지 않고 바로 실패
+                    break
+                if key and len(self.key_pool.keys) > 1:
+                    # 이 key 만 잠시 쉬게 하고 다른 key 로 바로 재시도
+                    cooldown = self.key_pool.report_429(key, _retry_after(resp))
+                    print(f"  ⚠ Rate limit (429) on key {mask_key(key)}. {cooldown:.0f}s 동안 다른 key 사용...", file=sys.stderr)
+                    continue
                 # 지수 백오프 (2^i * base_delay)
                 wait = (2 ** i) * base_delay
-                print(f"  ⚠ Rate limit (429) hit. Waiting {wait}s before retry...")
-                time.sleep(wait)
+                self.backoff_until = time.monotonic() + wait
+                print(f"  ⚠ Rate limit (429) hit. Waiting {wait}s before retry...", file=sys.stderr)
+                if self.limiter:
+                    # 같은 limiter 를 쓰는 모든 클라이언트가 함께 물러남
+                    self.limiter.penalize(wait)
+                else:
+                    _sleep(wait, "429 대기")
                 continue
             
             try:
                 resp.raise_for_status()
-                return resp.json()
+                # DELETE 등 204 응답은 본문이 없음
+                return resp.json() if resp.content else None
             except requests.HTTPError as e:
                 if resp.status_code == 400:
-                    print(f"  ✗ Bad Request (400): {resp.text}")
+                    print(f"  ✗ Bad Request (400): {resp.text}", file=sys.stderr)
                 raise e
         
         resp.raise_for_status()
 
+    def _send(self, method: str, url: str, **kwargs) -> tuple[requests.Response, str | None]:
+        """limiter / key pool 을 거쳐 요청 한 번 전송 → (응답, 사용한 pool key)"""
+        if self.limiter:
+            waited_from = time.perf_counter()
+            self.limiter.acquire(self.priority)
+            waited_to = time.perf_counter()
+            if waited_to - waited_from > 0.001:
+                plane_profile.record("rate limit 대기", "wait", waited_from, waited_to)
+        key = None
+        if self.key_pool:
+            key = self.key_pool.acquire()
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), "X-API-Key": key}
+        kwargs.setdefault("timeout", self.timeout)
+        self.request_count += 1
+        started = time.monotonic()
+        path = url.split("/workspaces/", 1)[-1].split("/", 1)[-1]
+        with plane_profile.span(f"{method} {UUID_SEGMENT.sub('{id}', path)}", "http", url=url) as info:
+            resp = self.session.request(method, url, **kwargs)
+            info["status"] = resp.status_code
+        if method == "GET" and not kwargs.get("stream") and resp.status_code < 500:
+            self.latency.record(time.monotonic() - started)
+        if key and resp.status_code != 429:
+            self.key_pool.report_ok(key)
+        return resp, key
+
+    def _hedged_get(self, url: str, **kwargs) -> tuple[requests.Response, str | None]:
+        """응답이 p95 보다 늦으면 같은 GET 을 한 번 더 보내고 먼저 성공한 응답을 반환"""
+        delay = self.latency.hedge_delay()
+        if delay is None:
+            return self._send("GET", url, **kwargs)
+
+        results: queue.Queue = queue.Queue()
+
+        def attempt():
+            try:
+                resp, key = self._send("GET", url, **kwargs)
+                results.put((resp.status_code < 500, (resp, key)))
+            except Exception as e:
+                results.put((False, e))
+
+        # 늦게 끝난 요청이 프로세스 종료를 막지 않도록 daemon 스레드 사용
+        threading.Thread(target=attempt, daemon=True).start()
+        launched = 1
+        try:
+            ok, value = results.get(timeout=delay)
+        except queue.Empty:
+            self.hedge_count += 1
+            threading.Thread(target=attempt, daemon=True).start()
+            launched = 2
+            ok, value = results.get()
+        received = 1
+        while not ok and received < launched:
+            ok, value = results.get()
+            received += 1
+        if isinstance(value, Exception):
+            raise value
+        return value
+
     def _get(self, path: str, params: dict | None = None) -> Any:
         return self._request("GET", path, params=params)
 
     def _post(self, path: str, data: dict | None = None) -> Any:
         return self._request("POST", path, json=data or {})
 
-    def _get_all_pages(self, path: str, per_page: int = 100) -> list[dict]:
-        """커서 기반 페이지네이션으로 전체 결과 가져오기"""
-        results = []
-        cursor = None
-        while True:
-            params = {"per_page": per_page}
+    def _patch(self, path: str, data: dict | None = None) -> Any:
+        return self._request("PATCH", path, json=data or {})
+
+    def _iter_pages(self, path: str, per_page: int = 100, params: dict | None = None, parallel: bool = True):
+        """커서 기반 페이지네이션으로 결과를 한 건씩 반환
+
+        parallel 이면 첫 페이지가 알려준 전체 페이지 수만큼 나머지 페이지를 미리 동시에 요청하고,
+        커서 형태를 알 수 없으면 next_cursor 를 따라 순차 조회합니다.
+        """
+        def fetch(cursor: str | None) -> Any:
+            page_params = dict(params or {})
+            page_params["per_page"] = per_page
             if cursor:
-                params["cursor"] = cursor
-            data = self._get(path, params)
+                page_params["cursor"] = cursor
+            return self._get(path, page_params)
+
+        data = fetch(None)
+        while True:
             if isinstance(data, list):
-                results.extend(data)
-                break
-            results.extend(data.get("results", []))
+                yield from data
+                return
+            yield from data.get("results", [])
             if not data.get("next_page_results"):
-                break
+                return
             cursor = data.get("next_cursor")
             if not cursor:
-                break
-        return results
+                return
+            cursors = page_cursors(data, cursor, per_page) if parallel and self.page_workers > 1 else []
+            if len(cursors) > 1:
+                # 마지막 페이지는 반복문 처음에서 반환하며, 그 사이 목록이 늘어났으면 이어서 순차 조회
+                data = yield from self._iter_page_window(fetch, cursors)
+            else:
+                data = fetch(cursor)
+
+    def _iter_page_window(self, fetch: Callable[[str], Any], cursors: list[str]):
+        """최대 page_workers 개 페이지를 동시에 요청하며 순서대로 반환 → 마지막 페이지 응답"""
+        pending: deque = deque()
+        remaining = iter(cursors)
+        with ThreadPoolExecutor(max_workers=self.page_workers) as pool:
+            try:
+                for cursor in itertools.islice(remaining, self.page_workers):
+                    pending.append(pool.submit(fetch, cursor))
+                last = None
+                while pending:
+                    data = pending.popleft().result()
+                    cursor = next(remaining, None)
+                    if cursor:
+                        pending.append(pool.submit(fetch, cursor))
+                    if last is not None:
+                        yield from last.get("results", [])
+                    last = data
+                return last
+            finally:
+                # 호출자가 중간에 멈춘 경우 아직 시작하지 않은 요청은 보내지 않음
+                for future in pending:
+                    future.cancel()
+
+    def _get_all_pages(self, path: str, per_page: int = 100) -> list[dict]:
+        """커서 기반 페이지네이션으로 전체 결과 가져오기"""
+        return list(self._iter_pages(path, per_page))
+
+    def _cached(self, key: tuple, loader: Callable[[], Any]) -> Any:
+        if self.lookup_cache is None:
+            return loader()
+        return self.lookup_cache.get((self.base_url, self.workspace_slug) + key, loader)
 
     # -- Projects --
     def list_projects(self) -> list[dict]:
-        return self._get_all_pages("projects/")
+        return self._cached(("projects",), lambda: self._get_all_pages("projects/"))
+
+    def get_project(self, project_id: str) -> dict:
+        return self._cached(("project", project_id), lambda: self._get(f"projects/{project_id}/"))
 
     def find_project_by_name(self, name: str) -> dict | None:
         projects = self.list_projects()
@@ -108,9 +713,11 @@ class PlaneAPI:
     def create_module(self, project_id: str, data: dict) -> dict:
         return self._post(f"projects/{project_id}/modules/", data)
 
+    def update_module(self, project_id: str, module_id: str, data: dict) -> dict:
+        return self._patch(f"projects/{project_id}/modules/{module_id}/", data)
+
     def delete_module(self, project_id: str, module_id: str) -> None:
-        url = self._url(f"projects/{project_id}/modules/{module_id}/")
-        self.session.delete(url).raise_for_status()
+        self._request("DELETE", f"projects/{project_id}/modules/{module_id}/")
 
     # -- Module Work Items --
     def list_module_work_items(self, project_id: str, module_id: str) -> list[dict]:
@@ -125,38 +732,66 @@ class PlaneAPI:
             {"issues": work_item_ids},
         )
 
+    def remove_work_item_from_module(self, project_id: str, module_id: str, work_item_id: str) -> None:
+        self._request("DELETE", f"projects/{project_id}/modules/{module_id}/module-issues/{work_item_id}/")
+
     # -- Work Items --
     def list_work_items(self, project_id: str) -> list[dict]:
         return self._get_all_pages(f"projects/{project_id}/work-items/")
 
+    def iter_work_items(self, project_id: str, order_by: str | None = None):
+        """작업 아이템을 페이지 단위로 조회하며 순서대로 반환 (order_by 예: '-updated_at')"""
+        params = {"order_by": order_by} if order_by else None
+        # 정렬 조회는 호출자가 watermark 에서 일찍 멈추므로 다음 페이지를 미리 받지 않음
+        return self._iter_pages(f"projects/{project_id}/work-items/", params=params, parallel=not order_by)
+
     def get_work_item(self, project_id: str, work_item_id: str) -> dict:
         return self._get(f"projects/{project_id}/work-items/{work_item_id}/")
 
     def create_work_item(self, project_id: str, data: dict) -> dict:
         return self._post(f"projects/{project_id}/work-items/", data)
 
+    def update_work_item(self, project_id: str, work_item_id: str, data: dict) -> dict:
+        return self._patch(f"projects/{project_id}/work-items/{work_item_id}/", data)
+
+    def delete_work_item(self, project_id: str, work_item_id: str) -> None:
+        self._request("DELETE", f"projects/{project_id}/work-items/{work_item_id}/")
+
     # -- States --
     def list_states(self, project_id: str) -> list[dict]:
-        return self._get_all_pages(f"projects/{project_id}/states/")
+        return self._cached(("states", project_id), lambda: self._get_all_pages(f"projects/{project_id}/states/"))
 
     # -- Labels --
     def list_labels(self, project_id: str) -> list[dict]:
-        return self._get_all_pages(f"projects/{project_id}/labels/")
+        return self._cached(("labels", project_id), lambda: self._get_all_pages(f"projects/{project_id}/labels/"))
 
     # -- Estimate Points --
     def list_estimates(self, project_id: str) -> list[dict]:
-        return self._get_all_pages(f"projects/{project_id}/estimates/")
+        return self._cached(("estimates", project_id), lambda: self._get_all_pages(f"projects/{project_id}/estimates/"))
 
     def list_estimate_points(self, project_id: str, estimate_id: str) -> list[dict]:
-        return self._get_all_pages(f"projects/{project_id}/estimates/{estimate_id}/estimate-points/")
+        return self._cached(
+            ("estimate_points", project_id, estimate_id),
+            lambda: self._get_all_pages(f"projects/{project_id}/estimates/{estimate_id}/estimate-points/"),
+        )
 
     # -- Workspace Members --
     def list_members(self) -> list[dict]:
-        return self._get_all_pages("members/")
+        return self._cached(("members",), lambda: self._get_all_pages("members/"))
 
     # -- Cycles --
     def list_cycles(self, project_id: str) -> list[dict]:
-        return self._get_all_pages(f"projects/{project_id}/cycles/")
+        return self._cached(("cycles", project_id), lambda: self._get_all_pages(f"projects/{project_id}/cycles/"))
+
+    def list_cycle_work_items(self, project_id: str, cycle_id: str) -> list[dict]:
+        return self._get_all_pages(f"projects/{project_id}/cycles/{cycle_id}/cycle-issues/")
+
+    def add_work_items_to_cycle(self, project_id: str, cycle_id: str,
+                                work_item_ids: list[str]) -> Any:
+        return self._post(
+            f"projects/{project_id}/cycles/{cycle_id}/cycle-issues/",
+            {"issues": work_item_ids},
+        )
 
     # -- Comments --
     def list_comments(self, project_id: str, work_item_id: str) -> list[dict]:
@@ -165,6 +800,40 @@ class PlaneAPI:
     def create_comment(self, project_id: str, work_item_id: str, data: dict) -> dict:
         return self._post(f"projects/{project_id}/work-items/{work_item_id}/comments/", data)
 
+    def update_comment(self, project_id: str, work_item_id: str, comment_id: str, data: dict) -> dict:
+        return self._patch(f"projects/{project_id}/work-items/{work_item_id}/comments/{comment_id}/", data)
+
+    # -- Attachments --
+    def list_attachments(self, project_id: str, work_item_id: str) -> list[dict]:
+        return self._get_all_pages(f"projects/{project_id}/work-items/{work_item_id}/attachments/")
+
+    def open_attachment(self, project_id: str, work_item_id: str, attachment_id: str,
+                        timeout: tuple[float, float] = (10, 300)) -> requests.Response:
+        """첨부 파일 다운로드 응답을 스트림으로 반환 (서버가 저장소 URL 로 redirect)"""
+        url = self._url(f"projects/{project_id}/work-items/{work_item_id}/attachments/{attachment_id}/")
+        resp, _ = self._send("GET", url, stream=True, allow_redirects=False, timeout=timeout)
+        if resp.is_redirect:
+            # presigned 저장소(S3/MinIO) URL 은 session 의 X-API-Key 헤더 없이 따로 요청 (API key 유출 방지)
+            location = urljoin(url, resp.headers["Location"])
+            resp.close()
+            resp = requests.get(location, stream=True, timeout=timeout)
+        resp.raise_for_status()
+        return resp
+
+    def create_attachment_upload(self, project_id: str, work_item_id: str,
+                                 name: str, mime_type: str, size: int) -> dict:
+        """첨부 파일 업로드 슬롯 생성 → upload_data(url, fields) 와 asset_id 반환"""
+        return self._post(
+            f"projects/{project_id}/work-items/{work_item_id}/attachments/",
+            {"name": name, "type": mime_type, "size": size},
+        )
+
+    def complete_attachment_upload(self, project_id: str, work_item_id: str, attachment_id: str) -> Any:
+        return self._patch(
+            f"projects/{project_id}/work-items/{work_item_id}/attachments/{attachment_id}/",
+            {"is_uploaded": True},
+        )
+
     # -- Activity --
     def list_activities(self, project_id: str, work_item_id: str) -> list[dict]:
         return self._get_all_pages(f"projects/{project_id}/work-items/{work_item_id}/activities/")
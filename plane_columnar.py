@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+"""
+Plane Columnar Snapshot
+=======================
+스냅샷을 작업 아이템 필드별 컬럼(고정 폭 ID, 사전 인코딩 문자열, 오프셋 배열)으로 저장하고,
+메모리 매핑(mmap)으로 열어 report / health / bulk 집계를 컬럼 위에서 바로 계산합니다.
+JSON 스냅샷처럼 파일 전체를 파싱해 작업 아이템마다 dict 를 만들지 않으므로 큰 프로젝트에서도 빠르고 메모리를 적게 씁니다.
+
+Usage:
+    python plane_columnar.py snapshot.json.gz -o snapshot.plcol
+    python plane_report.py --project "프로젝트명" --snapshot snapshot.plcol
+
+파일 구조: MAGIC(8) + 메타데이터 길이(8) + 메타데이터(JSON) + 8바이트 정렬된 컬럼 영역
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import uuid
+from array import array
+from collections import Counter
+from itertools import compress
+from operator import eq
+from typing import Iterable
+from plane_snapshot import Snapshot
+
+MAGIC = b"PLCOL\x00\x01\x00"
+COLUMNAR_SUFFIX = ".plcol"
+COLUMNAR_VERSION = 2
+# 상태 그룹 코드 (0: 상태 없음 / 알 수 없는 상태, triage 등 그 밖의 그룹은 프로젝트별로 뒤에 이어 붙임)
+GROUPS = ("", "backlog", "unstarted", "started", "completed", "cancelled")
+GROUP_CODE = {g: i for i, g in enumerate(GROUPS)}
+
+
+def _group_table(codes: dict[str, int], groups: Iterable[str]) -> bytes:
+    """그룹 코드 → 1/0 변환 테이블 (bytes.translate 용)"""
+    wanted = {codes[g] for g in groups if g in codes}
+    return bytes(1 if i in wanted else 0 for i in range(256))
+
+
+class _Dictionary:
+    """문자열 → 코드 사전 인코딩 (코드 0 은 None)"""
+
+    def __init__(self):
+        self.values: list[str] = []
+        self.codes: dict[str, int] = {}
+
+    def encode(self, value: str | None) -> int:
+        if value is None or value == "":
+            return 0
+        code = self.codes.get(value)
+        if code is None:
+            self.values.append(value)
+            code = self.codes[value] = len(self.values)
+        return code
+
+
+class _ColumnWriter:
+    """컬럼 데이터를 8바이트 정렬로 이어 붙이고 (offset, typecode, length) 를 기록"""
+
+    def __init__(self):
+        self.chunks: list[bytes] = []
+        self.size = 0
+
+    def add(self, typecode: str, values) -> list:
+        data = values.tobytes() if isinstance(values, array) else array(typecode, values).tobytes()
+        offset = self.size
+        self.chunks.append(data)
+        self.size += len(data)
+        pad = -self.size % 8
+        if pad:
+            self.chunks.append(b"\x00" * pad)
+            self.size += pad
+        length = len(data) // array(typecode).itemsize
+        return [offset, typecode, length]
+
+
+def _encode_project(p: dict, writer: _ColumnWriter) -> dict:
+    """스냅샷 프로젝트 하나를 컬럼으로 인코딩하고 메타데이터 반환"""
+    states = list(p["states"].values())
+    state_code = {s["id"]: i + 1 for i, s in enumerate(states)}
+    work_items = list(p["work_items"].values())
+    row_of = {wi["id"]: i for i, wi in enumerate(work_items)}
+    priorities, dates, stamps, people, labels = (_Dictionary() for _ in range(5))
+
+    ids = bytearray()
+    sequence = array("i")
+    state = array("H")
+    priority = array("B")
+    target_date = array("I")
+    updated_at = array("I")
+    desc_len = array("I")
+    parent = array("i")
+    assignee_offsets, assignee_rows, assignee_values = array("I", [0]), array("I"), array("H")
+    label_offsets, label_values = array("I", [0]), array("H")
+    name_offsets, names = array("Q", [0]), bytearray()
+    identifier_offsets, identifiers = array("Q", [0]), bytearray()
+
+    for i, wi in enumerate(work_items):
+        ids += uuid.UUID(wi["id"]).bytes
+        sequence.append(wi.get("sequence_id") or -1)
+        state.append(state_code.get(wi.get("state"), 0))
+        priority.append(priorities.encode(wi.get("priority")))
+        target_date.append(dates.encode(wi.get("target_date")))
+        updated_at.append(stamps.encode(wi.get("updated_at")))
+        desc_len.append(min(len(wi.get("description_html") or ""), 0xFFFFFFFF))
+        parent.append(row_of.get(wi.get("parent"), -1))
+        for aid in wi.get("assignees") or []:
+            assignee_rows.append(i)
+            assignee_values.append(people.encode(aid))
+        assignee_offsets.append(len(assignee_values))
+        for lid in wi.get("labels") or []:
+            label_values.append(labels.encode(lid))
+        label_offsets.append(len(label_values))
+        names += (wi.get("name") or "").encode("utf-8")
+        name_offsets.append(len(names))
+        identifiers += (wi.get("identifier") or "").encode("utf-8")
+        identifier_offsets.append(len(identifiers))
+    if len(priorities.values) > 0xFF or max(len(people.values), len(labels.values)) > 0xFFFF:
+        raise ValueError("사전 크기가 컬럼 폭을 넘습니다.")
+
+    modules = list(p["modules"].values())
+    module_offsets, module_rows, module_totals = array("I", [0]), array("I"), array("I")
+    for m in modules:
+        # 스냅샷에 없는 작업 아이템 링크도 모듈 전체 수에는 포함 (iter_report 와 같은 기준)
+        module_totals.append(len(p["module_links"].get(m["id"], [])))
+        module_rows.extend(row_of[wid] for wid in p["module_links"].get(m["id"], []) if wid in row_of)
+        module_offsets.append(len(module_rows))
+
+    columns = {
+        "id": writer.add("B", ids),
+        "sequence_id": writer.add("i", sequence),
+        "state": writer.add("H", state),
+        "priority": writer.add("B", priority),
+        "target_date": writer.add("I", target_date),
+        "updated_at": writer.add("I", updated_at),
+        "desc_len": writer.add("I", desc_len),
+        "parent": writer.add("i", parent),
+        "assignee_offsets": writer.add("I", assignee_offsets),
+        "assignee_rows": writer.add("I", assignee_rows),
+        "assignee_values": writer.add("H", assignee_values),
+        "label_offsets": writer.add("I", label_offsets),
+        "label_values": writer.add("H", label_values),
+        "name_offsets": writer.add("Q", name_offsets),
+        "name_data": writer.add("B", names),
+        "identifier_offsets": writer.add("Q", identifier_offsets),
+        "identifier_data": writer.add("B", identifiers),
+        "module_offsets": writer.add("I", module_offsets),
+        "module_rows": writer.add("I", module_rows),
+        "module_totals": writer.add("I", module_totals),
+    }
+    return {
+        "project": p["project"],
+        "states": states,
+        "labels": list(p["labels"].values()),
+        "cycles": list(p["cycles"].values()),
+        "modules": modules,
+        "rows": len(work_items),
+        "dictionaries": {
+            "priority": priorities.values, "target_date": dates.values, "updated_at": stamps.values,
+            "assignees": people.values, "labels": labels.values,
+        },
+        "columns": columns,
+    }
+
+
+def write_columnar(snapshot: Snapshot, path: str) -> None:
+    """Snapshot 을 컬럼 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+    writer = _ColumnWriter()
+    meta = {
+        "version": COLUMNAR_VERSION,
+        "byteorder": sys.byteorder,
+        "taken_at": snapshot.taken_at,
+        "members": snapshot.members,
+        "projects": {pid: _encode_project(p, writer) for pid, p in snapshot.projects.items()},
+    }
+    header = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+    header += b" " * (-(len(MAGIC) + 8 + len(header)) % 8)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        for chunk in writer.chunks:
+            f.write(chunk)
+    os.replace(tmp_path, path)
+
+
+class _ProjectColumns:
+    """한 프로젝트의 메모리 매핑 컬럼 (memoryview) 과 사전"""
+
+    def __init__(self, meta: dict, buffer: memoryview):
+        self.meta = meta
+        self.project: dict = meta["project"]
+        self.rows: int = meta["rows"]
+        self.dictionaries: dict[str, list[str]] = meta["dictionaries"]
+        for name, (offset, typecode, length) in meta["columns"].items():
+            size = array(typecode).itemsize
+            setattr(self, name, buffer[offset:offset + size * length].cast(typecode))
+        # 기본 그룹 뒤에 이 프로젝트에만 있는 상태 그룹 (triage 등) 을 이어 붙여 구분
+        self.group_names: list[str] = list(GROUPS)
+        for s in meta["states"]:
+            if s.get("group") and s["group"] not in self.group_names:
+                self.group_names.append(s["group"])
+        self.group_code = {g: i for i, g in enumerate(self.group_names)}
+        self._groups: bytes | None = None
+        self._row_of: dict[str, int] | None = None
+
+    @property
+    def groups(self) -> bytes:
+        """행별 상태 그룹 코드 (행 수 길이의 bytes)"""
+        if self._groups is None:
+            table = bytes([0] + [self.group_code.get(s.get("group") or "", 0) for s in self.meta["states"]])
+            self._groups = bytes(map(table.__getitem__, self.state))
+        return self._groups
+
+    def mask(self, *groups: str) -> bytes:
+        """그룹이 groups 중 하나인 행은 1, 아니면 0"""
+        return self.groups.translate(_group_table(self.group_code, groups))
+
+    def mask_except(self, *groups: str) -> bytes:
+        """그룹이 groups 에 없는 행은 1, 아니면 0 (상태 없음 포함)"""
+        return self.mask(*(g for g in self.group_names if g not in groups))
+
+    def work_item_id(self, row: int) -> str:
+        return str(uuid.UUID(bytes=bytes(self.id[row * 16:row * 16 + 16])))
+
+    def name(self, row: int) -> str:
+        return bytes(self.name_data[self.name_offsets[row]:self.name_offsets[row + 1]]).decode("utf-8")
+
+    def identifier(self, row: int) -> str:
+        return bytes(self.identifier_data[self.identifier_offsets[row]:self.identifier_offsets[row + 1]]).decode("utf-8")
+
+    def display_id(self, row: int):
+        """identifier → sequence_id → N/A 순 (row 경로와 같은 표시 ID)"""
+        return self.identifier(row) or (self.sequence_id[row] if self.sequence_id[row] >= 0 else "N/A")
+
+    def decode(self, column: str, row: int) -> str | None:
+        code = getattr(self, column)[row]
+        return self.dictionaries[column][code - 1] if code else None
+
+    def row_of(self, work_item_id: str) -> int:
+        if self._row_of is None:
+            self._row_of = {self.work_item_id(i): i for i in range(self.rows)}
+        return self._row_of[work_item_id]
+
+    def record(self, row: int) -> dict:
+        """행 하나를 작업 아이템 dict 로 복원 (저장한 필드만, 설명 본문은 없음)"""
+        states = self.meta["states"]
+        people = self.dictionaries["assignees"]
+        labels = self.dictionaries["labels"]
+        a0, a1 = self.assignee_offsets[row], self.assignee_offsets[row + 1]
+        l0, l1 = self.label_offsets[row], self.label_offsets[row + 1]
+        parent = self.parent[row]
+        return {
+            "id": self.work_item_id(row),
+            "sequence_id": self.sequence_id[row] if self.sequence_id[row] >= 0 else None,
+            "identifier": self.identifier(row) or None,
+            "name": self.name(row),
+            "state": states[self.state[row] - 1]["id"] if self.state[row] else None,
+            "priority": self.decode("priority", row),
+            "target_date": self.decode("target_date", row),
+            "updated_at": self.decode("updated_at", row),
+            "parent": self.work_item_id(parent) if parent >= 0 else None,
+            "assignees": [people[c - 1] for c in self.assignee_values[a0:a1]],
+            "labels": [labels[c - 1] for c in self.label_values[l0:l1]],
+        }
+
+    def module_slice(self, index: int) -> memoryview:
+        return self.module_rows[self.module_offsets[index]:self.module_offsets[index + 1]]
+
+
+class ColumnarSnapshot:
+    """컬럼 파일을 mmap 으로 열어 Snapshot 과 같은 조회 인터페이스와 컬럼 기반 집계를 제공
+
+    조회 메서드가 반환하는 작업 아이템은 필요할 때 행 단위로 복원하며 description_html 은 포함하지 않습니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"컬럼 스냅샷 파일이 아닙니다: {path}")
+        (meta_len,) = struct.unpack_from("<Q", self._mmap, len(MAGIC))
+        start = len(MAGIC) + 8
+        meta = json.loads(self._mmap[start:start + meta_len].decode("utf-8"))
+        if meta.get("version") != COLUMNAR_VERSION:
+            self.close()
+            raise ValueError(f"지원하지 않는 컬럼 스냅샷 버전입니다: {meta.get('version')}")
+        if meta.get("byteorder") != sys.byteorder:
+            self.close()
+            raise ValueError("다른 byte order 에서 만든 컬럼 스냅샷입니다. 다시 변환해 주세요.")
+        self.taken_at: str | None = meta.get("taken_at")
+        self.members: list[dict] = meta.get("members", [])
+        buffer = memoryview(self._mmap)[start + meta_len:]
+        self.projects: dict[str, _ProjectColumns] = {
+            pid: _ProjectColumns(p, buffer) for pid, p in meta["projects"].items()
+        }
+
+    def close(self) -> None:
+        self.projects = {}
+        try:
+            self._mmap.close()
+        except BufferError:
+            # 호출자가 아직 컬럼 memoryview 를 잡고 있으면 GC 에 맡김
+            pass
+        self._file.close()
+
+    def __enter__(self) -> "ColumnarSnapshot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _project(self, project_id: str) -> _ProjectColumns:
+        try:
+            return self.projects[project_id]
+        except KeyError:
+            raise KeyError(f"스냅샷에 프로젝트 '{project_id}' 가 없습니다.") from None
+
+    # -- Snapshot 호환 조회 메서드 --
+    def list_projects(self) -> list[dict]:
+        return [p.project for p in self.projects.values()]
+
+    def find_project_by_name(self, name: str) -> dict | None:
+        for p in self.list_projects():
+            if p.get("name") == name or p.get("identifier") == name or p.get("id") == name:
+                return p
+        return None
+
+    def list_modules(self, project_id: str) -> list[dict]:
+        return self._project(project_id).meta["modules"]
+
+    def get_module(self, project_id: str, module_id: str) -> dict:
+        return next(m for m in self.list_modules(project_id) if m["id"] == module_id)
+
+    def find_module_by_name(self, project_id: str, name: str) -> dict | None:
+        return next((m for m in self.list_modules(project_id) if m.get("name") == name), None)
+
+    def list_module_work_items(self, project_id: str, module_id: str) -> list[dict]:
+        p = self._project(project_id)
+        index = next(i for i, m in enumerate(p.meta["modules"]) if m["id"] == module_id)
+        return [p.record(row) for row in p.module_slice(index)]
+
+    def iter_work_items(self, project_id: str, order_by: str | None = None):
+        p = self._project(project_id)
+        rows: Iterable[int] = range(p.rows)
+        if order_by:
+            key = order_by.lstrip("-")
+            if key not in ("updated_at", "target_date"):
+                raise ValueError(f"컬럼 스냅샷에서 지원하지 않는 정렬입니다: {order_by}")
+            # 사전 코드 → 문자열 비교 키 (행마다 문자열을 만들지 않음)
+            values = [""] + p.dictionaries[key]
+            column = getattr(p, key)
+            rows = sorted(rows, key=lambda r: values[column[r]], reverse=order_by.startswith("-"))
+        return (p.record(row) for row in rows)
+
+    def list_work_items(self, project_id: str) -> list[dict]:
+        return list(self.iter_work_items(project_id))
+
+    def get_work_item(self, project_id: str, work_item_id: str) -> dict:
+        p = self._project(project_id)
+        return p.record(p.row_of(work_item_id))
+
+    def list_states(self, project_id: str) -> list[dict]:
+        return self._project(project_id).meta["states"]
+
+    def list_labels(self, project_id: str) -> list[dict]:
+        return self._project(project_id).meta["labels"]
+
+    def list_cycles(self, project_id: str) -> list[dict]:
+        return self._project(project_id).meta["cycles"]
+
+    def list_members(self) -> list[dict]:
+        return self.members
+
+    # -- 컬럼 기반 집계 (report / health / bulk 가 있으면 사용) --
+    def report_records(self, project: dict, member_map: dict[str, str]):
+        """plane_report.iter_report 와 같은 레코드 (overall → module → assignee)"""
+        p = self._project(project["id"])
+        counts = Counter(p.groups)
+        group_stats = {g: counts.get(GROUP_CODE[g], 0) for g in GROUPS[1:]}
+        # 상태를 알 수 없는 작업 아이템은 unstarted 로 집계
+        group_stats["unstarted"] += counts.get(0, 0)
+        # 그 밖의 그룹은 처음 나온 순서대로 따로 집계 (Counter 는 삽입 순서 유지)
+        for code, count in counts.items():
+            if code >= len(GROUPS):
+                group_stats[p.group_names[code]] = count
+        completed = group_stats["completed"]
+        total = p.rows
+        yield {"type": "overall", "project": project["name"], "name": project["name"], "done": completed,
+               "total": total, "progress": round(completed / total * 100 if total else 0, 1), **group_stats}
+
+        done_mask = p.mask("completed")
+        for index, m in enumerate(p.meta["modules"]):
+            m_done = sum(map(done_mask.__getitem__, p.module_slice(index)))
+            m_total = p.module_totals[index]
+            yield {"type": "module", "project": project["name"], "name": m["name"], "done": m_done,
+                   "total": m_total, "progress": round(m_done / m_total * 100 if m_total else 0, 1),
+                   "status": m.get("status", "N/A")}
+
+        open_mask = p.mask_except("completed", "cancelled")
+        people = p.dictionaries["assignees"]
+        assignee_stats: Counter = Counter()
+        # 담당자 항목별 소속 행의 open 여부로 걸러 사전 코드 단위로 계산
+        for code, count in Counter(compress(p.assignee_values, map(open_mask.__getitem__, p.assignee_rows))).items():
+            assignee_stats[member_map.get(people[code - 1], "Unknown")] += count
+        offsets = p.assignee_offsets
+        unassigned = sum(compress(map(eq, offsets[:-1], offsets[1:]), open_mask))
+        if unassigned:
+            assignee_stats["Unassigned"] += unassigned
+        for name, count in sorted(assignee_stats.items(), key=lambda x: x[1], reverse=True):
+            yield {"type": "assignee", "project": project["name"], "name": name, "open": count}
+
+    def health_findings(self, project: dict, level: int, today, evaluate):
+        """plane_health.iter_findings 와 같은 finding 레코드 (evaluate: evaluate_work_item)"""
+        p = self._project(project["id"])
+        # 완료 / 취소 / 백로그는 점검 제외
+        candidates = p.mask_except("completed", "cancelled", "backlog")
+        if level == 0:
+            # 지연 여부만 보므로 마감일 사전에서 지난 날짜 코드만 골라 행을 거름
+            overdue = bytes([0] + [1 if d < today.isoformat() else 0 for d in p.dictionaries["target_date"]])
+            candidates = bytes(map(min, candidates, map(overdue.__getitem__, p.target_date)))
+        people = p.dictionaries["assignees"]
+        for row in compress(range(p.rows), candidates):
+            group = p.group_names[p.groups[row]] or None
+            # 설명은 길이 규칙(20자)만 판단하므로 길이만 저장되어 있음
+            wi = {
+                "target_date": p.decode("target_date", row),
+                "assignees": [people[c - 1] for c in p.assignee_values[p.assignee_offsets[row]:p.assignee_offsets[row + 1]]],
+                "description_html": " " * min(p.desc_len[row], 20),
+            }
+            reasons = evaluate(wi, group, level, today)
+            if reasons:
+                yield {"type": "finding", "project": project["name"], "id": p.display_id(row),
+                       "work_item_id": p.work_item_id(row), "name": p.name(row) or "Untitled",
+                       "group": group, "reasons": reasons}
+
+    def group_issues(self, project: dict, group_filter: str):
+        """plane_bulk.iter_group_issues 와 같은 레코드"""
+        p = self._project(project["id"])
+        states = p.meta["states"]
+        for row in compress(range(p.rows), p.mask(group_filter)):
+            yield {"type": "work_item", "project": project["name"], "id": p.display_id(row),
+                   "work_item_id": p.work_item_id(row), "name": p.name(row) or "Untitled",
+                   "group": group_filter, "state": states[p.state[row] - 1]["name"]}
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Plane 스냅샷을 mmap 컬럼 형식으로 변환")
+    parser.add_argument("snapshot", type=str, help="변환할 스냅샷 파일 (plane_snapshot.py 로 생성한 .json / .json.gz)")
+    parser.add_argument("--output", "-o", type=str, default=None, help="저장할 컬럼 파일 경로 (기본: 스냅샷 이름 + .plcol)")
+
+    args = parser.parse_args(argv)
+    output = args.output or args.snapshot.removesuffix(".gz").removesuffix(".json") + COLUMNAR_SUFFIX
+    try:
+        snapshot = Snapshot.load(args.snapshot)
+        write_columnar(snapshot, output)
+    except (OSError, ValueError) as e:
+        print(f"  ✗ 변환 실패: {e}")
+        sys.exit(1)
+    rows = sum(len(p["work_items"]) for p in snapshot.projects.values())
+    print(f"  ✓ 컬럼 스냅샷 저장됨: {output} (프로젝트 {len(snapshot.projects)}개, 작업 아이템 {rows}개, "
+          f"{os.path.getsize(output):,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
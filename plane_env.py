@@ -0,0 +1,21 @@
+import os
+
+# 한 프로세스 안에서 같은 .env 를 여러 번 읽지 않도록 처리한 경로를 기록
+_loaded_paths: set[str] = set()
+
+
+def load_env_manual(file_path=".env"):
+    path = os.path.abspath(file_path)
+    if path in _loaded_paths:
+        return
+    _loaded_paths.add(path)
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if "=" in line:
+                key, value = line.split("=", 1)
+                os.environ[key.strip()] = value.strip().strip('"').strip("'")
@@ -6,82 +6,311 @@ Plane Health Check Tool
 """
 
 import argparse
+import gzip
+import json
 import sys
 import os
-from datetime import datetime
-from plane_client import PlaneAPI, load_env_manual
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+from plane_env import load_env_manual
+from plane_output import FORMATS, write_records
+from plane_progress import MODES, Progress
 
-def check_health(api: PlaneAPI, project_name: str, level: int = 0):
-    print(f"\n{'='*60}")
-    print(f"  Plane Project Health Check: {project_name} (Level: {level})")
-    print(f"{'='*60}\n")
+if TYPE_CHECKING:
+    from plane_client import PlaneAPI
 
-    project = api.find_project_by_name(project_name)
-    if not project:
-        print(f"  ✗ 프로젝트 '{project_name}'를 찾을 수 없습니다.")
-        return
+# CSV 출력 컬럼
+HEALTH_FIELDS = ["type", "project", "status", "id", "work_item_id", "name", "group", "reasons"]
+
+STORE_VERSION = 1
+# 재평가에 필요한 작업 아이템 필드만 저장 (설명은 길이 규칙(20자)만 판단하므로 앞 20자만)
+STORED_FIELDS = ("updated_at", "state", "target_date", "assignees")
+
+
+def evaluate_work_item(wi: dict, group: str | None, level: int, today) -> list[str]:
+    """작업 아이템 하나에 대한 개선 권고 사유 목록 (없으면 빈 목록)"""
+    # 완료되거나 취소된 건, 그리고 백로그에 있는 건은 체크 제외
+    if group in ['completed', 'cancelled', 'backlog']:
+        return []
+
+    reasons = []
     
+    # 0. 일정 지연 (기본 레벨)
+    if wi.get('target_date'):
+        due_date = datetime.strptime(wi['target_date'], '%Y-%m-%d').date()
+        if due_date < today:
+            reasons.append(f"일정 지연 (Overdue: {wi['target_date']})")
+
+    # 1. 담당자 누락 (Level 1 이상)
+    if level >= 1:
+        if not wi.get('assignees'):
+            reasons.append("담당자 없음 (No Assignee)")
+        
+    # 2. 설명 부실 (Level 2 이상)
+    if level >= 2:
+        desc = wi.get('description_html', '')
+        if not desc or len(desc) < 20:
+            reasons.append("설명 부족 (Short/No Description)")
+        
+    # 3. 마감일 누락 (Level 3 이상)
+    if level >= 3:
+        if group == 'started' and not wi.get('target_date'):
+            reasons.append("마감일 누락 (No Target Date for Started)")
+
+    return reasons
+
+
+def iter_findings(api: "PlaneAPI", project: dict, level: int = 0, progress: Progress | None = None):
+    """작업 아이템을 페이지 단위로 검사하며 발견 즉시 finding 레코드를 반환"""
     pid = project['id']
-    work_items = api.list_work_items(pid)
     states = api.list_states(pid)
     state_group_map = {s['id']: s['group'] for s in states}
     
     today = datetime.now().date()
-    
-    issues_found = []
 
-    for wi in work_items:
-        sid = wi.get('state')
-        group = state_group_map.get(sid)
-        
-        # 완료되거나 취소된 건, 그리고 백로그에 있는 건은 체크 제외
-        if group in ['completed', 'cancelled', 'backlog']:
-            continue
+    if hasattr(api, "health_findings"):
+        # 컬럼 스냅샷은 점검 대상 행만 골라 평가
+        yield from api.health_findings(project, level, today, evaluate_work_item)
+        return
 
-        reasons = []
-        
-        # 0. 일정 지연 (기본 레벨)
-        if wi.get('target_date'):
-            due_date = datetime.strptime(wi['target_date'], '%Y-%m-%d').date()
-            if due_date < today:
-                reasons.append(f"일정 지연 (Overdue: {wi['target_date']})")
-
-        # 1. 담당자 누락 (Level 1 이상)
-        if level >= 1:
-            if not wi.get('assignees'):
-                reasons.append("담당자 없음 (No Assignee)")
-            
-        # 2. 설명 부실 (Level 2 이상)
-        if level >= 2:
-            desc = wi.get('description_html', '')
-            if not desc or len(desc) < 20:
-                reasons.append("설명 부족 (Short/No Description)")
-            
-        # 3. 마감일 누락 (Level 3 이상)
-        if level >= 3:
-            if group == 'started' and not wi.get('target_date'):
-                reasons.append("마감일 누락 (No Target Date for Started)")
-            
+    work_items = api.iter_work_items(pid)
+    if progress:
+        work_items = progress.track(work_items, "작업 아이템 점검")
+    for wi in work_items:
+        group = state_group_map.get(wi.get('state'))
+        reasons = evaluate_work_item(wi, group, level, today)
         if reasons:
-            issues_found.append({
+            yield {
+                'type': 'finding',
+                'project': project['name'],
                 'id': wi.get('identifier') or wi.get('sequence_id') or 'N/A',
+                'work_item_id': wi.get('id'),
                 'name': wi.get('name', 'Untitled'),
-                'reasons': reasons
-            })
+                'group': group,
+                'reasons': reasons,
+            }
 
-    if not issues_found:
-        print("  ✅ 현재 레벨에서 모든 티켓이 운영 규칙을 잘 준수하고 있습니다!")
-    else:
-        print(f"  ⚠ {len(issues_found)}개의 티켓에서 개선 권고 사항이 발견되었습니다.\n")
-        for item in issues_found:
+
+class FindingStore:
+    """프로젝트 + 레벨별 점검 결과 저장소 (작업 아이템 ID → 평가에 쓴 필드, updated_at, 사유)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.items: dict[str, dict] = {}
+        self.watermark = ""
+        self.last_full: str | None = None
+        self.evaluated_on: str | None = None
+        self.states_sig = ""
+        if os.path.exists(path):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == STORE_VERSION:
+                self.items = data["items"]
+                self.watermark = data.get("watermark", "")
+                self.last_full = data.get("last_full")
+                self.evaluated_on = data.get("evaluated_on")
+                self.states_sig = data.get("states_sig", "")
+
+    @classmethod
+    def for_project(cls, cache_dir: str, project_id: str, level: int) -> "FindingStore":
+        os.makedirs(cache_dir, exist_ok=True)
+        return cls(os.path.join(cache_dir, f"health_{project_id}_L{level}.json.gz"))
+
+    def save(self) -> None:
+        tmp_path = self.path + ".tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump({
+                "version": STORE_VERSION,
+                "items": self.items,
+                "watermark": self.watermark,
+                "last_full": self.last_full,
+                "evaluated_on": self.evaluated_on,
+                "states_sig": self.states_sig,
+            }, f)
+        os.replace(tmp_path, self.path)
+
+
+def _compact(wi: dict) -> dict:
+    entry = {k: wi.get(k) for k in STORED_FIELDS}
+    entry["description_html"] = (wi.get("description_html") or "")[:20]
+    entry["identifier"] = wi.get("identifier") or wi.get("sequence_id") or "N/A"
+    entry["name"] = wi.get("name", "Untitled")
+    return entry
+
+
+def iter_incremental_findings(api: "PlaneAPI", project: dict, level: int, store: FindingStore,
+                              full: bool = False, stats: dict | None = None, progress: Progress | None = None):
+    """변경된 작업 아이템(및 날짜/상태 그룹 변화로 결과가 달라질 수 있는 항목)만 재평가하고
+    new / persisting / resolved 상태가 붙은 finding 레코드를 반환"""
+    pid = project["id"]
+    states = api.list_states(pid)
+    state_group_map = {s["id"]: s["group"] for s in states}
+    states_sig = json.dumps(sorted(state_group_map.items()))
+    today = datetime.now().date()
+    now = datetime.now().isoformat(timespec="seconds")
+    stats = stats if stats is not None else {}
+
+    old_items = store.items
+    new_items: dict[str, dict] = {} if full else {wid: dict(e) for wid, e in old_items.items()}
+    fetched: set[str] = set()
+
+    # 1. 변경된 작업 아이템 조회 (updated_at 내림차순으로 watermark 이전 항목을 만나면 중단)
+    incremental = not full and bool(store.watermark)
+    source = api.iter_work_items(pid, order_by="-updated_at") if incremental else api.iter_work_items(pid)
+    if progress:
+        source = progress.track(source, "변경 조회" if incremental else "작업 아이템 점검")
+    prev_ts = None
+    watermark = store.watermark if incremental else ""
+    for wi in source:
+        ts = wi.get("updated_at") or ""
+        if incremental:
+            if prev_ts is not None and ts > prev_ts:
+                # 정렬이 적용되지 않은 응답 → 조기 종료 없이 끝까지 조회
+                incremental = False
+            elif ts < store.watermark:
+                break
+            prev_ts = ts
+        new_items[wi["id"]] = _compact(wi)
+        fetched.add(wi["id"])
+        watermark = max(watermark, ts)
+
+    # 2. 조회하지 않은 항목 중 재평가가 필요한 것: 상태 그룹 정의 변경 시 전체, 날짜가 바뀌었으면 마감일이 있는 항목
+    day_changed = store.evaluated_on != today.isoformat()
+    recheck = set()
+    if store.states_sig != states_sig:
+        recheck = set(new_items) - fetched
+    elif day_changed:
+        recheck = {wid for wid, e in new_items.items() if wid not in fetched and e.get("target_date")}
+
+    # 3. 평가 및 이전 결과와 비교
+    reevaluated = 0
+    for wid, entry in new_items.items():
+        if wid in fetched or wid in recheck:
+            group = state_group_map.get(entry.get("state"))
+            entry["reasons"] = evaluate_work_item(entry, group, level, today)
+            entry["group"] = group
+            reevaluated += 1
+
+    counts = {"new": 0, "persisting": 0, "resolved": 0}
+    for wid in list(new_items) + [w for w in old_items if w not in new_items]:
+        entry = new_items.get(wid)
+        before = (old_items.get(wid) or {}).get("reasons") or []
+        after = (entry or {}).get("reasons") or []
+        if after:
+            status = "persisting" if before else "new"
+        elif before:
+            status = "resolved"
+        else:
+            continue
+        counts[status] += 1
+        shown = entry or old_items[wid]
+        yield {
+            "type": "finding",
+            "project": project["name"],
+            "status": status,
+            "id": shown.get("identifier", "N/A"),
+            "work_item_id": wid,
+            "name": shown.get("name", "Untitled"),
+            "group": shown.get("group"),
+            "reasons": after or before,
+        }
+
+    store.items = new_items
+    store.watermark = watermark
+    store.evaluated_on = today.isoformat()
+    store.states_sig = states_sig
+    if full:
+        store.last_full = now
+    store.save()
+    stats.update(counts, fetched=len(fetched), reevaluated=reevaluated, total=len(new_items), full=full)
+
+
+def _needs_full(store: FindingStore, full_every_hours: float) -> bool:
+    if not store.last_full or not store.watermark:
+        return True
+    if full_every_hours <= 0:
+        return False
+    return datetime.now() - datetime.fromisoformat(store.last_full) >= timedelta(hours=full_every_hours)
+
+
+def check_health_incremental(api: "PlaneAPI", project_name: str, level: int = 0, fmt: str = "text",
+                             stream=None, cache_dir: str = ".plane_cache", full: bool = False,
+                             full_every_hours: float = 24, progress: Progress | None = None):
+    """저장된 점검 결과를 이용한 증분 점검. 삭제된 티켓 정리를 위해 full_every_hours 마다 전체 점검"""
+    project = api.find_project_by_name(project_name)
+    if not project:
+        print(f"  ✗ 프로젝트 '{project_name}'를 찾을 수 없습니다.", file=sys.stderr)
+        return
+    store = FindingStore.for_project(cache_dir, project["id"], level)
+    full = full or _needs_full(store, full_every_hours)
+    stats: dict = {}
+    records = iter_incremental_findings(api, project, level, store, full, stats, progress)
+
+    if fmt != "text":
+        write_records(fmt, HEALTH_FIELDS, records, stream)
+        return
+
+    print(f"\n{'='*60}")
+    print(f"  Plane Project Health Check: {project_name} (Level: {level}, {'전체' if full else '증분'})")
+    print(f"{'='*60}\n")
+
+    grouped: dict[str, list[dict]] = {"new": [], "resolved": [], "persisting": []}
+    for item in records:
+        grouped[item["status"]].append(item)
+
+    titles = {"new": "🆕 새로 발견", "resolved": "✅ 해결됨", "persisting": "⚠ 계속 남아 있음"}
+    for status in ("new", "resolved", "persisting"):
+        items = grouped[status]
+        if not items:
+            continue
+        print(f"  {titles[status]} ({len(items)})")
+        for item in items:
             print(f"  [{item['id']}] {item['name']}")
             for r in item['reasons']:
                 print(f"    - {r}")
-            print()
+        print()
+
+    print(f"  조회 {stats['fetched']}개 / 재평가 {stats['reevaluated']}개 / 전체 {stats['total']}개")
+    print(f"  새로 발견 {stats['new']}, 해결 {stats['resolved']}, 계속 {stats['persisting']}")
+    print(f"{'='*60}")
+
+
+def check_health(api: "PlaneAPI", project_name: str, level: int = 0, fmt: str = "text", stream=None,
+                 progress: Progress | None = None):
+    if fmt != "text":
+        project = api.find_project_by_name(project_name)
+        if not project:
+            print(f"  ✗ 프로젝트 '{project_name}'를 찾을 수 없습니다.", file=sys.stderr)
+            return
+        write_records(fmt, HEALTH_FIELDS, iter_findings(api, project, level, progress), stream)
+        return
+
+    print(f"\n{'='*60}")
+    print(f"  Plane Project Health Check: {project_name} (Level: {level})")
+    print(f"{'='*60}\n")
+
+    project = api.find_project_by_name(project_name)
+    if not project:
+        print(f"  ✗ 프로젝트 '{project_name}'를 찾을 수 없습니다.")
+        return
+
+    # 발견 즉시 출력하고 건수만 유지
+    found = 0
+    for item in iter_findings(api, project, level, progress):
+        found += 1
+        print(f"  [{item['id']}] {item['name']}")
+        for r in item['reasons']:
+            print(f"    - {r}")
+        print()
+
+    if not found:
+        print("  ✅ 현재 레벨에서 모든 티켓이 운영 규칙을 잘 준수하고 있습니다!")
+    else:
+        print(f"  ⚠ {found}개의 티켓에서 개선 권고 사항이 발견되었습니다.\n")
 
     print(f"{'='*60}")
 
-def main():
+def main(argv: list[str] | None = None):
     load_env_manual()
     parser = argparse.ArgumentParser(description="Plane Project Health Check Tool")
     parser.add_argument("--project", type=str, default=os.environ.get("PLANE_SOURCE_PROJECT"), help="체크할 프로젝트 이름")
@@ -93,15 +322,29 @@ def main():
     parser.add_argument("--base-url", type=str, default=os.environ.get("PLANE_BASE_URL"), help="Plane URL")
     parser.add_argument("--api-key", type=str, default=os.environ.get("PLANE_API_KEY"), help="API Key")
     parser.add_argument("--workspace", type=str, default=os.environ.get("PLANE_WORKSPACE_SLUG"), help="Workspace Slug")
+    parser.add_argument("--snapshot", type=str, default=None, help="API 대신 사용할 스냅샷 파일 (plane_snapshot.py 로 생성)")
+    parser.add_argument("--format", type=str, choices=FORMATS, default="text", help="출력 형식 (jsonl/csv/json 은 레코드 단위 스트리밍)")
+    parser.add_argument("--incremental", action="store_true", help="저장된 점검 결과를 이용해 변경된 티켓만 재평가")
+    parser.add_argument("--full", action="store_true", help="--incremental 에서 전체 점검 강제 (삭제된 티켓 정리)")
+    parser.add_argument("--full-every", type=float, default=24, help="--incremental 에서 자동 전체 점검 주기 (시간, 0이면 사용 안 함)")
+    parser.add_argument("--cache-dir", type=str, default=os.environ.get("PLANE_CACHE_DIR", ".plane_cache"), help="점검 결과 저장 디렉터리")
+    parser.add_argument("--progress", type=str, choices=MODES, default=os.environ.get("PLANE_PROGRESS", "auto"), help="진행 표시 (auto/live/log/off, stderr 로 출력)")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-    if not args.api_key or not args.project:
-        print("Error: API Key와 Project 이름이 필요합니다.")
+    if not (args.api_key or args.snapshot) or not args.project:
+        print("Error: API Key(또는 --snapshot)와 Project 이름이 필요합니다.")
         sys.exit(1)
 
-    api = PlaneAPI(args.base_url, args.api_key, args.workspace)
-    check_health(api, args.project, args.level)
+    from plane_snapshot import open_reader
+    api = open_reader(args.snapshot, args.base_url, args.api_key, args.workspace)
+    # 스냅샷은 API 요청이 없어 바로 끝나므로 진행 표시 생략
+    with Progress("off" if args.snapshot else args.progress, apis=[api]) as progress:
+        if args.incremental:
+            check_health_incremental(api, args.project, args.level, args.format, cache_dir=args.cache_dir,
+                                     full=args.full, full_every_hours=args.full_every, progress=progress)
+        else:
+            check_health(api, args.project, args.level, args.format, progress=progress)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Plane Migration Job Runner
+==========================
+여러 (소스, 대상, 모듈) 복제 작업을 job 파일 하나로 묶어 동시에 실행합니다.
+모든 job 이 하나의 요청 예산(token bucket)을 공유하고 priority 가 작은 job 의 요청이 먼저 나가며,
+프로젝트 / 멤버 / 상태 / 레이블 / 주기 / 추정치 조회 결과는 job 간에 공유됩니다.
+
+Usage:
+    python plane_jobs.py jobs.jsonl --jobs 4 --rate 1.5
+    python plane_jobs.py jobs.jsonl --dry-run
+
+job 파일은 한 줄에 하나의 JSON 객체를 담습니다 (# 으로 시작하는 줄은 무시).
+    {"source": "EMS/CTO", "target": "ETC", "module": "Sprint 1", "priority": 0}
+    {"source": "EMS/CTO", "target": "ETC", "module": ["Sprint 2", "Sprint 3"], "priority": 1}
+
+각 job 의 상세 출력은 logs/jobs/<실행 시각>/ 아래에 job 별 로그 파일로 기록됩니다.
+"""
+
+import argparse
+import contextvars
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from plane_env import load_env_manual
+
+
+class Job:
+    """복제 작업 하나 (source 프로젝트의 module 을 target 프로젝트로)"""
+
+    def __init__(self, index: int, source: str, target: str, module: str, priority: int = 0):
+        self.index = index
+        self.source = source
+        self.target = target
+        self.module = module
+        self.priority = priority
+        self.status = "pending"
+        self.api = None
+        self.summary: dict | None = None
+        self.error: str | None = None
+        self.last_line = ""
+        self.started_at = 0.0
+        self.finished_at = 0.0
+        self.log_path = ""
+
+    @property
+    def label(self) -> str:
+        return f"{self.source} → {self.target} / {self.module}"
+
+
+def load_jobs(path: str) -> list[Job]:
+    """job 파일(JSONL) 읽기. module 이 목록이면 모듈마다 job 하나로 펼침"""
+    jobs: list[Job] = []
+    seen: set[tuple[str, str, str]] = set()
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            entry = json.loads(line)
+            missing = [k for k in ("source", "target", "module") if not entry.get(k)]
+            if missing:
+                raise ValueError(f"{path}:{line_no}: 필수 항목 누락 ({', '.join(missing)})")
+            modules = entry["module"] if isinstance(entry["module"], list) else [entry["module"]]
+            for module in modules:
+                key = (entry["source"], entry["target"], module)
+                if key in seen:
+                    # 같은 대상 모듈에 동시에 쓰면 중복 생성될 수 있으므로 한 번만 실행
+                    print(f"  ⚠ 중복 job 무시: {key[0]} → {key[1]} / {key[2]} ({path}:{line_no})")
+                    continue
+                seen.add(key)
+                jobs.append(Job(len(jobs) + 1, entry["source"], entry["target"], module,
+                                int(entry.get("priority", 0))))
+    return jobs
+
+
+# 현재 스레드(와 inherit_context 로 만든 worker 스레드)가 출력을 보낼 (job, 로그 파일)
+_job_binding: contextvars.ContextVar = contextvars.ContextVar("plane_job_output", default=None)
+
+
+class JobOutput:
+    """스레드별로 stdout 을 job 로그 파일로 보내는 stream
+
+    job 을 실행하는 스레드의 출력은 해당 job 로그에 기록하고 마지막 줄을 진행 상황으로 보관하며,
+    그 외 스레드(진행 현황 출력)는 원래 stdout 으로 보냅니다.
+    바인딩은 contextvar 라서 migrate 의 첨부 / 조회 worker 스레드(plane_client.inherit_context)에도 이어집니다.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def bind(self, job: Job, log_file) -> None:
+        _job_binding.set((job, log_file))
+
+    def unbind(self) -> None:
+        _job_binding.set(None)
+
+    def write(self, text: str) -> int:
+        binding = _job_binding.get()
+        if binding is None:
+            return self.stream.write(text)
+        job, log_file = binding
+        log_file.write(text)
+        lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
+        if lines:
+            job.last_line = lines[-1]
+        return len(text)
+
+    def flush(self) -> None:
+        binding = _job_binding.get()
+        (binding[1] if binding else self.stream).flush()
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", text).strip("_")[:40] or "job"
+
+
+def run_job(job: Job, output: JobOutput, log_dir: str, base_url: str, api_key: str, workspace: str,
+            limiter, lookup_cache, key_pool, breaker, dry_run: bool, copy_attachments: bool, attachment_workers: int,
+            verify_attachments: bool, reconcile: bool, source_reader=None) -> Job:
+    from plane_client import PlaneAPI
+    from plane_migrate import migrate
+
+    job.log_path = os.path.join(log_dir, f"{job.index:03d}_{_slug(job.module)}.log")
+    job.api = PlaneAPI(base_url, api_key, workspace, limiter=limiter, priority=job.priority,
+                       lookup_cache=lookup_cache, key_pool=key_pool, breaker=breaker)
+    job.status = "running"
+    job.started_at = time.monotonic()
+    with open(job.log_path, "w", encoding="utf-8") as log_file:
+        output.bind(job, log_file)
+        try:
+            job.summary = migrate(
+                # source_reader(번들 등)가 있으면 소스는 그것에서 읽고 job.api 로는 대상에만 씀
+                api=source_reader or job.api,
+                target_api=job.api,
+                source_project_name=job.source,
+                target_project_name=job.target,
+                module_name_filter=job.module,
+                dry_run=dry_run,
+                copy_attachments=copy_attachments,
+                attachment_workers=attachment_workers,
+                verify_attachments=verify_attachments,
+                reconcile=reconcile,
+                write_delay=0,  # 요청 간격은 공유 RateLimiter 가 조절
+            )
+            job.status = "done"
+        except SystemExit:
+            # migrate 는 프로젝트/모듈을 찾지 못하면 sys.exit 으로 종료함
+            job.status = "failed"
+            job.error = job.last_line or "migrate 종료"
+        except Exception as e:
+            job.status = "failed"
+            job.error = f"{type(e).__name__}: {e}"
+            print(f"\n✗ {job.error}")
+        finally:
+            output.unbind()
+    job.finished_at = time.monotonic()
+    return job
+
+
+def print_progress(jobs: list[Job], total_requests: int, elapsed: float) -> None:
+    counts = {s: sum(1 for j in jobs if j.status == s) for s in ("pending", "running", "done", "failed")}
+    print(f"\n  [{elapsed:6.0f}s] 대기 {counts['pending']} | 실행 {counts['running']} | "
+          f"완료 {counts['done']} | 실패 {counts['failed']} | 요청 {total_requests}회")
+    for job in jobs:
+        if job.status == "running":
+            print(f"    ▶ #{job.index} {job.label} ({job.api.request_count} req) {job.last_line[:60]}")
+
+
+def run_jobs(jobs: list[Job], base_url: str, api_key: str, workspace: str, workers: int = 4,
+             rate: float = 1.0, burst: int = 5, log_dir: str = "logs/jobs", dry_run: bool = False,
+             copy_attachments: bool = True, attachment_workers: int = 2,
+             verify_attachments: bool = True, reconcile: bool = False,
+             status_interval: float = 10.0, source_reader=None) -> list[Job]:
+    """job 목록을 공유 요청 예산 아래에서 동시에 실행하고 진행 상황을 출력
+
+    source_reader: 소스 조회를 대신할 읽기 전용 객체 (예: plane_bundle.Bundle). 없으면 각 job 의 API 에서 읽음
+    """
+    from plane_client import CircuitBreaker, KeyPool, LookupCache, RateLimiter, host_limiter, parse_api_keys
+
+    # PLANE_SHARED_RATE 가 설정되어 있으면 다른 프로세스(cron 도구 등)와 같은 예산을 공유
+    shared = host_limiter(base_url, api_key, burst)
+    limiter = shared or RateLimiter(rate, burst)
+    lookup_cache = LookupCache()
+    # 여러 key 가 주어지면 모든 job 이 key 별 사용량과 429 cooldown 을 공유
+    keys = parse_api_keys(api_key)
+    key_pool = KeyPool(keys) if len(keys) > 1 else None
+    # 인스턴스 장애 시 모든 job 이 함께 빠르게 실패하도록 breaker 도 공유
+    breaker = CircuitBreaker()
+    run_dir = os.path.join(log_dir, time.strftime("%Y%m%d_%H%M%S"))
+    os.makedirs(run_dir, exist_ok=True)
+
+    output = JobOutput(sys.stdout)
+    original_stdout, sys.stdout = sys.stdout, output
+    started = time.monotonic()
+    try:
+        keys_info = f", API Key {len(key_pool.keys)}개" if key_pool else ""
+        rate_info = f"호스트 공유 초당 {limiter.rate}회 요청" if shared else f"초당 {rate}회 요청"
+        print(f"  {len(jobs)}개 job 실행 (동시 {workers}개, {rate_info}{keys_info}, 로그: {run_dir})")
+        # priority 가 작은 job 부터 시작 (실행 중에는 RateLimiter 가 요청 단위로 우선순위 적용)
+        ordered = sorted(jobs, key=lambda j: (j.priority, j.index))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = {
+                pool.submit(run_job, job, output, run_dir, base_url, api_key, workspace, limiter,
+                            lookup_cache, key_pool, breaker, dry_run, copy_attachments, attachment_workers,
+                            verify_attachments, reconcile, source_reader)
+                for job in ordered
+            }
+            while pending:
+                finished, pending = wait(pending, timeout=status_interval, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    job = future.result()
+                    elapsed = job.finished_at - job.started_at
+                    if job.status == "done":
+                        s = job.summary or {}
+                        print(f"  ✓ #{job.index} {job.label} ({elapsed:.0f}s) "
+                              f"생성 {s.get('created', 0)}, 갱신 {s.get('updated', 0)}, 변경 없음 {s.get('unchanged', 0)}")
+                    else:
+                        print(f"  ✗ #{job.index} {job.label}: {job.error} (로그: {job.log_path})")
+                if not finished:
+                    total_requests = sum(j.api.request_count for j in jobs if j.api)
+                    print_progress(jobs, total_requests, time.monotonic() - started)
+                    if key_pool:
+                        print("    key: " + ", ".join(
+                            f"{k['key']} {k['recent']}/min" + (f" (cooldown {k['cooldown']}s)" if k['cooldown'] else "")
+                            for k in key_pool.status()
+                        ))
+    finally:
+        sys.stdout = original_stdout
+    return jobs
+
+
+def main(argv: list[str] | None = None):
+    load_env_manual()
+    parser = argparse.ArgumentParser(description="Plane 모듈 복제 job 일괄 실행기")
+    parser.add_argument("job_file", type=str, help="job 목록 파일 (JSONL)")
+    parser.add_argument("--jobs", type=int, default=4, help="동시에 실행할 job 수")
+    parser.add_argument("--rate", type=float, default=float(os.environ.get("PLANE_RATE_LIMIT", "1.0")), help="전체 job 이 공유하는 초당 요청 수")
+    parser.add_argument("--burst", type=int, default=5, help="순간적으로 허용할 최대 요청 수")
+    parser.add_argument("--log-dir", type=str, default="logs/jobs", help="job 별 로그를 저장할 폴더")
+    parser.add_argument("--status-interval", type=float, default=10.0, help="진행 현황 출력 주기 (초)")
+    parser.add_argument("--dry-run", action="store_true", help="실제 생성 없이 조회만 수행")
+    parser.add_argument("--reconcile", action="store_true", help="소스 모듈에서 빠진 복제본을 대상 모듈에서 연결 해제")
+    parser.add_argument("--skip-attachments", action="store_true", help="첨부 파일을 복사하지 않음")
+    parser.add_argument("--attachment-workers", type=int, default=2, help="job 당 동시에 전송할 첨부 파일 수")
+    parser.add_argument("--no-verify-attachments", action="store_true", help="업로드 후 체크섬 검증(대상 파일 재다운로드) 생략")
+    parser.add_argument("--base-url", type=str, default=os.environ.get("PLANE_BASE_URL"), help="Plane URL")
+    parser.add_argument("--api-key", type=str, default=os.environ.get("PLANE_API_KEY"), help="API Key")
+    parser.add_argument("--workspace", type=str, default=os.environ.get("PLANE_WORKSPACE_SLUG"), help="Workspace Slug")
+
+    args = parser.parse_args(argv)
+
+    if not args.api_key:
+        print("Error: API Key가 필요합니다.")
+        sys.exit(1)
+
+    try:
+        jobs = load_jobs(args.job_file)
+    except (OSError, ValueError) as e:
+        print(f"Error: job 파일을 읽을 수 없습니다: {e}")
+        sys.exit(1)
+    if not jobs:
+        print("  ⚠ 실행할 job 이 없습니다.")
+        return
+
+    try:
+        run_jobs(jobs, args.base_url, args.api_key, args.workspace, workers=args.jobs, rate=args.rate,
+                 burst=args.burst, log_dir=args.log_dir, dry_run=args.dry_run,
+                 copy_attachments=not args.skip_attachments, attachment_workers=args.attachment_workers,
+                 verify_attachments=not args.no_verify_attachments, reconcile=args.reconcile,
+                 status_interval=args.status_interval)
+    except KeyboardInterrupt:
+        print("\n\n중단됨.")
+        sys.exit(1)
+
+    failed = [j for j in jobs if j.status != "done"]
+    print(f"\n  완료 {len(jobs) - len(failed)}개, 실패 {len(failed)}개")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Plane Load Test
+===============
+실제 PlaneAPI 호출(작업 아이템 목록 조회, 생성, 댓글 작성, 삭제)을 정해진 비율로 섞어 동시 실행 수를 단계별로
+늘려 가며 보내고, 단계마다 처리량 / 지연 시간 백분위수 / 오류율 / 429 비율을 기록합니다.
+마지막에 지연 시간이 크게 늘거나 오류가 생기기 직전 단계를 기준으로 다른 도구의 동시 실행 수와 초당 요청 수를 권장합니다.
+
+Usage:
+    python plane_loadtest.py --project "부하테스트" --concurrency 1,2,4,8,16 --duration 20
+    python plane_loadtest.py --project "부하테스트" --mix list=8,create=1,delete=1 --format jsonl
+    python plane_loadtest.py --mock --duration 3          # 로컬 mock 서버 대상 (CI 용)
+
+- 각 호출은 재시도 / hedge / rate limit 없이 요청 한 번으로 측정하므로, 1 호출 = 1 요청입니다.
+- 생성한 작업 아이템은 끝날 때 모두 삭제합니다. 실제 인스턴스에서는 테스트 전용 프로젝트를 사용하세요.
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING, Callable
+import requests
+from plane_env import load_env_manual
+from plane_output import FORMATS, open_writer
+
+if TYPE_CHECKING:
+    from plane_client import PlaneAPI
+
+OPERATIONS = ("list", "create", "comment", "delete")
+DEFAULT_MIX = "list=5,create=2,comment=2,delete=1"
+DEFAULT_CONCURRENCY = "1,2,4,8,16"
+LOADTEST_SOURCE = "plane-loadtest"
+STEP_FIELDS = ["type", "concurrency", "requests", "ok", "errors", "throttled", "seconds", "throughput",
+               "error_rate", "throttle_rate", "p50_ms", "p90_ms", "p95_ms", "p99_ms"] + \
+              [f"p95_{op}_ms" for op in OPERATIONS]
+RECOMMENDATION_FIELDS = ["limited_by", "rate", "burst"]
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    """'list=5,create=2' → {작업: 가중치}"""
+    mix: dict[str, float] = {}
+    for part in text.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(f"알 수 없는 작업입니다: {name} (가능: {', '.join(OPERATIONS)})")
+        mix[name] = float(weight or 1)
+    if not any(w > 0 for w in mix.values()):
+        raise ValueError("작업 비율의 합이 0 입니다.")
+    return mix
+
+
+def percentile(sorted_values: list[float], pct: float) -> float | None:
+    """정렬된 값의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return None
+    rank = math.ceil(pct / 100 * len(sorted_values))
+    return sorted_values[max(0, rank - 1)]
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+class ItemPool:
+    """부하 테스트가 만든 작업 아이템 ID (댓글 / 삭제 대상, 종료 시 정리)"""
+
+    def __init__(self):
+        self._ids: deque[str] = deque()
+        self._lock = threading.Lock()
+
+    def add(self, item_id: str) -> None:
+        with self._lock:
+            self._ids.append(item_id)
+
+    def take(self) -> str | None:
+        with self._lock:
+            return self._ids.popleft() if self._ids else None
+
+    def drain(self) -> list[str]:
+        with self._lock:
+            ids = list(self._ids)
+            self._ids.clear()
+            return ids
+
+
+class LoadRunner:
+    """동시 실행 수 단계마다 mix 비율대로 작업을 보내고 결과를 집계"""
+
+    def __init__(self, make_api: Callable[[], "PlaneAPI"], project_id: str, mix: dict[str, float]):
+        self.make_api = make_api
+        self.project_id = project_id
+        self.ops = [op for op in mix if mix[op] > 0]
+        self.weights = [mix[op] for op in self.ops]
+        self.pool = ItemPool()
+        self.run_id = time.strftime("%Y%m%d-%H%M%S")
+        self._seq = 0
+        self._seq_lock = threading.Lock()
+
+    def _create(self, api: "PlaneAPI") -> None:
+        with self._seq_lock:
+            self._seq += 1
+            seq = self._seq
+        item = api.create_work_item(self.project_id, {
+            "name": f"[loadtest] {self.run_id} #{seq}",
+            "external_source": LOADTEST_SOURCE,
+            "external_id": f"{self.run_id}-{seq}",
+        })
+        self.pool.add(item["id"])
+
+    def call(self, api: "PlaneAPI", op: str) -> str:
+        """작업 하나 실행 → 실제로 실행한 작업 이름 (댓글 / 삭제할 아이템이 없으면 생성으로 대신함)"""
+        if op == "list":
+            # 정렬 조회는 다음 페이지를 미리 받지 않으므로 첫 페이지 요청 한 번만 보냄
+            list(islice(api.iter_work_items(self.project_id, order_by="-updated_at"), 100))
+            return op
+        if op == "comment":
+            # 댓글을 쓰는 동안 다른 스레드가 같은 아이템을 삭제하지 않도록 꺼냈다가 돌려놓음
+            item_id = self.pool.take()
+            if item_id:
+                try:
+                    api.create_comment(self.project_id, item_id, {"comment_html": f"<p>loadtest {self.run_id}</p>"})
+                finally:
+                    self.pool.add(item_id)
+                return op
+        elif op == "delete":
+            item_id = self.pool.take()
+            if item_id:
+                try:
+                    api.delete_work_item(self.project_id, item_id)
+                except requests.RequestException:
+                    # 삭제에 실패한 아이템은 종료 시 다시 정리
+                    self.pool.add(item_id)
+                    raise
+                return op
+        self._create(api)
+        return "create"
+
+    def run_step(self, concurrency: int, duration: float) -> dict:
+        """concurrency 개 스레드가 duration 초 동안 작업을 반복 → 단계 통계"""
+        samples: list[tuple[str, float, str]] = []  # (작업, 지연 초, ok / error / throttled)
+        lock = threading.Lock()
+        deadline = time.monotonic() + duration
+
+        def worker():
+            api = self.make_api()
+            local: list[tuple[str, float, str]] = []
+            while time.monotonic() < deadline:
+                op = random.choices(self.ops, self.weights)[0]
+                started = time.perf_counter()
+                try:
+                    op = self.call(api, op)
+                    outcome = "ok"
+                except requests.HTTPError as e:
+                    throttled = e.response is not None and e.response.status_code == 429
+                    outcome = "throttled" if throttled else "error"
+                except requests.RequestException:
+                    outcome = "error"
+                local.append((op, time.perf_counter() - started, outcome))
+                if outcome == "throttled":
+                    # 429 를 받은 스레드는 잠시 쉬어 측정이 거절 응답으로만 채워지지 않도록 함
+                    time.sleep(0.1)
+            with lock:
+                samples.extend(local)
+
+        started = time.monotonic()
+        threads = [threading.Thread(target=worker, name=f"loadtest-{i}", daemon=True) for i in range(concurrency)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return summarize_step(concurrency, samples, time.monotonic() - started)
+
+    def cleanup(self, api: "PlaneAPI") -> tuple[int, int]:
+        """남은 테스트 아이템 삭제 → (삭제 수, 실패 수)"""
+        deleted = failed = 0
+        for item_id in self.pool.drain():
+            try:
+                api.delete_work_item(self.project_id, item_id)
+                deleted += 1
+            except requests.RequestException:
+                failed += 1
+        return deleted, failed
+
+
+def summarize_step(concurrency: int, samples: list[tuple[str, float, str]], seconds: float) -> dict:
+    ok = sorted(latency for _, latency, outcome in samples if outcome == "ok")
+    errors = sum(1 for _, _, outcome in samples if outcome == "error")
+    throttled = sum(1 for _, _, outcome in samples if outcome == "throttled")
+    total = len(samples)
+    record = {
+        "type": "step",
+        "concurrency": concurrency,
+        "requests": total,
+        "ok": len(ok),
+        "errors": errors,
+        "throttled": throttled,
+        "seconds": round(seconds, 2),
+        "throughput": round(len(ok) / seconds, 1) if seconds else 0.0,
+        "error_rate": round(errors / total, 4) if total else 0.0,
+        "throttle_rate": round(throttled / total, 4) if total else 0.0,
+    }
+    for pct in (50, 90, 95, 99):
+        record[f"p{pct}_ms"] = _ms(percentile(ok, pct))
+    for op in OPERATIONS:
+        op_latencies = sorted(latency for name, latency, outcome in samples if name == op and outcome == "ok")
+        record[f"p95_{op}_ms"] = _ms(percentile(op_latencies, 95))
+    return record
+
+
+def _step_limit(step: dict, baseline_p95: float | None, max_error_rate: float, latency_factor: float) -> str | None:
+    """단계가 기준을 넘으면 원인(errors / throttled / latency), 아니면 None"""
+    if not step["ok"]:
+        return "errors"
+    if step["throttle_rate"] > max_error_rate:
+        return "throttled"
+    if step["error_rate"] > max_error_rate:
+        return "errors"
+    if baseline_p95 and step["p95_ms"] > baseline_p95 * latency_factor:
+        return "latency"
+    return None
+
+
+def recommend(steps: list[dict], max_error_rate: float = 0.01, latency_factor: float = 2.0,
+              headroom: float = 0.8) -> dict | None:
+    """기준(오류율, 첫 단계 대비 p95 증가)을 지킨 단계 중 처리량이 가장 높은 단계로 권장 설정 계산
+
+    rate 는 그 단계 처리량의 headroom 배(초당 요청 수), burst 는 동시 실행 수입니다. 기준을 지킨 단계가 없으면 None.
+    """
+    baseline = steps[0]["p95_ms"] if steps else None
+    best = None
+    limited_by = "max_tested"
+    for step in steps:
+        reason = _step_limit(step, baseline, max_error_rate, latency_factor)
+        if reason:
+            if best is not None and limited_by == "max_tested":
+                limited_by = reason
+            continue
+        if best is None or step["throughput"] > best["throughput"]:
+            best = step
+            limited_by = "max_tested"
+    if best is None:
+        return None
+    return {
+        "type": "recommendation",
+        "concurrency": best["concurrency"],
+        "throughput": best["throughput"],
+        "p95_ms": best["p95_ms"],
+        "limited_by": limited_by,
+        "rate": round(best["throughput"] * headroom, 1),
+        "burst": best["concurrency"],
+    }
+
+
+def print_step(step: dict) -> None:
+    p95 = "-" if step["p95_ms"] is None else f"{step['p95_ms']:.0f}"
+    p99 = "-" if step["p99_ms"] is None else f"{step['p99_ms']:.0f}"
+    print(f"  {step['concurrency']:>6} {step['requests']:>8} {step['throughput']:>9.1f} "
+          f"{p95:>8} {p99:>8} {step['error_rate'] * 100:>7.1f}% {step['throttle_rate'] * 100:>7.1f}%")
+
+
+def print_recommendation(rec: dict | None) -> None:
+    print()
+    if rec is None:
+        print("  ✗ 기준을 만족한 단계가 없습니다. 동시 실행 1 에서도 오류 / 429 가 발생합니다.")
+        return
+    reasons = {"latency": "그 이상에서는 p95 지연 시간이 크게 늘어남", "errors": "그 이상에서는 오류 증가",
+               "throttled": "그 이상에서는 429 응답 발생", "max_tested": "테스트한 최대 동시 실행 수"}
+    print(f"  ✓ 권장: 동시 실행 {rec['concurrency']}, 초당 요청 {rec['rate']} "
+          f"(측정 처리량 {rec['throughput']}/s, {reasons[rec['limited_by']]})")
+    print(f"    PLANE_RATE_LIMIT={rec['rate']}        # migrate / jobs / bundle / transfer 의 --rate 기본값")
+    print(f"    PLANE_SHARED_RATE={rec['rate']}       # 같은 호스트의 여러 프로세스가 나눠 쓸 때")
+    print(f"    PLANE_SHARED_BURST={rec['burst']}")
+    print(f"    --jobs {rec['concurrency']} / --workers {rec['concurrency']}")
+
+
+def run_loadtest(make_api: Callable[[], "PlaneAPI"], project_id: str, mix: dict[str, float],
+                 levels: list[int], duration: float, fmt: str = "text", max_error_rate: float = 0.01,
+                 latency_factor: float = 2.0, headroom: float = 0.8, stop_error_rate: float = 0.2,
+                 cleanup_api: "PlaneAPI | None" = None) -> dict | None:
+    """단계별로 부하를 보내고 결과를 fmt 로 출력 → 권장 설정 (없으면 None)"""
+    runner = LoadRunner(make_api, project_id, mix)
+    writer = None if fmt == "text" else open_writer(fmt, STEP_FIELDS + RECOMMENDATION_FIELDS)
+    steps: list[dict] = []
+    if not writer:
+        print(f"  {'동시실행':>6} {'요청':>8} {'처리량/s':>9} {'p95 ms':>8} {'p99 ms':>8} {'오류':>8} {'429':>8}")
+    try:
+        for level in levels:
+            step = runner.run_step(level, duration)
+            steps.append(step)
+            if writer:
+                writer.write(step)
+            else:
+                print_step(step)
+            if step["error_rate"] + step["throttle_rate"] > stop_error_rate:
+                print(f"  ⚠ 오류 / 429 비율이 {stop_error_rate:.0%} 를 넘어 다음 단계는 건너뜁니다.", file=sys.stderr)
+                break
+    finally:
+        deleted, failed = runner.cleanup(cleanup_api or make_api())
+        note = f"  ✓ 테스트 아이템 {deleted}개 삭제" + (f", ✗ {failed}개 삭제 실패" if failed else "")
+        print(note, file=sys.stderr if writer else sys.stdout)
+
+    rec = recommend(steps, max_error_rate, latency_factor, headroom)
+    if writer:
+        if rec:
+            writer.write(rec)
+        writer.close()
+    else:
+        print_recommendation(rec)
+    return rec
+
+
+def main(argv: list[str] | None = None):
+    load_env_manual()
+    parser = argparse.ArgumentParser(description="Plane 인스턴스 부하 테스트 (동시 실행 수별 처리량 / 지연 / 오류 측정)")
+    parser.add_argument("--project", type=str, default=os.environ.get("PLANE_LOADTEST_PROJECT"), help="테스트 아이템을 만들 프로젝트 이름 (테스트 전용 권장)")
+    parser.add_argument("--mix", type=str, default=DEFAULT_MIX, help=f"작업 비율 (기본: {DEFAULT_MIX})")
+    parser.add_argument("--concurrency", type=str, default=DEFAULT_CONCURRENCY, help=f"단계별 동시 실행 수 (기본: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--duration", type=float, default=10.0, help="단계별 측정 시간 (초)")
+    parser.add_argument("--max-error-rate", type=float, default=0.01, help="권장 단계가 허용할 오류 / 429 비율")
+    parser.add_argument("--latency-factor", type=float, default=2.0, help="권장 단계의 p95 가 첫 단계 p95 의 몇 배까지 허용되는지")
+    parser.add_argument("--headroom", type=float, default=0.8, help="권장 초당 요청 수 = 측정 처리량 × headroom")
+    parser.add_argument("--stop-error-rate", type=float, default=0.2, help="오류 / 429 비율이 이 값을 넘으면 다음 단계를 건너뜀")
+    parser.add_argument("--format", type=str, choices=FORMATS, default="text", help="출력 형식 (jsonl/csv/json 은 단계별 레코드)")
+    parser.add_argument("--mock", action="store_true", help="로컬 mock 서버를 띄워 그 서버를 대상으로 실행 (CI 용)")
+    parser.add_argument("--mock-latency", type=float, default=0.02, help="mock 서버의 요청 처리 시간 (초)")
+    parser.add_argument("--mock-capacity", type=int, default=4, help="mock 서버가 동시에 처리하는 요청 수")
+    parser.add_argument("--mock-rate-limit", type=float, default=0.0, help="mock 서버의 초당 요청 수 제한 (0 이면 없음)")
+    parser.add_argument("--base-url", type=str, default=os.environ.get("PLANE_BASE_URL"), help="Plane URL")
+    parser.add_argument("--api-key", type=str, default=os.environ.get("PLANE_API_KEY"), help="API Key")
+    parser.add_argument("--workspace", type=str, default=os.environ.get("PLANE_WORKSPACE_SLUG"), help="Workspace Slug")
+
+    args = parser.parse_args(argv)
+    try:
+        mix = parse_mix(args.mix)
+        levels = sorted({int(x) for x in args.concurrency.split(",") if x.strip()})
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    if not levels or levels[0] < 1:
+        print("Error: --concurrency 는 1 이상의 정수 목록이어야 합니다.")
+        sys.exit(1)
+
+    server = None
+    if args.mock:
+        from plane_mock import ServerLimits, start_background
+
+        server, args.base_url = start_background(
+            200, ServerLimits(args.mock_latency, args.mock_capacity, args.mock_rate_limit))
+        args.api_key, args.workspace = "loadtest", "mock"
+        args.project = args.project or "Src"
+        print(f"  ✓ mock 서버 시작: {args.base_url} (처리 시간 {args.mock_latency}s, 동시 처리 {args.mock_capacity})",
+              file=sys.stderr)
+    if not args.api_key or not args.project:
+        print("Error: API Key와 --project 가 필요합니다.")
+        sys.exit(1)
+
+    from plane_client import CircuitBreaker, PlaneAPI
+
+    def make_api() -> PlaneAPI:
+        api = PlaneAPI(args.base_url, args.api_key, args.workspace, hedge=False, page_workers=1, retries=1,
+                       breaker=CircuitBreaker(failure_threshold=sys.maxsize))
+        # 서버 자체의 한계를 재야 하므로 PLANE_SHARED_RATE 공유 limiter 도 거치지 않음
+        api.limiter = None
+        return api
+
+    admin = PlaneAPI(args.base_url, args.api_key, args.workspace)
+    project = admin.find_project_by_name(args.project)
+    if not project:
+        print(f"Error: 프로젝트 '{args.project}'를 찾을 수 없습니다.")
+        sys.exit(1)
+
+    if args.format == "text":
+        print(f"  대상: {args.base_url} / {args.project}, 작업 비율 {args.mix}, 단계별 {args.duration:g}s")
+    try:
+        rec = run_loadtest(make_api, project["id"], mix, levels, args.duration, args.format, args.max_error_rate,
+                           args.latency_factor, args.headroom, args.stop_error_rate, cleanup_api=admin)
+    except KeyboardInterrupt:
+        print("\n\n중단됨.")
+        sys.exit(1)
+    finally:
+        if server:
+            server.shutdown()
+    if rec is None:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ Usage:
     python plane_migrate.py                  # 실제 복제 실행
     python plane_migrate.py --dry-run        # 조회만 하고 실제 생성 안 함
     python plane_migrate.py --module "모듈명" # 특정 모듈만 복제 (대화형 선택 건너뜀)
+    python plane_migrate.py --module "모듈명" --target A --target B  # 여러 대상 프로젝트에 동시에 복제
 """
 
 import os
@@ -15,10 +16,16 @@ import sys
 import argparse
 import time
 import requests
-from typing import Any
-from plane_client import PlaneAPI, load_env_manual
-
-load_env_manual()
+from collections import ChainMap, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterable
+from plane_client import PlaneAPI, inherit_context, load_env_manual
+from plane_attachments import copy_work_item_attachments
+from plane_profile import end_phase, phase, profiling
+from plane_progress import MODES, Progress
+from plane_rewrite import ReferenceRewriter
+from plane_snapshot import link_id
 
 
 # ──────────────────────────────────────────────────────────────
@@ -86,23 +93,25 @@ def build_cycle_mapping(source_cycles: list[dict], target_cycles: list[dict]) ->
     return build_name_mapping(source_cycles, target_cycles)
 
 
-def build_estimate_mapping(api: PlaneAPI, source_project_id: str, target_project_id: str) -> dict[str, str]:
-    """추정치(Estimate Point) 값 기반 매핑 (프로젝트별 추정 체계 반영)"""
+def build_estimate_mapping(api: PlaneAPI, source_project_id: str, target_project_id: str,
+                           target_api: PlaneAPI | None = None) -> dict[str, str]:
+    """추정치(Estimate Point) 값 기반 매핑 (프로젝트별 추정 체계 반영, 대상이 다른 인스턴스면 target_api 사용)"""
     mapping = {}
+    target_api = target_api or api
     try:
         # 1. 소스 프로젝트의 활성 추정 체계(Estimate System) 확인
-        src_project = api._get(f"projects/{source_project_id}/")
+        src_project = api.get_project(source_project_id)
         src_est_id = src_project.get("estimate")
         
         # 2. 대상 프로젝트의 활성 추정 체계 확인
-        tgt_project = api._get(f"projects/{target_project_id}/")
+        tgt_project = target_api.get_project(target_project_id)
         tgt_est_id = tgt_project.get("estimate")
 
         if not src_est_id or not tgt_est_id:
             # 프로젝트 설정에서 ID를 못 찾을 경우 list_estimates로 fallback
             print("  ⚠ 프로젝트 상세 정보에서 추정 체계 ID를 찾을 수 없습니다. 목록 조회를 시도합니다.")
             src_estimates = api.list_estimates(source_project_id)
-            tgt_estimates = api.list_estimates(target_project_id)
+            tgt_estimates = target_api.list_estimates(target_project_id)
             if src_estimates: src_est_id = src_estimates[0]["id"]
             if tgt_estimates: tgt_est_id = tgt_estimates[0]["id"]
 
@@ -115,7 +124,7 @@ def build_estimate_mapping(api: PlaneAPI, source_project_id: str, target_project
         src_points_by_value = {str(p["value"]): p["id"] for p in src_points}
 
         # 4. 대상 포인트 값 수집
-        tgt_points = api.list_estimate_points(target_project_id, tgt_est_id)
+        tgt_points = target_api.list_estimate_points(target_project_id, tgt_est_id)
         tgt_points_by_value = {str(p["value"]): p["id"] for p in tgt_points}
 
         # 5. 값 매칭을 통한 ID 매핑 생성
@@ -151,43 +160,129 @@ def collect_sub_issues(api: PlaneAPI, project_id: str,
     return sub_issues
 
 
-def collect_all_descendants_via_api(api: PlaneAPI, project_id: str,
-                                   root_ids: set[str]) -> list[dict]:
-    """root_ids 부터 각 이슈의 자식들을 API로 직접 검색하여 수집"""
+def collect_all_descendants(tree: dict[str | None, list[dict]], root_ids: set[str]) -> list[dict]:
+    """root_ids 아래의 모든 하위 이슈를 build_work_item_tree 결과에서 수집 (부모 → 자식 순)"""
     result = []
-    queue = list(root_ids)
     seen = set(root_ids)
-    
-    print(f"    - 하위 이슈 탐색 중...")
-    
-    # 이 방식은 이슈가 많으면 느려질 수 있으므로, 
-    # 우선 전체 목록 조회를 시도하되 실패하면 개별 조회하는 하이브리드 방식 권장
-    # 여기서는 가장 확실한 '부모 ID로 필터링' 조회를 사용
-    
-    current_parents = list(root_ids)
-    while current_parents:
-        next_parents = []
-        # 부모 ID별로 하위 이슈 조회 (Plane API는 parent 필터 지원 여부가 버전마다 다름)
-        # 만약 필터가 안 되면 전체 목록에서 찾는 수밖에 없음.
-        # 일단 가장 안전하게 전체 목록을 한 번 더 가져오되 페이지네이션을 끝까지 확인.
-        all_items = api.list_work_items(project_id)
-        
-        for wi in all_items:
-            wi_id = wi["id"]
-            if wi_id in seen:
+    queue = deque(root_ids)
+    while queue:
+        for child in tree.get(queue.popleft(), []):
+            if child["id"] in seen:
                 continue
-            if wi.get("parent") in current_parents:
-                result.append(wi)
-                seen.add(wi_id)
-                next_parents.append(wi_id)
-        
-        current_parents = next_parents
-        if next_parents:
-            print(f"      • 추가 하위 이슈 {len(next_parents)}개 발견...")
-
+            seen.add(child["id"])
+            result.append(child)
+            queue.append(child["id"])
     return result
 
 
+def hydrate_work_items(api: PlaneAPI, project_id: str, rows: list[dict], known: dict[str, dict],
+                       workers: int = 8) -> dict[str, dict]:
+    """모듈 응답 행 → {ID: 작업 아이템} (응답 순서 유지)
+
+    이름이 없는 연결 행은 이미 조회한 프로젝트 목록(known)에서 먼저 찾고,
+    목록에 없는 아이템(보관됨 등)만 workers 개씩 동시에 개별 조회합니다.
+    """
+    items: dict[str, dict | None] = {}
+    missing: list[str] = []
+    for row in rows:
+        # 전체 정보가 담긴 행은 id 가 작업 아이템 ID, 연결 행은 issue / work_item 필드
+        wi_id = row.get("id") if "name" in row else link_id(row)
+        if not wi_id or wi_id in items:
+            continue
+        if "name" in row:
+            items[wi_id] = row
+        elif wi_id in known:
+            items[wi_id] = known[wi_id]
+        else:
+            items[wi_id] = None
+            missing.append(wi_id)
+
+    if missing:
+        print(f"    - 목록에 없는 이슈 {len(missing)}개 상세 조회 중...")
+        if workers > 1 and len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(missing)), **inherit_context()) as pool:
+                fetched = list(pool.map(lambda wi_id: api.get_work_item(project_id, wi_id), missing))
+        else:
+            fetched = [api.get_work_item(project_id, wi_id) for wi_id in missing]
+        for wi_id, wi in zip(missing, fetched):
+            items[wi_id] = wi
+    return items
+
+
+def build_member_names(members: list[dict]) -> dict[str, str]:
+    """사용자 ID → 표시 이름 (이름이 없으면 이메일)"""
+    names: dict[str, str] = {}
+    for m in members:
+        u = m.get("member", m)  # 구조 자동 감지
+        if u.get("id"):
+            names[u["id"]] = f"{u.get('first_name', '')} {u.get('last_name', '')}".strip() or u.get("email", "Unknown")
+    return names
+
+
+def build_work_item_payload(wi: dict, state_mapping: dict[str, str], label_mapping: dict[str, str],
+                            user_mapping: dict[str, str],
+                            estimate_mapping: dict[str, str], default_state_id: str | None,
+                            member_names: dict[str, str]) -> dict:
+    """소스 Work Item → 대상 프로젝트 생성/갱신 데이터 (parent, external_* 제외)"""
+    new_wi_data: dict[str, Any] = {
+        "name": wi.get("name", "Untitled"),
+    }
+
+    # 설명
+    if wi.get("description_html"):
+        new_wi_data["description_html"] = wi["description_html"]
+
+    # 우선순위
+    if wi.get("priority"):
+        new_wi_data["priority"] = wi["priority"]
+
+    # 날짜
+    if wi.get("start_date"):
+        new_wi_data["start_date"] = wi["start_date"]
+    if wi.get("target_date"):
+        new_wi_data["target_date"] = wi["target_date"]
+
+    # 추정치
+    if wi.get("estimate_point") and wi["estimate_point"] in estimate_mapping:
+        new_wi_data["estimate_point"] = estimate_mapping[wi["estimate_point"]]
+
+    # State 매핑
+    if wi.get("state") and wi["state"] in state_mapping:
+        new_wi_data["state"] = state_mapping[wi["state"]]
+    elif default_state_id:
+        new_wi_data["state"] = default_state_id
+
+    # Label 매핑
+    mapped_labels = [label_mapping[lbl_id] for lbl_id in wi.get("labels") or [] if lbl_id in label_mapping]
+    if mapped_labels:
+        new_wi_data["labels"] = mapped_labels
+
+    # 담당자(Assignees) 매핑
+    mapped_assignees = [user_mapping[user_id] for user_id in wi.get("assignees") or [] if user_id in user_mapping]
+    if mapped_assignees:
+        new_wi_data["assignees"] = mapped_assignees
+
+    # 주기(Cycle) 소속은 별도 리소스(cycle-issues)이므로 payload 에 넣지 않고 모듈 복제 후 주기별로 연결
+
+    # 작성자(Created By) 정보 보존 (API로 설정 불가능하므로 설명에 추가)
+    original_creator_name = member_names.get(wi.get("created_by"), "Unknown")
+    creator_note = f"<p><i>Originally created by: {original_creator_name}</i></p>"
+    new_wi_data["description_html"] = creator_note + new_wi_data.get("description_html", "")
+
+    return new_wi_data
+
+
+def resolve_parent(wi: dict, old_to_new_id: dict[str, str], tgt_item_index: dict[str, dict]) -> str | None:
+    """대상 부모 ID: 이번 실행에서 복제된 부모, 없으면 이전 실행의 복제본"""
+    parent = wi.get("parent")
+    if not parent:
+        return None
+    if parent in old_to_new_id:
+        return old_to_new_id[parent]
+    existing = tgt_item_index.get(parent)
+    return existing["id"] if existing else None
+
+
 def topological_sort(work_items: list[dict]) -> list[dict]:
     """부모가 먼저 나오도록 위상 정렬 (부모 없는 것 → 부모 있는 것 순서)"""
     by_id = {wi["id"]: wi for wi in work_items}
@@ -210,9 +305,137 @@ def topological_sort(work_items: list[dict]) -> list[dict]:
 
     return sorted_items
 
+def external_source_for(project_id: str) -> str:
+    """복제본에 기록할 external_source 값 (소스 프로젝트 기준)"""
+    return f"plane:{project_id}"
+
+
+def build_external_id_index(items: list[dict], external_source: str) -> dict[str, dict]:
+    """같은 소스에서 복제된 대상 항목을 external_id(소스 항목 ID) 로 색인"""
+    index: dict[str, dict] = {}
+    for item in items:
+        if item.get("external_source") == external_source and item.get("external_id"):
+            index[item["external_id"]] = item
+    return index
+
+
+def diff_fields(payload: dict, existing: dict) -> dict:
+    """payload 중 기존 대상 항목과 값이 다른 필드만 반환 (목록 필드는 순서 무시)"""
+    changes: dict[str, Any] = {}
+    for key, value in payload.items():
+        current = existing.get(key)
+        if isinstance(value, list):
+            if set(value) != set(current or []):
+                changes[key] = value
+        elif value != current:
+            changes[key] = value
+    return changes
+
+
+def _conflict_id(e: requests.HTTPError) -> str | None:
+    """external_id 중복(409) 응답에서 기존 항목 ID 추출"""
+    if e.response is None or e.response.status_code != 409:
+        return None
+    try:
+        return e.response.json().get("id")
+    except ValueError:
+        return None
+
+
+def upsert_work_item(api: PlaneAPI, project_id: str, payload: dict,
+                     existing: dict | None = None) -> tuple[str, dict, dict]:
+    """기존 복제본이 있으면 바뀐 필드만 갱신, 없으면 생성 → (action, 대상 작업 아이템, changes)
+
+    action 은 created / updated / unchanged 중 하나입니다.
+    """
+    if existing is None:
+        try:
+            created = api.create_work_item(project_id, payload)
+            return "created", created, payload
+        except requests.HTTPError as e:
+            # 색인 이후 같은 external_id 로 생성된 경우 Plane 은 409 와 기존 ID 를 반환
+            conflict_id = _conflict_id(e)
+            if not conflict_id:
+                raise
+            existing = api.get_work_item(project_id, conflict_id)
+
+    changes = diff_fields(payload, existing)
+    if not changes:
+        return "unchanged", existing, changes
+    api.update_work_item(project_id, existing["id"], changes)
+    return "updated", existing, changes
+
+
+def link_prefixes(src_api: PlaneAPI, tgt_api: PlaneAPI) -> dict[str, str]:
+    """다른 인스턴스 / workspace 로 복제할 때 바꿀 링크 경로 (같은 곳이면 빈 dict)"""
+    prefixes: dict[str, str] = {}
+    src_root = f"{src_api.base_url}/{src_api.workspace_slug}/"
+    tgt_root = f"{tgt_api.base_url}/{tgt_api.workspace_slug}/"
+    if src_root != tgt_root:
+        prefixes[src_root] = tgt_root
+    if src_api.workspace_slug != tgt_api.workspace_slug:
+        # 같은 인스턴스 안의 상대 경로 링크
+        prefixes[f"/{src_api.workspace_slug}/projects/"] = f"/{tgt_api.workspace_slug}/projects/"
+    return prefixes
+
+
+def prefetch_source_details(api: PlaneAPI, project_id: str, items: Iterable[dict],
+                            needs_details: Callable[[dict], bool], depth: int = 8):
+    """(작업 아이템, 댓글, 활동, 조회 오류) 를 items 순서대로 반환하며 뒤따르는 depth 개 아이템의 댓글 / 활동을 미리 조회
+
+    소스 읽기와 대상 쓰기가 번갈아 일어나지 않고 겹치도록 하는 bounded pipeline 입니다.
+    needs_details 가 False 인 아이템(이미 복제된 항목)은 조회하지 않습니다.
+    """
+    def fetch(wi: dict) -> tuple:
+        if not needs_details(wi):
+            return wi, [], [], None
+        try:
+            return wi, api.list_comments(project_id, wi["id"]), api.list_activities(project_id, wi["id"]), None
+        except requests.HTTPError as e:
+            # 조회 실패는 해당 아이템을 처리할 때 기존과 같은 위치에서 보고
+            return wi, [], [], e
+
+    if depth <= 0:
+        for wi in items:
+            yield fetch(wi)
+        return
+
+    pending: deque = deque()
+    remaining = iter(items)
+    with ThreadPoolExecutor(max_workers=depth, **inherit_context()) as pool:
+        try:
+            for wi in islice(remaining, depth):
+                pending.append(pool.submit(fetch, wi))
+            while pending:
+                future = pending.popleft()
+                wi = next(remaining, None)
+                if wi is not None:
+                    pending.append(pool.submit(fetch, wi))
+                yield future.result()
+        finally:
+            # 호출자가 중간에 멈춘 경우 아직 시작하지 않은 조회는 보내지 않음
+            for future in pending:
+                future.cancel()
+
+
 def migrate(api: PlaneAPI, source_project_name: str, target_project_name: str,
-            module_name_filter: str | None = None, dry_run: bool = False):
-    """메인 마이그레이션 로직"""
+            module_name_filter: str | None = None, dry_run: bool = False,
+            copy_attachments: bool = True, attachment_workers: int = 4,
+            verify_attachments: bool = True, write_delay: float = 3.0,
+            reconcile: bool = False, progress: Progress | None = None,
+            target_api: PlaneAPI | None = None, prefetch: int = 8) -> dict:
+    """메인 마이그레이션 로직 → 요약 통계 반환
+
+    api 는 소스 클라이언트이며, target_api 를 주면 다른 인스턴스 / workspace 로 복제합니다.
+    prefetch: 대상에 쓰는 동안 미리 읽어 둘 소스 작업 아이템(댓글, 활동 포함) 수
+
+    write_delay: 쓰기 후 고정 대기(초). 공유 RateLimiter 를 쓰는 클라이언트라면 0 으로 두어도 됩니다.
+    reconcile: 소스 모듈에서 빠진 복제본을 대상 모듈에서 연결 해제하고, dry-run 에서 필드 단위 변경 계획을 보여줍니다.
+    progress: 단계별 처리 속도 / ETA 표시 (없으면 표시하지 않음)
+    """
+    progress = progress or Progress("off")
+    src_api = api
+    tgt_api = target_api or api
 
     print("=" * 60)
     print("  Plane Module Migration Tool")
@@ -221,16 +444,17 @@ def migrate(api: PlaneAPI, source_project_name: str, target_project_name: str,
 
     # ── 1. 프로젝트 조회 ──
     print("[1/7] 프로젝트 조회 중...")
-    src_project = api.find_project_by_name(source_project_name)
+    phase(1, "[1/7] 프로젝트 조회", "step")
+    src_project = src_api.find_project_by_name(source_project_name)
     if not src_project:
         print(f"  ✗ 소스 프로젝트 '{source_project_name}' 를 찾을 수 없습니다.")
         print("  사용 가능한 프로젝트:")
-        for p in api.list_projects():
+        for p in src_api.list_projects():
             print(f"    - {p['name']} (id: {p['id']})")
         sys.exit(1)
     print(f"  ✓ 소스: {src_project['name']} ({src_project['id']})")
 
-    tgt_project = api.find_project_by_name(target_project_name)
+    tgt_project = tgt_api.find_project_by_name(target_project_name)
     if not tgt_project:
         print(f"  ✗ 대상 프로젝트 '{target_project_name}' 를 찾을 수 없습니다.")
         sys.exit(1)
@@ -241,7 +465,8 @@ def migrate(api: PlaneAPI, source_project_name: str, target_project_name: str,
 
     # ── 2. 모듈 목록 조회 ──
     print("\n[2/7] 소스 프로젝트 모듈 조회 중...")
-    modules = api.list_modules(src_pid)
+    phase(1, "[2/7] 모듈 조회", "step")
+    modules = src_api.list_modules(src_pid)
     if not modules:
         print("  ✗ 모듈이 없습니다.")
         sys.exit(1)
@@ -293,41 +518,102 @@ def migrate(api: PlaneAPI, source_project_name: str, target_project_name: str,
 
     # ── 3. 매핑 데이터 수집 (State, Label, Member, Cycle) ──
     print("\n[3/7] 매핑 데이터(State, Label, User, Cycle) 수집 중...")
-    src_states = api.list_states(src_pid)
-    tgt_states = api.list_states(tgt_pid)
+    phase(1, "[3/7] 매핑 데이터 수집", "step")
+    src_states = src_api.list_states(src_pid)
+    tgt_states = tgt_api.list_states(tgt_pid)
     state_mapping = build_state_mapping(src_states, tgt_states)
 
-    src_labels = api.list_labels(src_pid)
-    tgt_labels = api.list_labels(tgt_pid)
+    src_labels = src_api.list_labels(src_pid)
+    tgt_labels = tgt_api.list_labels(tgt_pid)
     label_mapping = build_name_mapping(src_labels, tgt_labels)
 
-    src_members = api.list_members()
-    tgt_members = api.list_members()
+    src_members = src_api.list_members()
+    tgt_members = tgt_api.list_members()
     user_mapping = build_user_mapping(src_members, tgt_members)
 
-    src_cycles = api.list_cycles(src_pid)
-    tgt_cycles = api.list_cycles(tgt_pid)
+    src_cycles = src_api.list_cycles(src_pid)
+    tgt_cycles = tgt_api.list_cycles(tgt_pid)
     cycle_mapping = build_cycle_mapping(src_cycles, tgt_cycles)
+    # 소스 작업 아이템 → 소스 주기 (매핑된 주기만, 주기마다 목록 한 번 조회)
+    src_cycle_of: dict[str, str] = {}
+    for cycle_id in cycle_mapping:
+        for row in src_api.list_cycle_work_items(src_pid, cycle_id):
+            wid = link_id(row)
+            if wid:
+                src_cycle_of[wid] = cycle_id
+    tgt_cycle_linked: dict[str, set[str]] = {}  # 대상 주기 → 이미 연결된 대상 ID (필요할 때 조회)
 
     print("  • Estimate Points 매핑 중...")
-    estimate_mapping = build_estimate_mapping(api, src_pid, tgt_pid)
+    estimate_mapping = build_estimate_mapping(src_api, src_pid, tgt_pid, tgt_api)
 
     # 기본 State 찾기 (대상 프로젝트의 첫 번째 state)
     default_state_id = tgt_states[0]["id"] if tgt_states else None
+    member_names = build_member_names(src_members)
+
+    def payload_for(wi: dict, old_to_new_id: dict[str, str]) -> dict:
+        data = build_work_item_payload(wi, state_mapping, label_mapping, user_mapping,
+                                       estimate_mapping, default_state_id, member_names)
+        # Parent 매핑 (이미 복제된 부모가 있으면 연결)
+        parent_id = resolve_parent(wi, old_to_new_id, tgt_item_index)
+        if parent_id:
+            data["parent"] = parent_id
+        # 설명 속 멘션 / 작업 아이템 참조를 대상 ID 로 치환 (아직 복제되지 않은 참조는 마지막에 보정)
+        data["description_html"], unresolved = rewriter.rewrite(data["description_html"], pending_ids)
+        if unresolved:
+            forward_refs.add(wi["id"])
+        # 소스 추적 정보 (재실행 시 같은 복제본을 찾기 위함)
+        data["external_source"] = external_source
+        data["external_id"] = wi["id"]
+        return data
+
+    def comment_html_for(comment: dict) -> tuple[str, bool]:
+        cmt_creator_name = member_names.get(comment.get("created_by"), "Unknown")
+        html = f"<b>[{cmt_creator_name}]</b><br>" + comment.get("comment_html", "")
+        return rewriter.rewrite(html, pending_ids)
 
     print(f"  ✓ States: {len(state_mapping)}개 매핑됨")
     print(f"  ✓ Labels: {len(label_mapping)}개 매핑됨")
     print(f"  ✓ Users: {len(user_mapping)}개 매핑됨")
-    print(f"  ✓ Cycles: {len(cycle_mapping)}개 매핑됨")
+    print(f"  ✓ Cycles: {len(cycle_mapping)}개 매핑됨 (소속 Work Items {len(src_cycle_of)}개)")
 
     # ── 4. 소스 Work Items 전체 조회 (하위 이슈 찾기용) ──
     print("\n[4/7] 소스 프로젝트 전체 Work Items 조회 중...")
-    all_src_work_items = api.list_work_items(src_pid)
+    phase(1, "[4/7] 소스 Work Items 조회", "step")
+    progress.stage("조회")
+    all_src_work_items = src_api.list_work_items(src_pid)
     print(f"  ✓ 총 {len(all_src_work_items)}개 Work Items")
+    src_by_id = {wi["id"]: wi for wi in all_src_work_items}
+    src_tree = build_work_item_tree(all_src_work_items)
+
+    # 이전 실행에서 만든 복제본 색인 (실행당 한 번만 조회)
+    external_source = external_source_for(src_pid)
+    tgt_modules = tgt_api.list_modules(tgt_pid)
+    tgt_module_index = build_external_id_index(tgt_modules, external_source)
+    tgt_item_index = build_external_id_index(tgt_api.list_work_items(tgt_pid), external_source)
+    print(f"  ✓ 대상 프로젝트 기존 복제본: {len(tgt_item_index)}개 (external_source: {external_source})")
+
+    # 설명 / 댓글 참조 치환용 매핑 (복제가 진행되며 migrated_ids, tgt_sequences 가 채워짐)
+    migrated_ids: dict[str, str] = {ext_id: item["id"] for ext_id, item in tgt_item_index.items()}
+    tgt_sequences: dict[str, int] = {item["id"]: item.get("sequence_id") for item in tgt_item_index.values()}
+    rewriter = ReferenceRewriter(
+        ChainMap(migrated_ids, user_mapping, {src_pid: tgt_pid}),
+        src_project.get("identifier"), tgt_project.get("identifier"),
+        {wi["sequence_id"]: wi["id"] for wi in all_src_work_items if wi.get("sequence_id") is not None},
+        tgt_sequences,
+        link_prefixes(src_api, tgt_api),
+    )
+    pending_ids: set[str] = set()  # 현재 모듈에서 복제할 소스 ID (앞선 참조 판별용)
+    forward_refs: set[str] = set()  # 설명에 아직 복제되지 않은 항목 참조가 남은 소스 ID
 
     # ── 모듈별 처리 ──
     total_created = 0
+    total_updated = 0
+    total_unchanged = 0
+    total_unlinked = 0
+    total_cycle_links = 0
     total_modules = 0
+    total_attachments = 0
+    failed_attachments = 0
 
     for module in selected_modules:
         module_name = module["name"]
@@ -339,33 +625,22 @@ def migrate(api: PlaneAPI, source_project_name: str, target_project_name: str,
 
         # ── 5. 모듈 내 Work Items 조회 ──
         print(f"\n[5/7] 모듈 '{module_name}'(ID: {module_id}) Work Items 수집 중...")
-        module_issues_data = api.list_module_work_items(src_pid, module_id)
+        phase(1, f"모듈 {module_name}", "module")
+        phase(2, "[5/7] 모듈 Work Items 수집", "step")
+        module_issues_data = src_api.list_module_work_items(src_pid, module_id)
         
         print(f"    - API 응답 이슈 개수: {len(module_issues_data)}개")
         
-        all_items_to_clone: dict[str, dict] = {}
-        
-        # 초기 모듈 이슈 등록
-        for wi in module_issues_data:
-            # ID 필드 확인 (id, issue, work_item 중 하나)
-            wi_id = wi.get("id") or wi.get("issue") or wi.get("work_item")
-            if not wi_id:
-                continue
-
-            if "name" in wi:
-                all_items_to_clone[wi_id] = wi
-            else:
-                # 상세 정보가 없으면 개별 조회
-                # print(f"      • 상세 정보 조회 중: {wi_id}")
-                full_wi = api.get_work_item(src_pid, wi_id)
-                all_items_to_clone[wi_id] = full_wi
-
+        # 이름이 없는 연결 행은 4단계에서 받은 목록으로 채우고, 나머지만 동시에 조회
+        all_items_to_clone = hydrate_work_items(src_api, src_pid, module_issues_data, src_by_id, prefetch)
         print(f"    - 모듈 직속 이슈 등록 완료: {len(all_items_to_clone)}개")
 
-        # 하위 이슈 재귀적으로 찾기 (API 기반)
+        # 하위 이슈 재귀적으로 찾기 (4단계 목록의 parent 기준 트리)
         if all_items_to_clone:
             print("  ✓ 하위 이슈 탐색 중...")
-            descendants = collect_all_descendants_via_api(api, src_pid, set(all_items_to_clone.keys()))
+            descendants = collect_all_descendants(src_tree, set(all_items_to_clone.keys()))
+            if descendants:
+                print(f"      • 하위 이슈 {len(descendants)}개 발견")
             for d in descendants:
                 all_items_to_clone[d["id"]] = d
 
@@ -379,29 +654,65 @@ def migrate(api: PlaneAPI, source_project_name: str, target_project_name: str,
         # 위상 정렬: 부모 → 자식 순서
         sorted_items = topological_sort(items_list)
 
+        # 이전 실행의 복제본(external_id) 또는 같은 이름의 모듈이 있으면 삭제하지 않고 재사용
+        existing_module = tgt_module_index.get(module_id)
+        if not existing_module:
+            existing_module = next((m for m in tgt_modules if m.get("name") == module_name), None)
+        linked_ids: set[str] = set()
+        if existing_module:
+            for row in tgt_api.list_module_work_items(tgt_pid, existing_module["id"]):
+                linked_id = link_id(row)
+                if linked_id:
+                    linked_ids.add(linked_id)
+
+        # 소스 모듈에서 빠진 복제본 (이 소스에서 복제된 항목만 대상, 대상에서 직접 추가한 티켓은 유지)
+        source_ids = {wi["id"] for wi in sorted_items}
+        pending_ids = source_ids
+        to_unlink_ids = sorted(
+            item["id"] for ext_id, item in tgt_item_index.items()
+            if item["id"] in linked_ids and ext_id not in source_ids
+        ) if reconcile else []
+
         if dry_run:
             print(f"\n  [DRY-RUN] 복제 대상 Work Items:")
+            planned_ids: dict[str, str] = {}
+            plan_counts = {"신규": 0, "갱신": 0, "변경 없음": 0}
             for wi in sorted_items:
                 parent_info = f" (parent: {wi.get('parent', 'N/A')})" if wi.get("parent") else ""
-                print(f"    • {wi.get('name', 'N/A')}{parent_info}")
-            print(f"\n  [DRY-RUN] 모듈 '{module_name}' 생성 예정 (대상 프로젝트)")
+                existing = tgt_item_index.get(wi["id"])
+                if not existing:
+                    action = "신규"
+                elif reconcile:
+                    changes = diff_fields(payload_for(wi, planned_ids), existing)
+                    action = "갱신" if changes else "변경 없음"
+                    if changes:
+                        parent_info += f" ({', '.join(changes)})"
+                else:
+                    action = "갱신 확인"
+                if existing:
+                    planned_ids[wi["id"]] = existing["id"]
+                plan_counts[action] = plan_counts.get(action, 0) + 1
+                print(f"    • [{action}] {wi.get('name', 'N/A')}{parent_info}")
+            if reconcile:
+                to_link = sum(1 for wi in sorted_items
+                              if wi["id"] not in tgt_item_index or tgt_item_index[wi["id"]]["id"] not in linked_ids)
+                print(f"  [DRY-RUN] 생성 {plan_counts['신규']}, 갱신 {plan_counts['갱신']}, "
+                      f"변경 없음 {plan_counts['변경 없음']}, 연결 {to_link}, 연결 해제 {len(to_unlink_ids)}")
+            action = "갱신 예정" if existing_module else "생성 예정"
+            print(f"\n  [DRY-RUN] 모듈 '{module_name}' {action} (대상 프로젝트)")
             total_modules += 1
             continue
 
         # ── 6. 대상 프로젝트에 모듈 생성 ──
         print(f"\n[6/7] 대상 프로젝트에 모듈 '{module_name}' 생성 중...")
-        
-        # 주: 이름이 같은 모듈이 이미 있으면 에러가 나므로, 
-        # 클린한 복제를 위해 기존 모듈을 찾아 삭제하고 진행합니다.
-        existing_module = api.find_module_by_name(tgt_pid, module_name)
-        if existing_module:
-            print(f"  ⚠ 대상 프로젝트에 이미 '{module_name}' 모듈이 존재합니다. 삭제 후 다시 생성합니다.")
-            api.delete_module(tgt_pid, existing_module["id"])
+        phase(2, "[6/7] 모듈 생성", "step")
 
         new_module_data = {
             "name": module_name,
             "description": module.get("description", ""),
             "status": module.get("status", "backlog"),
+            "external_source": external_source,
+            "external_id": module_id,
         }
         if module.get("start_date"):
             new_module_data["start_date"] = module["start_date"]
@@ -409,9 +720,17 @@ def migrate(api: PlaneAPI, source_project_name: str, target_project_name: str,
             new_module_data["target_date"] = module["target_date"]
 
         try:
-            new_module = api.create_module(tgt_pid, new_module_data)
-            new_module_id = new_module["id"]
-            print(f"  ✓ 모듈 생성됨: {new_module_id}")
+            if existing_module:
+                new_module_id = existing_module["id"]
+                print(f"  ⚠ 대상 프로젝트에 이미 '{module_name}' 모듈이 존재합니다. 변경된 항목만 반영합니다.")
+                module_changes = diff_fields(new_module_data, existing_module)
+                if module_changes:
+                    tgt_api.update_module(tgt_pid, new_module_id, module_changes)
+                    print(f"  ✓ 모듈 정보 갱신됨: {', '.join(module_changes)}")
+            else:
+                new_module = tgt_api.create_module(tgt_pid, new_module_data)
+                new_module_id = new_module["id"]
+                print(f"  ✓ 모듈 생성됨: {new_module_id}")
             total_modules += 1
         except requests.HTTPError as e:
             print(f"  ✗ 모듈 생성 실패: {e}")
@@ -420,89 +739,43 @@ def migrate(api: PlaneAPI, source_project_name: str, target_project_name: str,
 
         # ── 7. Work Items 복제 ──
         print(f"\n[7/7] Work Items 복제 중...")
+        phase(2, "[7/7] Work Items 복제", "step")
         old_to_new_id: dict[str, str] = {}  # 소스 ID → 대상 ID 매핑
-        created_in_module: list[str] = []
-
-        for i, wi in enumerate(sorted_items, 1):
+        to_link_ids: list[str] = []  # 모듈에 아직 연결되지 않은 대상 ID
+        created_pairs: list[tuple[str, str]] = []  # 이번 실행에서 새로 생성된 (소스 ID, 대상 ID)
+        forward_comments: list[tuple[str, str, dict]] = []  # 앞선 참조가 남은 (대상 ID, 댓글 ID, 소스 댓글)
+
+        # 소스 댓글 / 활동은 대상 쓰기와 겹치도록 prefetch 개 앞서 조회
+        details = prefetch_source_details(src_api, src_pid, sorted_items,
+                                          lambda wi: wi["id"] not in tgt_item_index, prefetch)
+        for i, (wi, comments, activities, read_error) in enumerate(
+                progress.track(details, f"복제 {module_name}", total=len(sorted_items)), 1):
             old_id = wi["id"]
+            phase(3, wi.get("name", "Untitled"), "item", id=old_id)
 
-            # Work Item 데이터 구성
-            new_wi_data: dict[str, Any] = {
-                "name": wi.get("name", "Untitled"),
-            }
-
-            # 설명
-            if wi.get("description_html"):
-                new_wi_data["description_html"] = wi["description_html"]
-
-            # 우선순위
-            if wi.get("priority"):
-                new_wi_data["priority"] = wi["priority"]
-
-            # 날짜
-            if wi.get("start_date"):
-                new_wi_data["start_date"] = wi["start_date"]
-            if wi.get("target_date"):
-                new_wi_data["target_date"] = wi["target_date"]
-
-            # 추정치
-            if wi.get("estimate_point") and wi["estimate_point"] in estimate_mapping:
-                new_wi_data["estimate_point"] = estimate_mapping[wi["estimate_point"]]
-
-            # State 매핑
-            if wi.get("state") and wi["state"] in state_mapping:
-                new_wi_data["state"] = state_mapping[wi["state"]]
-            elif default_state_id:
-                new_wi_data["state"] = default_state_id
-
-            # Label 매핑
-            if wi.get("labels"):
-                mapped_labels_list = []
-                for lbl_id in wi["labels"]:
-                    if lbl_id in label_mapping:
-                        mapped_labels_list.append(label_mapping[lbl_id])
-                if mapped_labels_list:
-                    new_wi_data["labels"] = mapped_labels_list
-
-            # 담당자(Assignees) 매핑
-            if wi.get("assignees"):
-                mapped_assignees = []
-                for user_id in wi["assignees"]:
-                    if user_id in user_mapping:
-                        mapped_assignees.append(user_mapping[user_id])
-                if mapped_assignees:
-                    new_wi_data["assignees"] = mapped_assignees
-
-            # 주기(Cycle) 매핑
-            if wi.get("cycle") and wi["cycle"] in cycle_mapping:
-                new_wi_data["cycle"] = cycle_mapping[wi["cycle"]]
-
-            # 작성자(Created By) 정보 보존 (API로 설정 불가능하므로 설명이나 댓글에 추가)
-            original_creator_name = "Unknown"
-            src_creator_id = wi.get("created_by")
-            for m in src_members:
-                u = m.get("member", m) # 구조 자동 감지
-                if u.get("id") == src_creator_id:
-                    original_creator_name = f"{u.get('first_name', '')} {u.get('last_name', '')}".strip() or u.get('email', 'Unknown')
-                    break
-            
-            creator_note = f"<p><i>Originally created by: {original_creator_name}</i></p>"
-            if "description_html" in new_wi_data:
-                new_wi_data["description_html"] = creator_note + new_wi_data["description_html"]
-            else:
-                new_wi_data["description_html"] = creator_note
-
-            # Parent 매핑 (이미 복제된 부모가 있으면 연결)
-            if wi.get("parent") and wi["parent"] in old_to_new_id:
-                new_wi_data["parent"] = old_to_new_id[wi["parent"]]
+            new_wi_data = payload_for(wi, old_to_new_id)
 
-            # Work Item 생성
+            # Work Item 생성 또는 기존 복제본 갱신
             try:
-                new_wi = api.create_work_item(tgt_pid, new_wi_data)
-                new_id = new_wi["id"]
+                action, target_item, changes = upsert_work_item(tgt_api, tgt_pid, new_wi_data, tgt_item_index.get(old_id))
+                new_id = target_item["id"]
                 old_to_new_id[old_id] = new_id
-                created_in_module.append(new_id)
+                migrated_ids[old_id] = new_id
+                tgt_sequences[new_id] = target_item.get("sequence_id")
+                if new_id not in linked_ids:
+                    to_link_ids.append(new_id)
+
+                if action == "unchanged":
+                    total_unchanged += 1
+                    print(f"    [{i}/{len(sorted_items)}] = {wi.get('name', 'Untitled')} (변경 없음)")
+                    continue
+                if action == "updated":
+                    total_updated += 1
+                    print(f"    [{i}/{len(sorted_items)}] ↻ {wi.get('name', 'Untitled')} (갱신: {', '.join(changes)})")
+                    time.sleep(write_delay)
+                    continue
                 total_created += 1
+                created_pairs.append((old_id, new_id))
 
                 parent_info = ""
                 if wi.get("parent") and wi["parent"] in old_to_new_id:
@@ -510,25 +783,20 @@ def migrate(api: PlaneAPI, source_project_name: str, target_project_name: str,
                 print(f"    [{i}/{len(sorted_items)}] ✓ {wi.get('name', 'Untitled')}{parent_info}")
 
                 # ── 댓글 및 활동 복제 ──
+                if read_error:
+                    raise read_error
                 # 댓글 복제
-                comments = api.list_comments(src_pid, old_id)
                 for comment in reversed(comments): # 오래된 순서대로
-                    cmt_creator_id = comment.get("created_by")
-                    cmt_creator_name = "Unknown"
-                    for m in src_members:
-                        u = m.get("member", m) # 구조 자동 감지
-                        if u.get("id") == cmt_creator_id:
-                            cmt_creator_name = f"{u.get('first_name', '')} {u.get('last_name', '')}".strip() or u.get('email', 'Unknown')
-                            break
-                    
+                    comment_html, unresolved = comment_html_for(comment)
                     cmt_data = {
-                        "comment_html": f"<b>[{cmt_creator_name}]</b><br>" + comment.get("comment_html", ""),
+                        "comment_html": comment_html,
                         "comment_json": comment.get("comment_json") or {"type": "doc", "content": [{"type": "paragraph", "content": []}]}
                     }
-                    api.create_comment(tgt_pid, new_id, cmt_data)
+                    created_comment = tgt_api.create_comment(tgt_pid, new_id, cmt_data)
+                    if unresolved:
+                        forward_comments.append((new_id, created_comment["id"], comment))
 
                 # 활동(Activity) 내역을 댓글로 추가 (직접 복제가 어려우므로 기록용)
-                activities = api.list_activities(src_pid, old_id)
                 if activities:
                     activity_log = "<ul>"
                     for act in activities[:10]: # 최근 10개만
@@ -539,51 +807,157 @@ def migrate(api: PlaneAPI, source_project_name: str, target_project_name: str,
                         activity_log += f"<li>{verb} {field}: {old_val} -> {new_val}</li>"
                     activity_log += "</ul>"
                     
-                    api.create_comment(tgt_pid, new_id, {
+                    tgt_api.create_comment(tgt_pid, new_id, {
                         "comment_html": f"<p><b>[Original Activity Log]</b></p>{activity_log}"
                     })
 
                 # API rate limiting 방지 (더 안전하게 연장)
-                time.sleep(3.0)
+                time.sleep(write_delay)
 
             except requests.HTTPError as e:
                 print(f"    [{i}/{len(sorted_items)}] ✗ {wi.get('name', 'Untitled')}: {e}")
                 # _request 메서드에서 이미 400 응답 내용을 출력함
-                time.sleep(3.0)
+                time.sleep(write_delay)
+
+        phase(2, "참조 보정 / 모듈·주기 연결 / 첨부 파일", "step")
+        # 복제 순서상 뒤에 만들어진 항목을 가리키던 설명 / 댓글 참조 보정
+        fixed_refs = 0
+        for wi in sorted_items:
+            if wi["id"] not in forward_refs or wi["id"] not in old_to_new_id:
+                continue
+            forward_refs.discard(wi["id"])
+            description_html = payload_for(wi, old_to_new_id)["description_html"]
+            try:
+                tgt_api.update_work_item(tgt_pid, old_to_new_id[wi["id"]], {"description_html": description_html})
+                fixed_refs += 1
+            except requests.HTTPError as e:
+                print(f"  ✗ 참조 보정 실패 ({wi.get('name', 'Untitled')}): {e}")
+        for new_id, comment_id, comment in forward_comments:
+            try:
+                tgt_api.update_comment(tgt_pid, new_id, comment_id, {"comment_html": comment_html_for(comment)[0]})
+                fixed_refs += 1
+            except requests.HTTPError as e:
+                print(f"  ✗ 댓글 참조 보정 실패 ({comment_id}): {e}")
+        if fixed_refs:
+            print(f"  ✓ 앞선 참조 보정: {fixed_refs}건")
 
         # 모듈에 Work Items 연결
-        if created_in_module:
-            print(f"\n  모듈에 Work Items 연결 중 ({len(created_in_module)}개)...")
+        if to_link_ids:
+            print(f"\n  모듈에 Work Items 연결 중 ({len(to_link_ids)}개)...")
             try:
-                api.add_work_items_to_module(tgt_pid, new_module_id, created_in_module)
+                tgt_api.add_work_items_to_module(tgt_pid, new_module_id, to_link_ids)
                 print(f"  ✓ 모듈 연결 완료")
             except requests.HTTPError as e:
                 print(f"  ✗ 모듈 연결 실패: {e}")
                 if e.response:
                     print(f"    응답: {e.response.text[:200]}")
 
+        # 주기 연결: 대상 주기마다 아직 연결되지 않은 복제본을 한 번의 요청으로 추가
+        cycle_links: dict[str, list[str]] = {}
+        cycle_added = 0
+        for wi in sorted_items:
+            src_cycle = src_cycle_of.get(wi["id"]) or wi.get("cycle")
+            if src_cycle in cycle_mapping and wi["id"] in old_to_new_id:
+                cycle_links.setdefault(cycle_mapping[src_cycle], []).append(old_to_new_id[wi["id"]])
+        for tgt_cycle_id, tgt_ids in cycle_links.items():
+            try:
+                if tgt_cycle_id not in tgt_cycle_linked:
+                    tgt_cycle_linked[tgt_cycle_id] = {
+                        wid for wid in map(link_id, tgt_api.list_cycle_work_items(tgt_pid, tgt_cycle_id)) if wid
+                    }
+                linked = tgt_cycle_linked[tgt_cycle_id]
+                to_add = [wid for wid in tgt_ids if wid not in linked]
+                if to_add:
+                    tgt_api.add_work_items_to_cycle(tgt_pid, tgt_cycle_id, to_add)
+                    linked.update(to_add)
+                    cycle_added += len(to_add)
+            except requests.HTTPError as e:
+                print(f"  ✗ 주기 연결 실패 ({tgt_cycle_id}): {e}")
+        if cycle_added:
+            total_cycle_links += cycle_added
+            print(f"  ✓ 주기 연결: {len(cycle_links)}개 주기에 {cycle_added}개 Work Items 추가")
+
+        # 소스 모듈에서 빠진 복제본 연결 해제 (티켓 자체는 삭제하지 않음)
+        if to_unlink_ids:
+            print(f"\n  소스 모듈에서 빠진 Work Items 연결 해제 중 ({len(to_unlink_ids)}개)...")
+            for tgt_id in to_unlink_ids:
+                try:
+                    tgt_api.remove_work_item_from_module(tgt_pid, new_module_id, tgt_id)
+                    total_unlinked += 1
+                except requests.HTTPError as e:
+                    print(f"  ✗ 연결 해제 실패 ({tgt_id}): {e}")
+
+        # 첨부 파일 복사 (새로 생성된 티켓만, 스트리밍 + 동시 전송)
+        if copy_attachments and created_pairs:
+            copied, failed, copied_bytes = copy_work_item_attachments(
+                src_api, tgt_api, src_pid, tgt_pid, created_pairs,
+                workers=attachment_workers, verify=verify_attachments,
+            )
+            total_attachments += copied
+            failed_attachments += failed
+            if copied or failed:
+                print(f"  ✓ 첨부 파일 {copied}개 복사 ({copied_bytes:,} bytes), 실패 {failed}개")
+
+    end_phase(1)
+
     # ── Summary ──
     print(f"\n{'=' * 60}")
     print("  마이그레이션 완료!")
     print(f"{'=' * 60}")
     if dry_run:
         print(f"  [DRY-RUN] 실제 생성 없음")
-    print(f"  모듈: {total_modules}개 {'생성 예정' if dry_run else '생성됨'}")
+    print(f"  모듈: {total_modules}개 {'생성 예정' if dry_run else '생성/갱신됨'}")
     if dry_run:
         # sorted_items는 루프 안의 지역 변수라 위에서 합산이 필요함. 
         # 일단 로직상 감지는 되었으므로 사용자에게 안내 가능.
         print(f"  Work Items: (감지됨) {'복제 예정' if dry_run else '복제됨'}")
     else:
-        print(f"  Work Items: {total_created}개 복제됨")
+        print(f"  Work Items: {total_created}개 복제됨, {total_updated}개 갱신됨, {total_unchanged}개 변경 없음")
+        if total_cycle_links:
+            print(f"  주기 연결: {total_cycle_links}개")
+        if reconcile:
+            print(f"  연결 해제: {total_unlinked}개 (소스 모듈에서 빠진 복제본)")
+        if copy_attachments:
+            print(f"  첨부 파일: {total_attachments}개 복사됨" + (f", {failed_attachments}개 실패" if failed_attachments else ""))
     print(f"  소스: {source_project_name} → 대상: {target_project_name}")
     print()
+    return {
+        "modules": total_modules,
+        "created": total_created,
+        "updated": total_updated,
+        "unchanged": total_unchanged,
+        "unlinked": total_unlinked,
+        "cycle_links": total_cycle_links,
+        "attachments": total_attachments,
+        "failed_attachments": failed_attachments,
+    }
+
+
+def migrate_many(api: PlaneAPI, source_project_name: str, target_project_names: list[str],
+                 module_name: str, target_base_url: str, target_api_key: str, target_workspace: str,
+                 workers: int = 4, **job_options) -> list:
+    """소스 모듈을 한 번만 읽어 여러 대상 프로젝트에 동시에 복제 → job 목록 반환
+
+    소스 모듈 트리 / 댓글 / 활동 / 조회 데이터를 메모리 번들로 한 번 읽은 뒤, 대상마다 job 하나로
+    (대상별 매핑은 각 job 의 migrate 가 생성) 공유 요청 예산 아래에서 실행합니다.
+    첨부 파일 내용은 소스 클라이언트에서 내려받습니다.
+    """
+    from plane_bundle import export_bundle, import_bundle
+
+    print(f"  소스 읽는 중: {source_project_name} / {module_name}")
+    bundle = export_bundle(api, source_project_name, [module_name])
+    bundle.attachment_source = api
+    print(f"  ✓ 소스 조회 요청 {api.request_count}회, 대상 {len(target_project_names)}개로 복제 시작")
+    return import_bundle(bundle, target_project_names, target_base_url, target_api_key, target_workspace,
+                         workers=workers, **job_options)
 
 
 # ──────────────────────────────────────────────────────────────
 #  Entry Point
 # ──────────────────────────────────────────────────────────────
 
-def main():
+def main(argv: list[str] | None = None):
+    load_env_manual()
     parser = argparse.ArgumentParser(
         description="Plane 프로젝트 간 모듈/이슈 복제 도구"
     )
@@ -595,6 +969,26 @@ def main():
         "--module", type=str, default=None,
         help="복제할 모듈 이름 (지정하지 않으면 대화형 선택)"
     )
+    parser.add_argument(
+        "--reconcile", action="store_true",
+        help="소스 모듈에서 빠진 복제본을 대상 모듈에서 연결 해제 (dry-run 시 필드 단위 변경 계획 출력)"
+    )
+    parser.add_argument(
+        "--progress", type=str, choices=MODES, default=os.environ.get("PLANE_PROGRESS", "auto"),
+        help="진행 표시 (auto: 터미널이면 상태 줄, 아니면 주기적 로그 / live / log / off)"
+    )
+    parser.add_argument(
+        "--skip-attachments", action="store_true",
+        help="첨부 파일을 복사하지 않음"
+    )
+    parser.add_argument(
+        "--attachment-workers", type=int, default=4,
+        help="동시에 전송할 첨부 파일 수 (기본 4)"
+    )
+    parser.add_argument(
+        "--no-verify-attachments", action="store_true",
+        help="업로드 후 체크섬 검증(대상 파일 재다운로드) 생략"
+    )
     parser.add_argument(
         "--base-url", type=str,
         default=os.environ.get("PLANE_BASE_URL", "https://plane.thingspire.com"),
@@ -616,11 +1010,46 @@ def main():
         help="소스 프로젝트 이름"
     )
     parser.add_argument(
-        "--target", type=str,
-        default=os.environ.get("PLANE_TARGET_PROJECT", "ETC"),
-        help="대상 프로젝트 이름"
+        "--target", type=str, action="append",
+        help="대상 프로젝트 이름 (여러 번 지정하면 모든 대상에 동시에 복제, 기본값 PLANE_TARGET_PROJECT)"
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--target-base-url", type=str,
+        default=os.environ.get("PLANE_TARGET_BASE_URL"),
+        help="대상 Plane 인스턴스 URL (다른 인스턴스로 복제할 때, 기본값은 --base-url)"
+    )
+    parser.add_argument(
+        "--target-api-key", type=str,
+        default=os.environ.get("PLANE_TARGET_API_KEY"),
+        help="대상 인스턴스 API Key (기본값은 --api-key)"
+    )
+    parser.add_argument(
+        "--target-workspace", type=str,
+        default=os.environ.get("PLANE_TARGET_WORKSPACE_SLUG"),
+        help="대상 Workspace slug (기본값은 --workspace)"
+    )
+    parser.add_argument(
+        "--prefetch", type=int, default=8,
+        help="대상에 쓰는 동안 미리 읽어 둘 소스 작업 아이템 수 (0 이면 순차 처리)"
+    )
+    parser.add_argument(
+        "--profile", type=str, default=None, metavar="TRACE_JSON",
+        help="단계 / 모듈 / 작업 아이템 / HTTP 요청 구간을 Chrome trace(JSON) 파일로 저장"
+    )
+    parser.add_argument(
+        "--cprofile", action="store_true",
+        help="--profile 과 함께 cProfile 결과도 저장 (trace 파일 이름 + .prof)"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=4,
+        help="대상이 여러 개일 때 동시에 복제할 대상 수"
+    )
+    parser.add_argument(
+        "--rate", type=float, default=float(os.environ.get("PLANE_RATE_LIMIT", "1.0")),
+        help="대상이 여러 개일 때 모든 대상이 공유하는 초당 요청 수"
+    )
+    args = parser.parse_args(argv)
+    targets = args.target or [os.environ.get("PLANE_TARGET_PROJECT", "ETC")]
 
     if not args.api_key:
         print("Error: API Key가 필요합니다.")
@@ -629,15 +1058,56 @@ def main():
         sys.exit(1)
 
     api = PlaneAPI(args.base_url, args.api_key, args.workspace)
+    target_api = None
+    if args.target_base_url or args.target_api_key or args.target_workspace:
+        target_api = PlaneAPI(args.target_base_url or args.base_url, args.target_api_key or args.api_key,
+                              args.target_workspace or args.workspace)
+
+    if len(targets) > 1:
+        if not args.module:
+            print("Error: 여러 대상에 복제할 때는 --module 을 지정해야 합니다.")
+            sys.exit(1)
+        try:
+            with profiling(args.profile, args.cprofile):
+                jobs = migrate_many(
+                    api, args.source, targets, args.module,
+                    args.target_base_url or args.base_url, args.target_api_key or args.api_key,
+                    args.target_workspace or args.workspace,
+                    workers=args.jobs, rate=args.rate, dry_run=args.dry_run, reconcile=args.reconcile,
+                    copy_attachments=not args.skip_attachments, attachment_workers=args.attachment_workers,
+                    verify_attachments=not args.no_verify_attachments,
+                )
+        except ValueError as e:
+            print(f"  ✗ {e}")
+            sys.exit(1)
+        except KeyboardInterrupt:
+            print("\n\n중단됨.")
+            sys.exit(0)
+        failed = [j for j in jobs if j.status != "done"]
+        print(f"\n  완료 {len(jobs) - len(failed)}개, 실패 {len(failed)}개")
+        if failed:
+            sys.exit(1)
+        return
 
     try:
-        migrate(
-            api=api,
-            source_project_name=args.source,
-            target_project_name=args.target,
-            module_name_filter=args.module,
-            dry_run=args.dry_run,
-        )
+        with profiling(args.profile, args.cprofile), \
+                Progress(args.progress, apis=[api] + ([target_api] if target_api else [])) as progress:
+            migrate(
+                api=api,
+                source_project_name=args.source,
+                target_project_name=targets[0],
+                module_name_filter=args.module,
+                dry_run=args.dry_run,
+                copy_attachments=not args.skip_attachments,
+                attachment_workers=args.attachment_workers,
+                verify_attachments=not args.no_verify_attachments,
+                reconcile=args.reconcile,
+                progress=progress,
+                target_api=target_api,
+                prefetch=args.prefetch,
+                # 공유 limiter 가 요청 간격을 조절하면 고정 대기 불필요
+                write_delay=0 if (target_api or api).limiter else 3.0,
+            )
     except requests.HTTPError as e:
         print(f"\nAPI Error: {e}")
         if e.response is not None:
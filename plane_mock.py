@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Plane Mock Server
+=================
+Plane REST API v1 의 일부(프로젝트, 멤버, 상태, 레이블, 주기, 모듈, 작업 아이템, 댓글, 활동, 첨부 파일)를
+메모리에서 흉내 내는 로컬 서버입니다. 실제 인스턴스 없이 도구와 `plane loadtest` 를 CI 에서 실행하는 용도입니다.
+
+Usage:
+    python plane_mock.py --port 8765 --items 200
+    python plane_mock.py --latency 0.02 --capacity 8 --rate-limit 50   # 처리 능력 / rate limit 흉내
+
+    PLANE_BASE_URL=http://127.0.0.1:8765 PLANE_API_KEY=test PLANE_WORKSPACE_SLUG=mock python plane.py report --project Src
+
+- latency: 요청 하나를 처리하는 시간(초). capacity 가 있으면 동시에 그 수만큼만 처리하고 나머지는 줄을 서므로,
+  동시 요청이 capacity / latency 를 넘으면 응답 시간이 늘어납니다.
+- rate-limit: API key 별 초당 요청 수. 넘으면 Retry-After 와 함께 429 를 반환합니다.
+- fail-rate: 이 비율만큼 502 를 반환합니다.
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+API_PREFIX = re.compile(r"^/api/v1/workspaces/[^/]+/(.*)$")
+STATE_GROUPS = [("backlog", "Backlog"), ("unstarted", "Todo"), ("started", "In Progress"),
+                ("completed", "Done"), ("cancelled", "Cancelled")]
+
+
+def _new_id() -> str:
+    return str(uuid.uuid4())
+
+
+def _now() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def paginate(rows: list, query: dict) -> dict:
+    """Plane 과 같은 `per_page:page:offset` 커서 페이지네이션 응답"""
+    per_page = int(query.get("per_page", "100"))
+    cursor = query.get("cursor", f"{per_page}:0:0")
+    per_page, page, _ = (int(x) for x in cursor.split(":"))
+    chunk = rows[page * per_page:(page + 1) * per_page]
+    total_pages = (len(rows) + per_page - 1) // per_page
+    return {"results": chunk, "next_cursor": f"{per_page}:{page + 1}:0", "next_page_results": page + 1 < total_pages,
+            "prev_cursor": f"{per_page}:{page - 1}:0", "total_pages": total_pages, "total_count": len(rows),
+            "count": len(chunk), "total_results": len(rows)}
+
+
+class MockWorkspace:
+    """메모리 상의 workspace 데이터 (모든 변경은 lock 안에서)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.projects: dict[str, dict] = {}
+        self.members: list[dict] = []
+        self.data: dict[str, dict] = {}  # 프로젝트 ID → 프로젝트별 데이터
+        self.storage: dict[str, bytes] = {}  # 첨부 파일 key → 내용
+
+    def add_project(self, name: str, identifier: str) -> dict:
+        pid = _new_id()
+        project = {"id": pid, "name": name, "identifier": identifier, "estimate": None}
+        self.projects[pid] = project
+        self.data[pid] = {
+            "states": [{"id": _new_id(), "name": sname, "group": group} for group, sname in STATE_GROUPS],
+            "labels": [{"id": _new_id(), "name": "bug"}, {"id": _new_id(), "name": "feature"}],
+            "cycles": [{"id": _new_id(), "name": "Cycle 1"}],
+            "modules": {}, "module_links": {}, "cycle_links": {},
+            "items": {}, "comments": {}, "activities": {}, "attachments": {}, "sequence": 0,
+        }
+        return project
+
+    def seed(self, items: int = 30) -> None:
+        """소스 프로젝트 Src(모듈 M1, 하위 이슈, 댓글, 활동 포함)와 빈 대상 프로젝트 Tgt 생성"""
+        self.members = [{"id": _new_id(), "email": f"user{i}@example.com", "first_name": f"User{i}",
+                         "last_name": "", "display_name": f"user{i}"} for i in range(3)]
+        src = self.add_project("Src", "SRC")
+        self.add_project("Tgt", "TGT")
+        P = self.data[src["id"]]
+        module_id = _new_id()
+        P["modules"][module_id] = {"id": module_id, "name": "M1", "status": "backlog", "updated_at": _now()}
+        P["module_links"][module_id] = []
+        roots: list[str] = []
+        for i in range(items):
+            state = P["states"][i % len(P["states"])]
+            # 5개마다 새 루트, 나머지는 직전 루트의 하위 이슈
+            parent = roots[-1] if i % 5 and roots else None
+            item = self._create_item(src["id"], {
+                "name": f"Item {i}", "state": state["id"], "parent": parent, "priority": "medium",
+                "assignees": [self.members[i % 3]["id"]] if i % 4 else [],
+                "labels": [P["labels"][0]["id"]] if i % 2 == 0 else [],
+                "target_date": "2025-01-01" if i % 3 == 0 else None,
+                "description_html": f"<p>Item {i}</p>", "created_by": self.members[0]["id"],
+            })
+            if parent is None:
+                roots.append(item["id"])
+            P["comments"][item["id"]] = [{"id": _new_id(), "comment_html": f"<p>comment {i}</p>",
+                                          "created_by": self.members[1]["id"]}]
+            P["activities"][item["id"]] = [
+                {"id": _new_id(), "verb": "created", "field": None, "created_at": item["created_at"]},
+                {"id": _new_id(), "verb": "updated", "field": "state", "old_value": "Backlog",
+                 "new_value": state["name"], "new_identifier": state["id"], "created_at": item["created_at"]},
+            ]
+            if i < max(1, items // 3):
+                P["module_links"][module_id].append(item["id"])
+        P["cycle_links"][P["cycles"][0]["id"]] = list(P["module_links"][module_id][:3])
+
+    def _create_item(self, pid: str, data: dict) -> dict:
+        P = self.data[pid]
+        P["sequence"] += 1
+        item = {"assignees": [], "labels": [], "parent": None, **data, "id": _new_id(),
+                "sequence_id": P["sequence"], "project": pid, "created_at": _now(), "updated_at": _now()}
+        P["items"][item["id"]] = item
+        return item
+
+
+class ServerLimits:
+    """mock 서버의 처리 능력 모델 (처리 시간, 동시 처리 수, API key 별 rate limit, 오류율)"""
+
+    def __init__(self, latency: float = 0.0, capacity: int = 0, rate_limit: float = 0.0, fail_rate: float = 0.0):
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.fail_rate = fail_rate
+        self._slots = threading.BoundedSemaphore(capacity) if capacity > 0 else None
+        self._lock = threading.Lock()
+        self._buckets: dict[str, tuple[float, float]] = {}  # API key → (남은 토큰, 갱신 시각)
+
+    def admit(self, key: str) -> bool:
+        """API key 의 token bucket 에서 토큰 하나를 가져오면 True (burst = 1초 분량)"""
+        if self.rate_limit <= 0:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            tokens, updated = self._buckets.get(key, (self.rate_limit, now))
+            tokens = min(self.rate_limit, tokens + (now - updated) * self.rate_limit)
+            admitted = tokens >= 1
+            self._buckets[key] = (tokens - 1 if admitted else tokens, now)
+            return admitted
+
+    @contextmanager
+    def slot(self):
+        """처리 슬롯 하나를 잡고 latency 만큼 처리 시간을 흉내 냄 (슬롯이 없으면 대기)"""
+        if self._slots:
+            self._slots.acquire()
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            yield
+        finally:
+            if self._slots:
+                self._slots.release()
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # 헤더와 본문이 따로 나가도 지연 ACK 를 기다리지 않도록
+    workspace: MockWorkspace  # make_server 에서 주입
+    limits: ServerLimits
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body=None, headers: dict | None = None):
+        data = b"" if body is None else json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length)) if length else {}
+
+    def _handle(self, method: str):
+        url = urlparse(self.path)
+        if url.path.startswith("/storage/"):
+            return self._storage(method, url.path[len("/storage/"):])
+        match = API_PREFIX.match(url.path)
+        if not match:
+            return self._send(404, {"detail": "not found"})
+        # 거절하더라도 keep-alive 연결의 다음 요청을 위해 본문은 먼저 읽어 둠
+        body = self._body() if method in ("POST", "PATCH") else {}
+        if not self.limits.admit(self.headers.get("X-API-Key", "")):
+            return self._send(429, {"detail": "Request was throttled."}, {"Retry-After": "1"})
+        with self.limits.slot():
+            if self.limits.fail_rate and random.random() < self.limits.fail_rate:
+                return self._send(502, {"detail": "bad gateway"})
+            query = {k: v[0] for k, v in parse_qs(url.query).items()}
+            parts = [p for p in match.group(1).split("/") if p]
+            with self.workspace.lock:
+                status, result = self.route(method, parts, query, body)
+        self._respond(status, result)
+
+    def route(self, method: str, parts: list[str], query: dict, body: dict) -> tuple[int, object]:
+        ws = self.workspace
+        if parts == ["members"]:
+            return 200, ws.members
+        if parts == ["projects"]:
+            return 200, paginate(list(ws.projects.values()), query)
+        if len(parts) < 2 or parts[0] != "projects" or parts[1] not in ws.data:
+            return 404, {"detail": "not found"}
+        pid, rest = parts[1], parts[2:]
+        P = ws.data[pid]
+        if not rest:
+            return 200, ws.projects[pid]
+
+        kind = rest[0]
+        if kind in ("states", "labels", "cycles") and len(rest) == 1:
+            return 200, paginate(P[kind], query)
+        if kind == "estimates":
+            return 200, paginate([], query)
+        if kind == "cycles" and len(rest) == 3 and rest[2] == "cycle-issues":
+            links = P["cycle_links"].setdefault(rest[1], [])
+            if method == "GET":
+                return 200, paginate([P["items"][w] for w in links if w in P["items"]], query)
+            ids = [i for i in body.get("issues", []) if i not in links]
+            links.extend(ids)
+            return 201, [{"issue": i, "cycle": rest[1]} for i in ids]
+        if kind == "modules":
+            return self._modules(method, P, rest[1:], query, body)
+        if kind == "work-items":
+            return self._work_items(method, pid, P, rest[1:], query, body)
+        return 404, {"detail": "not found"}
+
+    def _modules(self, method: str, P: dict, rest: list[str], query: dict, body: dict) -> tuple[int, object]:
+        if not rest:
+            if method == "GET":
+                return 200, paginate(list(P["modules"].values()), query)
+            module = {**body, "id": _new_id(), "updated_at": _now()}
+            P["modules"][module["id"]] = module
+            P["module_links"][module["id"]] = []
+            return 201, module
+        module_id = rest[0]
+        if module_id not in P["modules"]:
+            return 404, {"detail": "not found"}
+        if len(rest) == 1:
+            if method == "DELETE":
+                P["modules"].pop(module_id)
+                P["module_links"].pop(module_id, None)
+                return 204, None
+            if method == "PATCH":
+                P["modules"][module_id].update(body, updated_at=_now())
+            return 200, P["modules"][module_id]
+        if rest[1] != "module-issues":
+            return 404, {"detail": "not found"}
+        links = P["module_links"][module_id]
+        if len(rest) == 3 and method == "DELETE":
+            if rest[2] in links:
+                links.remove(rest[2])
+            return 204, None
+        if method == "GET":
+            return 200, paginate([P["items"][w] for w in links if w in P["items"]], query)
+        ids = [i for i in body.get("issues", []) if i not in links]
+        links.extend(ids)
+        return 201, [{"issue": i, "module": module_id} for i in ids]
+
+    def _work_items(self, method: str, pid: str, P: dict, rest: list[str], query: dict,
+                    body: dict) -> tuple[int, object]:
+        if not rest:
+            if method == "POST":
+                return 201, self.workspace._create_item(pid, body)
+            rows = list(P["items"].values())
+            for field in ("external_id", "external_source"):
+                if field in query:
+                    rows = [r for r in rows if r.get(field) == query[field]]
+            order_by = query.get("order_by")
+            if order_by:
+                rows.sort(key=lambda r: r.get(order_by.lstrip("-")) or "", reverse=order_by.startswith("-"))
+            return 200, paginate(rows, query)
+
+        work_item_id = rest[0]
+        if work_item_id not in P["items"]:
+            return 404, {"detail": "not found"}
+        if len(rest) == 1:
+            if method == "DELETE":
+                P["items"].pop(work_item_id)
+                for store in (P["comments"], P["activities"], P["attachments"]):
+                    store.pop(work_item_id, None)
+                return 204, None
+            if method == "PATCH":
+                P["items"][work_item_id].update(body, updated_at=_now())
+            return 200, P["items"][work_item_id]
+
+        sub = rest[1]
+        if sub in ("comments", "activities"):
+            rows = P[sub].setdefault(work_item_id, [])
+            if len(rest) == 3 and method == "PATCH":
+                for row in rows:
+                    if row["id"] == rest[2]:
+                        row.update(body)
+                        return 200, row
+                return 404, {"detail": "not found"}
+            if method == "GET":
+                return 200, paginate(rows, query)
+            row = {**body, "id": _new_id(), "created_at": _now()}
+            rows.append(row)
+            return 201, row
+        if sub == "attachments":
+            return self._attachments(method, pid, P["attachments"].setdefault(work_item_id, []), rest[2:], body)
+        return 404, {"detail": "not found"}
+
+    def _attachments(self, method: str, pid: str, rows: list[dict], rest: list[str],
+                     body: dict) -> tuple[int, object]:
+        if not rest:
+            if method == "GET":
+                return 200, rows
+            attachment_id = _new_id()
+            key = f"{pid}/{attachment_id}"
+            rows.append({"id": attachment_id, "asset": key, "is_uploaded": False,
+                         "attributes": {"name": body.get("name"), "type": body.get("type"), "size": body.get("size")}})
+            host, port = self.server.server_address[:2]
+            return 201, {"upload_data": {"url": f"http://{host}:{port}/storage/upload", "fields": {"key": key}},
+                         "asset_id": attachment_id}
+        for row in rows:
+            if row["id"] == rest[0]:
+                if method == "PATCH":
+                    row["is_uploaded"] = True
+                    return 200, {}
+                return 302, {"Location": f"/storage/{row['asset']}"}
+        return 404, {"detail": "not found"}
+
+    def _storage(self, method: str, key: str):
+        if method == "POST" and key == "upload":
+            # multipart/form-data 에서 key 와 file 필드만 꺼냄
+            length = int(self.headers.get("Content-Length") or 0)
+            boundary = self.headers.get("Content-Type", "").split("boundary=")[-1].encode()
+            fields = {}
+            for part in self.rfile.read(length).split(b"--" + boundary):
+                name = re.search(rb'name="([^"]+)"', part)
+                if name and b"\r\n\r\n" in part:
+                    fields[name.group(1).decode()] = part.split(b"\r\n\r\n", 1)[1][:-2]
+            self.workspace.storage[fields["key"].decode()] = fields.get("file", b"")
+            return self._send(204)
+        data = self.workspace.storage.get(key)
+        if data is None:
+            return self._send(404, {"detail": "not found"})
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _respond(self, status: int, result):
+        if status == 302:
+            # 첨부 파일 다운로드는 저장소 URL 로 redirect
+            self.send_response(302)
+            self.send_header("Location", result["Location"])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._send(status, result)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+
+class MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # 부하 테스트의 동시 연결이 listen backlog 에서 끊기지 않도록
+
+
+def make_server(workspace: MockWorkspace, limits: ServerLimits | None = None, host: str = "127.0.0.1",
+                port: int = 8765) -> MockServer:
+    """mock 서버 생성 (port 0 이면 빈 포트, 실제 주소는 server.server_address)"""
+    handler = type("BoundMockHandler", (MockHandler,), {"workspace": workspace, "limits": limits or ServerLimits()})
+    return MockServer((host, port), handler)
+
+
+def start_background(items: int = 30, limits: ServerLimits | None = None) -> tuple[MockServer, str]:
+    """데이터를 채운 mock 서버를 빈 포트의 백그라운드 스레드로 시작 → (서버, base URL)"""
+    workspace = MockWorkspace()
+    workspace.seed(items)
+    server = make_server(workspace, limits, port=0)
+    threading.Thread(target=server.serve_forever, name="plane-mock", daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}"
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Plane API mock 서버 (로컬 테스트 / CI 용)")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="바인드 주소")
+    parser.add_argument("--port", type=int, default=8765, help="포트")
+    parser.add_argument("--items", type=int, default=30, help="소스 프로젝트(Src)에 만들 작업 아이템 수")
+    parser.add_argument("--latency", type=float, default=0.0, help="요청 하나의 처리 시간 (초)")
+    parser.add_argument("--capacity", type=int, default=0, help="동시에 처리할 요청 수 (0 이면 제한 없음)")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="API key 별 초당 요청 수 (넘으면 429, 0 이면 제한 없음)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="502 를 반환할 비율 (0~1)")
+    args = parser.parse_args(argv)
+
+    workspace = MockWorkspace()
+    workspace.seed(args.items)
+    server = make_server(workspace, ServerLimits(args.latency, args.capacity, args.rate_limit, args.fail_rate),
+                         args.host, args.port)
+    print(f"  ✓ mock 서버 대기 중: http://{args.host}:{args.port} (workspace 는 아무 값, 프로젝트 Src / Tgt)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n\n중단됨.")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
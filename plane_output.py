@@ -0,0 +1,89 @@
+"""
+Plane Output Writers
+====================
+report / health / bulk 결과를 레코드 단위로 바로 내보내는 스트리밍 writer 입니다.
+레코드가 계산되는 즉시 한 건씩 쓰고 flush 하므로, 다른 도구로 파이프할 때 첫 결과가 바로 도착하고
+전체 결과를 메모리에 모으지 않습니다.
+"""
+
+import csv
+import json
+import sys
+from typing import IO
+
+FORMATS = ("text", "jsonl", "csv", "json")
+
+
+class JsonlWriter:
+    """한 줄에 레코드 하나 (JSON Lines)"""
+
+    def __init__(self, stream: IO[str]):
+        self.stream = stream
+
+    def write(self, record: dict) -> None:
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+    def close(self) -> None:
+        self.stream.flush()
+
+
+class JsonWriter:
+    """JSON 배열. 여는 괄호와 각 레코드를 즉시 쓰고 close 에서 배열을 닫음"""
+
+    def __init__(self, stream: IO[str]):
+        self.stream = stream
+        self.count = 0
+
+    def write(self, record: dict) -> None:
+        prefix = "[\n  " if self.count == 0 else ",\n  "
+        self.stream.write(prefix + json.dumps(record, ensure_ascii=False))
+        self.stream.flush()
+        self.count += 1
+
+    def close(self) -> None:
+        self.stream.write("[]\n" if self.count == 0 else "\n]\n")
+        self.stream.flush()
+
+
+class CsvWriter:
+    """고정 컬럼 CSV. 목록 값은 '; ' 로 합치고 컬럼에 없는 키는 무시"""
+
+    def __init__(self, stream: IO[str], fieldnames: list[str]):
+        self.stream = stream
+        self.writer = csv.DictWriter(stream, fieldnames=fieldnames, extrasaction="ignore")
+        self.writer.writeheader()
+        self.stream.flush()
+
+    def write(self, record: dict) -> None:
+        row = {k: "; ".join(map(str, v)) if isinstance(v, list) else v for k, v in record.items()}
+        self.writer.writerow(row)
+        self.stream.flush()
+
+    def close(self) -> None:
+        self.stream.flush()
+
+
+def open_writer(fmt: str, fieldnames: list[str], stream: IO[str] | None = None):
+    """fmt(jsonl/csv/json)에 맞는 writer 생성 (text 는 각 도구가 직접 출력)"""
+    stream = stream or sys.stdout
+    if fmt == "jsonl":
+        return JsonlWriter(stream)
+    if fmt == "json":
+        return JsonWriter(stream)
+    if fmt == "csv":
+        return CsvWriter(stream, fieldnames)
+    raise ValueError(f"지원하지 않는 출력 형식입니다: {fmt}")
+
+
+def write_records(fmt: str, fieldnames: list[str], records, stream: IO[str] | None = None) -> int:
+    """레코드 iterable 을 writer 로 흘려보내고 건수 반환"""
+    writer = open_writer(fmt, fieldnames, stream)
+    count = 0
+    try:
+        for record in records:
+            writer.write(record)
+            count += 1
+    finally:
+        writer.close()
+    return count
@@ -0,0 +1,160 @@
+"""
+Plane Profiling
+===============
+긴 작업의 단계 / 모듈 / 작업 아이템 / HTTP 요청 / rate limit 대기 구간을 시간 span 으로 기록해
+Chrome trace(JSON) 로 저장합니다. chrome://tracing 또는 https://ui.perfetto.dev 에서 열면
+스레드별 타임라인으로 임계 경로와 유휴 구간을 볼 수 있습니다. 선택적으로 cProfile 결과(.prof)도 함께 남깁니다.
+
+    with Profiler("trace.json", cprofile=True):
+        migrate(...)
+
+활성화된 Profiler 가 없으면 span / phase 는 아무것도 기록하지 않습니다.
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+_active: "Profiler | None" = None
+
+
+def _now_us() -> float:
+    return time.perf_counter_ns() / 1000
+
+
+class Profiler:
+    """span 이벤트를 모아 Chrome trace 형식으로 저장
+
+    phase(level, ...) 는 같은 스레드에서 level 이상으로 열려 있던 구간을 닫고 새 구간을 여는 방식이라,
+    긴 함수의 단계 구분([1/7] → [2/7] ...)을 들여쓰기 변경 없이 표시할 수 있습니다.
+    """
+
+    def __init__(self, path: str, cprofile: bool = False):
+        self.path = path
+        self.events: list[dict] = []
+        self.pid = os.getpid()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._threads: dict[int, str] = {}
+        self._cprofile = cProfile.Profile() if cprofile else None
+        self._origin = _now_us()
+
+    # -- 기록 --
+    def record(self, name: str, cat: str, start_us: float, end_us: float, args: dict | None = None) -> None:
+        thread = threading.current_thread()
+        event = {"name": name, "cat": cat, "ph": "X", "pid": self.pid, "tid": thread.ident,
+                 "ts": round(start_us - self._origin, 1), "dur": round(end_us - start_us, 1)}
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+            self._threads.setdefault(thread.ident, thread.name)
+
+    @contextmanager
+    def span(self, name: str, cat: str = "span", **args):
+        start = _now_us()
+        try:
+            yield args
+        finally:
+            # 호출자가 yield 받은 args 에 결과(상태 코드 등)를 채워 넣을 수 있음
+            self.record(name, cat, start, _now_us(), args)
+
+    def phase(self, level: int, name: str, cat: str = "phase", **args) -> None:
+        stack = self._stack()
+        self.end_phase(level)
+        stack.append((level, name, cat, _now_us(), args))
+
+    def end_phase(self, level: int = 0) -> None:
+        stack = self._stack()
+        now = _now_us()
+        while stack and stack[-1][0] >= level:
+            _, name, cat, start, args = stack.pop()
+            self.record(name, cat, start, now, args)
+
+    def _stack(self) -> list:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    # -- 시작 / 종료 --
+    def start(self) -> "Profiler":
+        global _active
+        _active = self
+        if self._cprofile:
+            self._cprofile.enable()
+        return self
+
+    def stop(self) -> None:
+        global _active
+        if self._cprofile:
+            self._cprofile.disable()
+        self.end_phase(0)
+        _active = None
+        self.save()
+
+    def save(self) -> None:
+        with self._lock:
+            metadata = [{"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}}
+                        for tid, name in self._threads.items()]
+            events = metadata + sorted(self.events, key=lambda e: e["ts"])
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        print(f"  ✓ trace 저장됨: {self.path} (span {len(self.events)}개, chrome://tracing 또는 ui.perfetto.dev)",
+              file=sys.stderr)
+        if self._cprofile:
+            prof_path = os.path.splitext(self.path)[0] + ".prof"
+            self._cprofile.dump_stats(prof_path)
+            buf = io.StringIO()
+            pstats.Stats(self._cprofile, stream=buf).sort_stats("cumulative").print_stats(15)
+            print(f"  ✓ cProfile 저장됨: {prof_path} (메인 스레드, 누적 시간 상위 15개)", file=sys.stderr)
+            print(buf.getvalue(), file=sys.stderr)
+
+    def summary(self) -> dict[str, tuple[int, float]]:
+        """카테고리별 (span 수, 합계 초)"""
+        totals: dict[str, list] = {}
+        with self._lock:
+            for e in self.events:
+                entry = totals.setdefault(e["cat"], [0, 0.0])
+                entry[0] += 1
+                entry[1] += e["dur"] / 1e6
+        return {cat: (count, round(seconds, 3)) for cat, (count, seconds) in totals.items()}
+
+    def __enter__(self) -> "Profiler":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+# -- 계측 지점에서 쓰는 함수 (활성 Profiler 가 없으면 바로 반환) --
+def span(name: str, cat: str = "span", **args):
+    return _active.span(name, cat, **args) if _active else nullcontext(args)
+
+
+def phase(level: int, name: str, cat: str = "phase", **args) -> None:
+    if _active:
+        _active.phase(level, name, cat, **args)
+
+
+def end_phase(level: int = 0) -> None:
+    if _active:
+        _active.end_phase(level)
+
+
+def record(name: str, cat: str, start: float, end: float) -> None:
+    """time.perf_counter() 로 잰 구간 기록 (대기처럼 끝난 뒤에야 기록 여부를 아는 구간)"""
+    if _active:
+        _active.record(name, cat, start * 1e6, end * 1e6)
+
+
+def profiling(path: str | None, cprofile: bool = False):
+    """path 가 있으면 Profiler, 없으면 아무것도 하지 않는 context manager"""
+    return Profiler(path, cprofile) if path else nullcontext()
@@ -0,0 +1,290 @@
+"""
+Plane Progress Reporting
+========================
+긴 작업의 단계(stage)별 진행 수, 처리 속도(items/s), API 요청 속도(req/s), 429 백오프 대기, ETA 를 보여줍니다.
+
+터미널(TTY)에서는 stderr 에 한 줄짜리 상태 표시줄을 계속 갱신하고(일반 출력은 그 위로 흘러감),
+파이프/파일로 출력할 때는 interval 초마다 key=value 형식의 로그 줄을 stderr 에 남깁니다.
+
+    with Progress("auto", apis=[api]) as progress:
+        for wi in progress.track(items, "복제", total=len(items)):
+            ...
+"""
+
+import os
+import shutil
+import sys
+import threading
+import time
+import unicodedata
+from collections import deque
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from plane_client import PlaneAPI
+
+MODES = ("auto", "live", "log", "off")
+RATE_WINDOW = 30.0  # 속도 계산에 쓰는 최근 구간 (초)
+
+
+def format_duration(seconds: float) -> str:
+    seconds = int(max(0, seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m"
+    if minutes:
+        return f"{minutes}m{secs:02d}s"
+    return f"{secs}s"
+
+
+def _display_width(text: str) -> int:
+    return sum(2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1 for ch in text)
+
+
+def _truncate(text: str, width: int) -> str:
+    """터미널 폭을 넘으면 줄바꿈되어 상태 줄을 지울 수 없으므로 표시 폭 기준으로 자름"""
+    if _display_width(text) <= width:
+        return text
+    out, used = [], 0
+    for ch in text:
+        w = 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+        if used + w > width - 1:
+            break
+        out.append(ch)
+        used += w
+    return "".join(out) + "…"
+
+
+class RateWindow:
+    """누적 카운터의 최근 window 초 동안 변화량으로 초당 속도 계산"""
+
+    def __init__(self, window: float = RATE_WINDOW):
+        self.window = window
+        self.samples: deque[tuple[float, int]] = deque()
+
+    def rate(self, value: int, now: float) -> float:
+        self.samples.append((now, value))
+        while len(self.samples) > 2 and now - self.samples[0][0] > self.window:
+            self.samples.popleft()
+        first_at, first_value = self.samples[0]
+        return (value - first_value) / (now - first_at) if now > first_at else 0.0
+
+
+class Stage:
+    """파이프라인 단계 하나의 진행 상태 (total 을 모르면 ETA 없음)"""
+
+    def __init__(self, name: str, total: int | None = None):
+        self.name = name
+        self.total = total
+        self.done = 0
+        self.failed = 0
+        self.started = time.monotonic()
+        self.finished: float | None = None
+        self._lock = threading.Lock()
+        self._rate = RateWindow()
+
+    def advance(self, n: int = 1, failed: bool = False) -> None:
+        with self._lock:
+            self.done += n
+            if failed:
+                self.failed += n
+
+    def finish(self) -> None:
+        if self.finished is None:
+            self.finished = time.monotonic()
+
+    def rate(self, now: float) -> float:
+        if self.finished is not None:
+            elapsed = self.finished - self.started
+            return self.done / elapsed if elapsed > 0 else 0.0
+        # 단계 시작 시점을 기준점으로 두어 첫 샘플부터 속도가 나오도록 함
+        if not self._rate.samples:
+            self._rate.samples.append((self.started, 0))
+        return self._rate.rate(self.done, now)
+
+
+class _LiveStream:
+    """상태 표시줄이 떠 있는 터미널에 쓰는 출력이 상태 줄과 섞이지 않도록 지우고 다시 그림"""
+
+    def __init__(self, target, progress: "Progress"):
+        self.target = target
+        self.progress = progress
+
+    def write(self, text: str) -> int:
+        with self.progress._lock:
+            self.progress._clear()
+            written = self.target.write(text)
+            if text.endswith("\n"):
+                self.target.flush()
+                self.progress._draw()
+        return written
+
+    def flush(self) -> None:
+        self.target.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.target, name)
+
+
+class Progress:
+    """여러 단계와 API 클라이언트의 진행 상황을 모아 주기적으로 표시
+
+    mode: auto(stderr 가 터미널이면 live, 아니면 log) / live / log / off
+    apis: 요청 수(request_count), 429 횟수(throttle_count), 백오프(backoff_until)를 읽을 PlaneAPI 목록
+    """
+
+    def __init__(self, mode: str = "auto", apis: Iterable["PlaneAPI"] = (), stream=None,
+                 interval: float | None = None):
+        self.stream = stream or sys.stderr
+        if mode == "auto":
+            mode = "live" if self.stream.isatty() else "log"
+        self.mode = mode
+        if interval is None:
+            interval = 0.5 if mode == "live" else float(os.environ.get("PLANE_PROGRESS_INTERVAL", "30"))
+        self.interval = interval
+        self.apis = list(apis)
+        self.stages: list[Stage] = []
+        self.current: Stage | None = None
+        self._requests = RateWindow()
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._saved_streams: tuple | None = None
+        self._shown = False
+
+    # -- 단계 --
+    def stage(self, name: str, total: int | None = None) -> Stage:
+        """새 단계 시작 (이전 단계는 종료 처리)"""
+        if self.current:
+            self.current.finish()
+        stage = Stage(name, total)
+        with self._lock:
+            self.stages.append(stage)
+            self.current = stage
+        return stage
+
+    def track(self, iterable: Iterable, name: str, total: int | None = None):
+        """iterable 을 그대로 반환하면서 호출자가 항목 하나를 처리하고 넘어갈 때마다 진행 수 증가"""
+        if total is None and hasattr(iterable, "__len__"):
+            total = len(iterable)
+        stage = self.stage(name, total)
+        try:
+            for item in iterable:
+                yield item
+                stage.advance()
+        finally:
+            stage.finish()
+
+    # -- 상태 --
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        requests_total = sum(getattr(api, "request_count", 0) for api in self.apis)
+        throttled = sum(getattr(api, "throttle_count", 0) for api in self.apis)
+        backoff = max((getattr(api, "backoff_until", 0.0) - now for api in self.apis), default=0.0)
+        record = {
+            "stage": None, "done": 0, "total": None, "items_s": 0.0, "eta_s": None,
+            "requests": requests_total, "req_s": round(self._requests.rate(requests_total, now), 2),
+            "throttled": throttled, "backoff_s": round(max(0.0, backoff), 1),
+        }
+        stage = self.current
+        if stage:
+            rate = stage.rate(now)
+            record.update(stage=stage.name, done=stage.done, total=stage.total, items_s=round(rate, 2),
+                          elapsed_s=round((stage.finished or now) - stage.started, 1))
+            if stage.total is not None and rate > 0 and stage.finished is None:
+                record["eta_s"] = round(max(0, stage.total - stage.done) / rate)
+        return record
+
+    def render_line(self, record: dict | None = None) -> str:
+        r = record or self.snapshot()
+        if r["stage"] is None:
+            return f"⏳ {r['req_s']:.1f} req/s"
+        count = f"{r['done']}/{r['total']}" if r["total"] is not None else f"{r['done']}"
+        if r["total"]:
+            count += f" ({r['done'] * 100 // r['total']}%)"
+        parts = [f"⏳ {r['stage']} {count}", f"{r['items_s']:.1f} items/s", f"{r['req_s']:.1f} req/s"]
+        if r["backoff_s"] > 0:
+            parts.append(f"429 대기 {format_duration(r['backoff_s'])}")
+        if r["eta_s"] is not None:
+            parts.append(f"ETA {format_duration(r['eta_s'])}")
+        return " | ".join(parts)
+
+    def log_line(self, record: dict | None = None) -> str:
+        r = record or self.snapshot()
+        fields = [f"[progress] {datetime.now().isoformat(timespec='seconds')}"]
+        for key in ("stage", "done", "total", "items_s", "req_s", "requests", "throttled", "backoff_s"):
+            if r.get(key) is not None:
+                fields.append(f"{key}={r[key]}")
+        fields.append(f"eta={format_duration(r['eta_s']) if r['eta_s'] is not None else '-'}")
+        return " ".join(fields)
+
+    # -- 출력 --
+    def _clear(self) -> None:
+        if self._shown:
+            self.stream.write("\r\x1b[K")
+            self._shown = False
+
+    def _draw(self) -> None:
+        if self.current is None:
+            # 첫 단계 전(모듈 선택 입력 등)에는 상태 줄을 그리지 않음
+            return
+        width = shutil.get_terminal_size((100, 20)).columns - 1
+        self.stream.write("\r\x1b[K" + _truncate(self.render_line(), width))
+        self.stream.flush()
+        self._shown = True
+
+    def emit(self) -> None:
+        with self._lock:
+            if self.mode == "live":
+                self._draw()
+            elif self.mode == "log":
+                self.stream.write(self.log_line() + "\n")
+                self.stream.flush()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.emit()
+            except Exception:
+                # 진행 표시 실패가 본 작업을 멈추지 않도록 무시
+                pass
+
+    def start(self) -> "Progress":
+        if self.mode == "off" or self._thread:
+            return self
+        if self.mode == "live":
+            # 같은 터미널로 가는 stdout / stderr 출력은 상태 줄을 지운 뒤 쓰고 다시 그림
+            self._saved_streams = (sys.stdout, sys.stderr)
+            if sys.stdout.isatty():
+                sys.stdout = _LiveStream(sys.stdout, self)
+            if sys.stderr.isatty():
+                sys.stderr = _LiveStream(sys.stderr, self)
+        self._thread = threading.Thread(target=self._run, name="plane-progress", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if not self._thread:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        if self.current:
+            self.current.finish()
+        with self._lock:
+            if self.mode == "live":
+                self._clear()
+                self.stream.flush()
+                sys.stdout, sys.stderr = self._saved_streams
+            elif self.stages:
+                # 마지막 단계의 최종 처리량을 한 줄 남김
+                self.stream.write(self.log_line() + "\n")
+                self.stream.flush()
+
+    def __enter__(self) -> "Progress":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
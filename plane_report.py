@@ -8,30 +8,28 @@ Plane Reporting Tool
 import argparse
 import sys
 import os
-from plane_client import PlaneAPI, load_env_manual
+from typing import TYPE_CHECKING
+from plane_env import load_env_manual
+from plane_output import FORMATS, write_records
+from plane_progress import MODES, Progress
+from plane_snapshot import link_id
 
-def generate_report(api: PlaneAPI, project_name: str):
-    print(f"\n{'='*60}")
-    print(f"  Plane Project Report: {project_name}")
-    print(f"{'='*60}\n")
+if TYPE_CHECKING:
+    from plane_client import PlaneAPI
 
-    # 1. 프로젝트 정보 조회
-    project = api.find_project_by_name(project_name)
-    if not project:
-        print(f"  ✗ 프로젝트 '{project_name}'를 찾을 수 없습니다.")
-        return
-    
+# CSV 출력 컬럼 (overall / module / assignee 레코드 공통)
+REPORT_FIELDS = ["type", "project", "name", "done", "total", "progress", "status", "open",
+                 "backlog", "unstarted", "started", "completed", "cancelled"]
+
+
+def iter_report(api: "PlaneAPI", project: dict, progress: Progress | None = None):
+    """리포트 레코드(overall → module → assignee)를 계산되는 순서대로 반환"""
     pid = project['id']
-    print(f"  [Project] {project['name']} ({project.get('identifier', 'N/A')})")
-    
-    # 2. 통계 데이터 수집
-    print("  데이터 수집 중...")
+    project_name = project['name']
+
     states = api.list_states(pid)
-    state_map = {s['id']: s['name'] for s in states}
     state_group_map = {s['id']: s['group'] for s in states} # backlog, unstarted, started, completed, cancelled
-    
-    modules = api.list_modules(pid)
-    work_items = api.list_work_items(pid)
+
     members = api.list_members()
     member_map = {}
     for m in members:
@@ -42,81 +40,166 @@ def generate_report(api: PlaneAPI, project_name: str):
             full_name = f"{user.get('first_name', '')} {user.get('last_name', '')}".strip()
             member_map[uid] = full_name or user.get('email', 'Unknown')
 
-    # 3. 진행 현황 (Overall Stats)
-    total_count = len(work_items)
+    if hasattr(api, "report_records"):
+        # 컬럼 스냅샷은 작업 아이템을 복원하지 않고 컬럼 위에서 집계
+        yield from api.report_records(project, member_map)
+        return
+
+    # 작업 아이템은 페이지 단위로 흘려보내며 집계만 유지 (전체 목록을 메모리에 두지 않음)
+    total_count = 0
     group_stats = {"backlog": 0, "unstarted": 0, "started": 0, "completed": 0, "cancelled": 0}
-    
+    wi_group_map = {}  # 이슈 ID -> 상태 그룹 (모듈별 완료 집계용)
+    assignee_stats = {}
+
+    work_items = api.iter_work_items(pid)
+    if progress:
+        work_items = progress.track(work_items, "작업 아이템 집계")
     for wi in work_items:
-        sid = wi.get('state')
-        group = state_group_map.get(sid, "unstarted")
+        total_count += 1
+        group = state_group_map.get(wi.get('state'), "unstarted")
         group_stats[group] = group_stats.get(group, 0) + 1
+        wi_group_map[wi['id']] = group
 
-    completed = group_stats.get('completed', 0)
-    progress = (completed / total_count * 100) if total_count > 0 else 0
+        if group in ['completed', 'cancelled']:
+            continue
+        assignees = wi.get('assignees', [])
+        if not assignees:
+            assignee_stats['Unassigned'] = assignee_stats.get('Unassigned', 0) + 1
+        else:
+            for aid in assignees:
+                name = member_map.get(aid, "Unknown")
+                assignee_stats[name] = assignee_stats.get(name, 0) + 1
 
-    # 이슈 ID -> 상태 그룹 매핑 생성 (정확한 통계를 위해)
-    wi_group_map = {}
-    for wi in work_items:
-        sid = wi.get('state')
-        wi_group_map[wi['id']] = state_group_map.get(sid, "unstarted")
+    completed = group_stats.get('completed', 0)
+    overall_pct = (completed / total_count * 100) if total_count > 0 else 0
+    yield {"type": "overall", "project": project_name, "name": project_name, "done": completed,
+           "total": total_count, "progress": round(overall_pct, 1), **group_stats}
 
-    print("\n  📊 진행 현황 (Overall)")
-    print(f"    - Total Issues: {total_count}")
-    print(f"    - Completed: {completed}")
-    print(f"    - Progress: {progress:.1f}%")
-    
-    print("\n  📂 모듈별 현황")
-    if not modules:
-        print("    (모듈 없음)")
-    for m in modules:
+    for m in api.list_modules(pid):
         m_issues = api.list_module_work_items(pid, m['id'])
         m_total = len(m_issues)
         m_done = 0
         for mi in m_issues:
-            # mi에서 이슈 ID 추출 (v1 API 호환성)
-            mi_id = mi.get('issue') or mi.get('work_item') or mi.get('id')
+            mi_id = link_id(mi)
             if mi_id and wi_group_map.get(mi_id) == 'completed':
                 m_done += 1
-        
-        m_progress = (m_done / m_total * 100) if m_total > 0 else 0
-        print(f"    • {m['name']:<20} | {m_done}/{m_total} | {m_progress:>5.1f}% | Status: {m.get('status', 'N/A')}")
 
-    print("\n  👤 담당자별 남은 작업 (Uncompleted)")
-    assignee_stats = {}
-    for wi in work_items:
-        sid = wi.get('state')
-        if state_group_map.get(sid) in ['completed', 'cancelled']:
-            continue
-        
-        assignees = wi.get('assignees', [])
-        if not assignees:
-            assignee_stats['Unassigned'] = assignee_stats.get('Unassigned', 0) + 1
-        else:
-            for aid in assignees:
-                name = member_map.get(aid, "Unknown")
-                assignee_stats[name] = assignee_stats.get(name, 0) + 1
+        m_progress = (m_done / m_total * 100) if m_total > 0 else 0
+        yield {"type": "module", "project": project_name, "name": m['name'], "done": m_done,
+               "total": m_total, "progress": round(m_progress, 1), "status": m.get('status', 'N/A')}
 
     for name, count in sorted(assignee_stats.items(), key=lambda x: x[1], reverse=True):
-        print(f"    • {name:<20}: {count} issues")
+        yield {"type": "assignee", "project": project_name, "name": name, "open": count}
+
+
+def generate_report(api: "PlaneAPI", project_name: str, fmt: str = "text", stream=None,
+                    progress: Progress | None = None):
+    if fmt != "text":
+        project = api.find_project_by_name(project_name)
+        if not project:
+            print(f"  ✗ 프로젝트 '{project_name}'를 찾을 수 없습니다.", file=sys.stderr)
+            return
+        write_records(fmt, REPORT_FIELDS, iter_report(api, project, progress), stream)
+        return
+
+    print(f"\n{'='*60}")
+    print(f"  Plane Project Report: {project_name}")
+    print(f"{'='*60}\n")
+
+    # 1. 프로젝트 정보 조회
+    project = api.find_project_by_name(project_name)
+    if not project:
+        print(f"  ✗ 프로젝트 '{project_name}'를 찾을 수 없습니다.")
+        return
+    
+    print(f"  [Project] {project['name']} ({project.get('identifier', 'N/A')})")
+    
+    # 2. 통계 데이터 수집 및 출력
+    print("  데이터 수집 중...")
+    has_modules = False
+    assignee_header = False
+    for record in iter_report(api, project, progress):
+        if record['type'] == 'overall':
+            print("\n  📊 진행 현황 (Overall)")
+            print(f"    - Total Issues: {record['total']}")
+            print(f"    - Completed: {record['done']}")
+            print(f"    - Progress: {record['progress']:.1f}%")
+            print("\n  📂 모듈별 현황")
+        elif record['type'] == 'module':
+            has_modules = True
+            print(f"    • {record['name']:<20} | {record['done']}/{record['total']} | {record['progress']:>5.1f}% | Status: {record['status']}")
+        elif record['type'] == 'assignee':
+            if not assignee_header:
+                if not has_modules:
+                    print("    (모듈 없음)")
+                print("\n  👤 담당자별 남은 작업 (Uncompleted)")
+                assignee_header = True
+            print(f"    • {record['name']:<20}: {record['open']} issues")
+
+    if not assignee_header:
+        if not has_modules:
+            print("    (모듈 없음)")
+        print("\n  👤 담당자별 남은 작업 (Uncompleted)")
 
     print(f"\n{'='*60}")
 
-def main():
+def generate_analytics(api: "PlaneAPI", project_name: str, fmt: str = "text", stream=None,
+                       cache_dir: str = ".plane_cache", workers: int = 8, days: int = 30):
+    """활동 캐시 기반 번다운 / 사이클 타임 리포트"""
+    from plane_analytics import ANALYTICS_FIELDS, iter_analytics, print_analytics
+
+    project = api.find_project_by_name(project_name)
+    if not project:
+        print(f"  ✗ 프로젝트 '{project_name}'를 찾을 수 없습니다.", file=sys.stderr if fmt != "text" else sys.stdout)
+        return
+    records = iter_analytics(api, project, cache_dir, workers, days)
+    if fmt != "text":
+        write_records(fmt, ANALYTICS_FIELDS, records, stream)
+        return
+
+    print(f"\n{'='*60}")
+    print(f"  Plane Analytics: {project['name']} (최근 {days}일)")
+    print(f"{'='*60}\n")
+    print_analytics(records)
+    print(f"\n{'='*60}")
+
+def main(argv: list[str] | None = None):
     load_env_manual()
     parser = argparse.ArgumentParser(description="Plane Project Reporting Tool")
     parser.add_argument("--project", type=str, default=os.environ.get("PLANE_SOURCE_PROJECT"), help="리포트를 생성할 프로젝트 이름")
     parser.add_argument("--base-url", type=str, default=os.environ.get("PLANE_BASE_URL"), help="Plane URL")
     parser.add_argument("--api-key", type=str, default=os.environ.get("PLANE_API_KEY"), help="API Key")
     parser.add_argument("--workspace", type=str, default=os.environ.get("PLANE_WORKSPACE_SLUG"), help="Workspace Slug")
+    parser.add_argument("--snapshot", type=str, default=None, help="API 대신 사용할 스냅샷 파일 (plane_snapshot.py 로 생성)")
+    parser.add_argument("--format", type=str, choices=FORMATS, default="text", help="출력 형식 (jsonl/csv/json 은 레코드 단위 스트리밍)")
+    parser.add_argument("--analytics", action="store_true", help="번다운 / 사이클 타임 리포트 (활동 캐시 사용)")
+    parser.add_argument("--cache-dir", type=str, default=os.environ.get("PLANE_CACHE_DIR", ".plane_cache"), help="활동 캐시 디렉터리")
+    parser.add_argument("--days", type=int, default=30, help="번다운 기간 (일)")
+    parser.add_argument("--workers", type=int, default=8, help="활동 동시 조회 수")
+    parser.add_argument("--progress", type=str, choices=MODES, default=os.environ.get("PLANE_PROGRESS", "auto"), help="진행 표시 (auto/live/log/off, stderr 로 출력)")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-    if not args.api_key or not args.project:
-        print("Error: API Key와 Project 이름이 필요합니다.")
+    if not (args.api_key or args.snapshot) or not args.project:
+        print("Error: API Key(또는 --snapshot)와 Project 이름이 필요합니다.")
         sys.exit(1)
 
-    api = PlaneAPI(args.base_url, args.api_key, args.workspace)
-    generate_report(api, args.project)
+    if args.analytics:
+        # 활동 내역은 스냅샷에 없으므로 API 로 조회 (변경된 아이템만)
+        if not args.api_key:
+            print("Error: --analytics 는 API Key 가 필요합니다.")
+            sys.exit(1)
+        from plane_client import PlaneAPI
+        api = PlaneAPI(args.base_url, args.api_key, args.workspace)
+        generate_analytics(api, args.project, args.format, cache_dir=args.cache_dir,
+                           workers=args.workers, days=args.days)
+        return
+
+    from plane_snapshot import open_reader
+    api = open_reader(args.snapshot, args.base_url, args.api_key, args.workspace)
+    # 스냅샷은 API 요청이 없어 바로 끝나므로 진행 표시 생략
+    with Progress("off" if args.snapshot else args.progress, apis=[api]) as progress:
+        generate_report(api, args.project, args.format, progress=progress)
 
 if __name__ == "__main__":
     main()
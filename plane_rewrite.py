@@ -0,0 +1,78 @@
+"""
+Plane Reference Rewriter
+========================
+복제한 설명(description_html)과 댓글(comment_html) 안의 소스 참조를 대상 값으로 바꿉니다.
+
+- 멤버 멘션(`<mention-component entity_identifier="...">`), 작업 아이템 / 프로젝트 링크의 UUID
+- `SRC-12` 같은 프로젝트 식별자 + 번호 참조
+- 다른 인스턴스 / workspace 로 복제할 때 링크의 `https://소스/workspace/` 경로
+
+모든 참조를 하나의 미리 컴파일된 정규식으로 찾아 문서당 한 번만 훑으며, 매핑에 없는 값은 그대로 둡니다.
+"""
+
+import re
+from typing import Mapping
+
+UUID_PATTERN = r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+
+
+class ReferenceRewriter:
+    """소스 → 대상 참조 치환기
+
+    ids: 소스 UUID → 대상 UUID (멤버, 프로젝트, 작업 아이템). 복제가 진행되며 채워지는 dict 를 그대로 넘기면
+         이후 호출부터 새 매핑이 반영됩니다.
+    src_identifier / tgt_identifier: 프로젝트 식별자 (예: "SRC" → "TGT")
+    src_ids_by_sequence: 소스 번호 → 소스 작업 아이템 ID
+    tgt_sequences: 대상 작업 아이템 ID → 대상 번호
+    prefixes: 바꿀 링크 경로 앞부분 (예: "https://old.example.com/ws/" → "https://new.example.com/ws2/")
+    """
+
+    def __init__(self, ids: Mapping[str, str], src_identifier: str | None = None,
+                 tgt_identifier: str | None = None, src_ids_by_sequence: Mapping[int, str] | None = None,
+                 tgt_sequences: Mapping[str, int] | None = None, prefixes: Mapping[str, str] | None = None):
+        self.ids = ids
+        self.src_identifier = src_identifier
+        self.tgt_identifier = tgt_identifier
+        # 복제 중 채워지는 dict 를 그대로 참조해야 하므로 빈 dict 도 교체하지 않음
+        self.src_ids_by_sequence = src_ids_by_sequence if src_ids_by_sequence is not None else {}
+        self.tgt_sequences = tgt_sequences if tgt_sequences is not None else {}
+        self.prefixes = dict(prefixes or {})
+        alternatives = [f"(?P<uuid>{UUID_PATTERN})"]
+        if self.prefixes:
+            # 긴 경로가 먼저 맞도록 정렬
+            ordered = sorted(self.prefixes, key=len, reverse=True)
+            alternatives.insert(0, "(?P<prefix>" + "|".join(re.escape(p) for p in ordered) + ")")
+        if src_identifier and tgt_identifier:
+            alternatives.append(rf"\b{re.escape(src_identifier)}-(?P<seq>\d+)\b")
+        self._pattern = re.compile("|".join(alternatives))
+
+    def rewrite(self, html: str, pending: set[str] | frozenset = frozenset()) -> tuple[str, bool]:
+        """참조를 치환한 HTML 과, pending(아직 복제되지 않았지만 이번 실행에서 복제될 소스 ID)을
+        가리키는 참조가 남아 있는지 여부를 반환"""
+        if not html:
+            return html, False
+        unresolved = False
+
+        def replace(match: re.Match) -> str:
+            nonlocal unresolved
+            if match.lastgroup == "prefix":
+                return self.prefixes[match.group(0)]
+            uuid = match.group("uuid")
+            if uuid:
+                key = uuid.lower()
+                target = self.ids.get(key)
+                if target:
+                    return target
+                if key in pending:
+                    unresolved = True
+                return uuid
+            src_id = self.src_ids_by_sequence.get(int(match.group("seq")))
+            target_id = self.ids.get(src_id) if src_id else None
+            sequence = self.tgt_sequences.get(target_id) if target_id else None
+            if sequence is not None:
+                return f"{self.tgt_identifier}-{sequence}"
+            if src_id in pending:
+                unresolved = True
+            return match.group(0)
+
+        return self._pattern.sub(replace, html), unresolved
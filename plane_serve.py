@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Plane Query Daemon
+==================
+선택한 프로젝트의 데이터를 메모리에 유지(warm cache)하면서 백그라운드에서 변경분만 갱신하고,
+report / health / bulk 조회를 로컬 HTTP 또는 Unix 소켓으로 바로 응답합니다.
+
+Usage:
+    python plane_serve.py --project "프로젝트명" --port 8765
+    python plane_serve.py --project "A" --project "B" --socket /tmp/plane.sock
+
+    curl "http://127.0.0.1:8765/report?project=프로젝트명"
+    curl "http://127.0.0.1:8765/health?project=프로젝트명&level=2"
+    curl "http://127.0.0.1:8765/bulk?project=프로젝트명&group=started&format=jsonl"
+    curl --unix-socket /tmp/plane.sock "http://localhost/status"
+
+Plane webhook 을 POST /webhook 으로 받으면 다음 갱신을 기다리지 않고 즉시 반영합니다.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from plane_client import PlaneAPI, load_env_manual
+from plane_snapshot import Snapshot, take_snapshot, update_project, fetch_project
+from plane_report import generate_report
+from plane_health import check_health
+from plane_bulk import bulk_list_issues
+from plane_output import FORMATS
+from plane_webhook import WebhookReceiver
+
+BULK_GROUPS = ("backlog", "unstarted", "started", "completed", "cancelled")
+CONTENT_TYPES = {
+    "text": "text/plain; charset=utf-8",
+    "jsonl": "application/x-ndjson; charset=utf-8",
+    "csv": "text/csv; charset=utf-8",
+    "json": "application/json; charset=utf-8",
+}
+
+
+class QueryOutput:
+    """스레드별로 stdout 을 바꿔 끼우는 stream
+
+    text 조회를 처리하는 스레드의 출력만 그 응답 버퍼로 보내고, 갱신 / webhook 스레드와
+    클라이언트 경고 등 그 외 출력은 원래 stdout(데몬 로그)으로 보냅니다.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    @contextlib.contextmanager
+    def capture(self):
+        self.local.buffer = buf = io.StringIO()
+        try:
+            yield buf
+        finally:
+            self.local.buffer = None
+
+    def write(self, text: str) -> int:
+        return (getattr(self.local, "buffer", None) or self.stream).write(text)
+
+    def flush(self) -> None:
+        (getattr(self.local, "buffer", None) or self.stream).flush()
+
+    def __getattr__(self, name):
+        # isatty / encoding 등은 원래 stream 의 것을 사용
+        return getattr(self.stream, name)
+
+
+_output_lock = threading.Lock()
+
+
+def _query_output() -> QueryOutput:
+    """sys.stdout 을 QueryOutput 으로 한 번만 교체 (process 전체의 stdout 을 조회마다 바꾸지 않음)"""
+    with _output_lock:
+        if not isinstance(sys.stdout, QueryOutput):
+            sys.stdout = QueryOutput(sys.stdout)
+        return sys.stdout
+
+
+class WarmModel:
+    """메모리에 유지되는 스냅샷과 백그라운드 갱신 상태"""
+
+    def __init__(self, api: PlaneAPI, project_names: list[str], snapshot_path: str | None = None,
+                 interval: float = 300, full_every: int = 12, webhook_secret: str | None = None):
+        self.api = api
+        self.project_names = project_names
+        self.snapshot_path = snapshot_path
+        self.interval = interval
+        self.full_every = full_every
+        self.snapshot = Snapshot()
+        self.receiver = WebhookReceiver(self.snapshot, webhook_secret)
+        self.refresh_count = 0
+        self.last_refresh: str | None = None
+        self.last_error: str | None = None
+        self.last_changed = 0
+        self._stop = threading.Event()
+
+    def load(self) -> None:
+        """저장된 스냅샷이 있으면 그것으로 시작하고, 없으면 전체 수집"""
+        if self.snapshot_path and os.path.exists(self.snapshot_path):
+            self.snapshot = Snapshot.load(self.snapshot_path)
+            missing = [n for n in self.project_names if not self.snapshot.find_project_by_name(n)]
+            if missing:
+                self.snapshot.projects.update(take_snapshot(self.api, missing).projects)
+            print(f"  ✓ 스냅샷에서 시작: {self.snapshot_path} (taken_at: {self.snapshot.taken_at})")
+            self.refresh()
+        else:
+            self.snapshot = take_snapshot(self.api, self.project_names)
+            self._mark_refreshed(sum(len(p["work_items"]) for p in self.snapshot.projects.values()))
+        self.receiver.snapshot = self.snapshot
+
+    def refresh(self, full: bool = False) -> None:
+        """변경분 갱신. full 이면 삭제 반영을 위해 전체 재수집
+
+        webhook 처리 스레드도 같은 스냅샷을 고치므로 스냅샷 변경은 receiver.lock 안에서 수행합니다.
+        """
+        lock = self.receiver.lock
+        with lock:
+            projects = list(self.snapshot.projects.items())
+        changed = 0
+        for pid, p in projects:
+            if full:
+                # 전체 재수집은 조회가 길어 조회는 lock 밖에서, 교체만 lock 안에서
+                fresh = fetch_project(self.api, p["project"])
+                with lock:
+                    self.snapshot.set_project(**fresh)
+                    changed += len(self.snapshot.projects[pid]["work_items"])
+            else:
+                # 변경분 조회도 lock 밖에서, 반영만 lock 안에서 (update_project 내부)
+                changed += update_project(self.api, self.snapshot, pid, lock)
+        # webhook 으로 들어온 댓글 등 직접 반영할 수 없었던 변경 재조회 (내부에서 lock 사용)
+        changed += self.receiver.flush_stale(self.api)
+        members = self.api.list_members()
+        with lock:
+            self.snapshot.members = members
+        self._mark_refreshed(changed)
+
+    def _mark_refreshed(self, changed: int) -> None:
+        self.refresh_count += 1
+        self.last_changed = changed
+        self.last_refresh = datetime.now().isoformat(timespec="seconds")
+        with self.receiver.lock:
+            self.snapshot.taken_at = self.last_refresh
+        if self.snapshot_path:
+            self.snapshot.save(self.snapshot_path, self.receiver.lock)
+
+    def run_refresher(self) -> None:
+        while not self._stop.wait(self.interval):
+            full = self.full_every > 0 and self.refresh_count % self.full_every == 0
+            try:
+                self.refresh(full=full)
+                self.last_error = None
+                print(f"  • [{self.last_refresh}] {'전체' if full else '변경분'} 갱신: {self.last_changed}개")
+            except Exception as e:
+                # 일시적인 API 오류로 데몬이 죽지 않도록 기록만 하고 다음 주기에 재시도
+                self.last_error = f"{type(e).__name__}: {e}"
+                print(f"  ⚠ 갱신 실패: {self.last_error}")
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def status(self) -> dict:
+        status = {
+            "projects": [p["project"]["name"] for p in self.snapshot.projects.values()],
+            "work_items": sum(len(p["work_items"]) for p in self.snapshot.projects.values()),
+            "refresh_count": self.refresh_count,
+            "last_refresh": self.last_refresh,
+            "last_changed": self.last_changed,
+            "last_error": self.last_error,
+            "interval": self.interval,
+            "webhook_events": self.receiver.applied,
+            "api_requests": self.api.request_count,
+            "hedged_requests": self.api.hedge_count,
+        }
+        if self.api.key_pool:
+            status["api_keys"] = self.api.key_pool.status()
+        return status
+
+    def render(self, func, *args, fmt: str = "text") -> str:
+        """기존 도구 함수의 출력을 문자열로 반환 (text 는 이 스레드의 stdout 캡처, 나머지는 writer 출력)"""
+        if fmt != "text":
+            buf = io.StringIO()
+            func(self.snapshot, *args, fmt=fmt, stream=buf)
+            return buf.getvalue()
+        with _query_output().capture() as buf:
+            func(self.snapshot, *args)
+        return buf.getvalue()
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    model: WarmModel  # make_server 에서 주입
+
+    def log_message(self, format, *args):
+        # Unix 소켓에서는 client_address 가 비어 있으므로 기본 로그를 쓰지 않음
+        pass
+
+    def _send(self, status: int, body: str, content_type: str = "text/plain; charset=utf-8"):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        route = url.path.rstrip("/") or "/status"
+        project = query.get("project") or os.environ.get("PLANE_SOURCE_PROJECT")
+
+        if route == "/status":
+            self._send(200, json.dumps(self.model.status(), ensure_ascii=False), "application/json")
+            return
+        if route not in ("/report", "/health", "/bulk"):
+            self._send(404, f"unknown path: {url.path}\n")
+            return
+        if not project:
+            self._send(400, "project 파라미터가 필요합니다.\n")
+            return
+        fmt = query.get("format", "text")
+        if fmt not in FORMATS:
+            self._send(400, f"format 은 {', '.join(FORMATS)} 중 하나여야 합니다.\n")
+            return
+
+        if route == "/report":
+            body = self.model.render(generate_report, project, fmt=fmt)
+        elif route == "/health":
+            level = query.get("level", "0")
+            if level not in ("0", "1", "2", "3"):
+                self._send(400, "level 은 0~3 이어야 합니다.\n")
+                return
+            body = self.model.render(check_health, project, int(level), fmt=fmt)
+        else:
+            group = query.get("group", "completed")
+            if group not in BULK_GROUPS:
+                self._send(400, f"group 은 {', '.join(BULK_GROUPS)} 중 하나여야 합니다.\n")
+                return
+            body = self.model.render(bulk_list_issues, project, group, fmt=fmt)
+        self._send(200, body, CONTENT_TYPES[fmt])
+
+    def do_POST(self):
+        if urlparse(self.path).path.rstrip("/") != "/webhook":
+            self._send(404, f"unknown path: {self.path}\n")
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        status, message = self.model.receiver.handle(self.headers, self.rfile.read(length))
+        self._send(status, message + "\n")
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(model: WarmModel, host: str = "127.0.0.1", port: int = 8765,
+                socket_path: str | None = None):
+    handler = type("BoundQueryHandler", (QueryHandler,), {"model": model})
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        return ThreadingUnixHTTPServer(socket_path, handler)
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv: list[str] | None = None):
+    load_env_manual()
+    parser = argparse.ArgumentParser(description="Plane Query Daemon (warm cache + local query API)")
+    parser.add_argument("--project", type=str, action="append", help="메모리에 유지할 프로젝트 이름 (여러 번 지정 가능)")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="HTTP 바인드 주소")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PLANE_SERVE_PORT", "8765")), help="HTTP 포트")
+    parser.add_argument("--socket", type=str, default=None, help="HTTP 대신 사용할 Unix 소켓 경로")
+    parser.add_argument("--interval", type=float, default=300, help="변경분 갱신 주기 (초)")
+    parser.add_argument("--full-every", type=int, default=12, help="N번 갱신마다 전체 재수집 (삭제 반영용, 0이면 사용 안 함)")
+    parser.add_argument("--snapshot", type=str, default=None, help="시작 시 불러오고 갱신마다 저장할 스냅샷 파일")
+    parser.add_argument("--webhook-secret", type=str, default=os.environ.get("PLANE_WEBHOOK_SECRET"), help="POST /webhook 서명 검증용 secret")
+    parser.add_argument("--base-url", type=str, default=os.environ.get("PLANE_BASE_URL"), help="Plane URL")
+    parser.add_argument("--api-key", type=str, default=os.environ.get("PLANE_API_KEY"), help="API Key")
+    parser.add_argument("--workspace", type=str, default=os.environ.get("PLANE_WORKSPACE_SLUG"), help="Workspace Slug")
+
+    args = parser.parse_args(argv)
+
+    projects = args.project or [p for p in [os.environ.get("PLANE_SOURCE_PROJECT")] if p]
+    if not args.api_key or not projects:
+        print("Error: API Key와 Project 이름이 필요합니다.")
+        sys.exit(1)
+
+    api = PlaneAPI(args.base_url, args.api_key, args.workspace)
+    model = WarmModel(api, projects, args.snapshot, args.interval, args.full_every, args.webhook_secret)
+    print("  데이터 적재 중...")
+    started = time.monotonic()
+    model.load()
+    print(f"  ✓ 적재 완료 ({time.monotonic() - started:.1f}s, 작업 아이템 {model.status()['work_items']}개)")
+
+    server = make_server(model, args.host, args.port, args.socket)
+    refresher = threading.Thread(target=model.run_refresher, name="plane-refresher", daemon=True)
+    refresher.start()
+    where = args.socket or f"http://{args.host}:{args.port}"
+    print(f"  ✓ 조회 API 대기 중: {where} (/report, /health, /bulk, /status, POST /webhook)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n\n중단됨.")
+    finally:
+        model.stop()
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+    main()
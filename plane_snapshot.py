@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Plane Snapshot Tool
+===================
+프로젝트 데이터(상태, 모듈, 작업 아이템, 모듈 연결, 주기, 멤버)를 로컬 파일로 저장하고,
+저장된 스냅샷을 PlaneAPI 와 같은 조회 인터페이스로 다시 읽어옵니다.
+
+report / health / bulk 도구는 --snapshot 옵션으로 API 호출 없이 스냅샷을 사용할 수 있습니다.
+
+Usage:
+    python plane_snapshot.py --project "프로젝트명" --output snapshot.json.gz
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import threading
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Any, TYPE_CHECKING
+from plane_env import load_env_manual
+
+if TYPE_CHECKING:
+    from plane_client import PlaneAPI
+
+SNAPSHOT_VERSION = 1
+
+
+def _open(path: str, mode: str, compressed: bool | None = None):
+    if compressed is None:
+        compressed = path.endswith(".gz")
+    if compressed:
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _by_id(items: list[dict]) -> dict[str, dict]:
+    return {item["id"]: item for item in items if item.get("id")}
+
+
+def link_id(row: dict) -> str | None:
+    """module-issues / cycle-issues 응답 행에서 작업 아이템 ID 추출 (v1 API 호환성)"""
+    return row.get("issue") or row.get("work_item") or row.get("id")
+
+
+class Snapshot:
+    """스냅샷 데이터를 PlaneAPI 조회 메서드와 같은 형태로 제공하는 읽기 모델"""
+
+    def __init__(self, data: dict | None = None):
+        data = data or {}
+        self.taken_at: str | None = data.get("taken_at")
+        self.members: list[dict] = data.get("members", [])
+        # project_id -> {"project", "states", "labels", "cycles", "modules", "work_items", "module_links"}
+        self.projects: dict[str, dict] = data.get("projects", {})
+
+    # -- 파일 입출력 --
+    @classmethod
+    def load(cls, path: str) -> "Snapshot":
+        with _open(path, "r") as f:
+            data = json.load(f)
+        if data.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"지원하지 않는 스냅샷 버전입니다: {data.get('version')}")
+        return cls(data)
+
+    def save(self, path: str, lock: "threading.Lock | None" = None) -> None:
+        """파일로 저장. 다른 스레드가 갱신 중이면 그 lock 을 주어 lock 안에서 직렬화하고 파일 쓰기는 lock 밖에서 수행"""
+        with lock or nullcontext():
+            text = json.dumps(self.to_dict(), ensure_ascii=False)
+        tmp_path = path + ".tmp"
+        with _open(tmp_path, "w", compressed=path.endswith(".gz")) as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def to_dict(self) -> dict:
+        return {
+            "version": SNAPSHOT_VERSION,
+            "taken_at": self.taken_at,
+            "members": self.members,
+            "projects": self.projects,
+        }
+
+    def set_project(self, project: dict, states: list[dict], labels: list[dict],
+                    cycles: list[dict], modules: list[dict], work_items: list[dict],
+                    module_links: dict[str, list[str]]) -> None:
+        self.projects[project["id"]] = {
+            "project": project,
+            "states": _by_id(states),
+            "labels": _by_id(labels),
+            "cycles": _by_id(cycles),
+            "modules": _by_id(modules),
+            "work_items": _by_id(work_items),
+            "module_links": module_links,
+        }
+
+    # -- 개별 레코드 반영 (webhook 등) --
+    # 조회 스레드가 동시에 읽을 수 있으므로 dict 는 키 단위로만 수정하고 list 는 새로 만들어 교체
+    def upsert(self, project_id: str, kind: str, record: dict) -> None:
+        """kind: states / labels / cycles / modules / work_items"""
+        p = self._project(project_id)
+        p[kind][record["id"]] = record
+        if kind == "modules":
+            p["module_links"].setdefault(record["id"], [])
+
+    def delete(self, project_id: str, kind: str, record_id: str) -> bool:
+        p = self._project(project_id)
+        if p[kind].pop(record_id, None) is None:
+            return False
+        if kind == "modules":
+            p["module_links"].pop(record_id, None)
+        elif kind == "work_items":
+            for mid, wids in list(p["module_links"].items()):
+                if record_id in wids:
+                    p["module_links"][mid] = [w for w in wids if w != record_id]
+        return True
+
+    def set_work_item_modules(self, project_id: str, work_item_id: str, module_ids: list[str]) -> None:
+        """작업 아이템이 속한 모듈 목록을 module_links 에 반영"""
+        p = self._project(project_id)
+        wanted = set(module_ids)
+        for mid, wids in list(p["module_links"].items()):
+            if mid in wanted and work_item_id not in wids:
+                p["module_links"][mid] = wids + [work_item_id]
+            elif mid not in wanted and work_item_id in wids:
+                p["module_links"][mid] = [w for w in wids if w != work_item_id]
+        for mid in wanted - set(p["module_links"]):
+            p["module_links"][mid] = [work_item_id]
+
+    def find_project_of(self, kind: str, record_id: str) -> str | None:
+        """레코드 ID 로 소속 프로젝트 ID 찾기 (payload 에 project 가 없을 때 사용)"""
+        for pid, p in self.projects.items():
+            if record_id in p[kind]:
+                return pid
+        return None
+
+    def _project(self, project_id: str) -> dict:
+        try:
+            return self.projects[project_id]
+        except KeyError:
+            raise KeyError(f"스냅샷에 프로젝트 '{project_id}' 가 없습니다.") from None
+
+    # -- Projects --
+    def list_projects(self) -> list[dict]:
+        return [p["project"] for p in self.projects.values()]
+
+    def find_project_by_name(self, name: str) -> dict | None:
+        for p in self.list_projects():
+            if p.get("name") == name or p.get("identifier") == name or p.get("id") == name:
+                return p
+        return None
+
+    # -- Modules --
+    def list_modules(self, project_id: str) -> list[dict]:
+        return list(self._project(project_id)["modules"].values())
+
+    def get_module(self, project_id: str, module_id: str) -> dict:
+        return self._project(project_id)["modules"][module_id]
+
+    def find_module_by_name(self, project_id: str, name: str) -> dict | None:
+        for m in self.list_modules(project_id):
+            if m.get("name") == name:
+                return m
+        return None
+
+    def list_module_work_items(self, project_id: str, module_id: str) -> list[dict]:
+        p = self._project(project_id)
+        work_items = p["work_items"]
+        return [work_items[wid] for wid in p["module_links"].get(module_id, []) if wid in work_items]
+
+    # -- Work Items --
+    def list_work_items(self, project_id: str) -> list[dict]:
+        return list(self._project(project_id)["work_items"].values())
+
+    def iter_work_items(self, project_id: str, order_by: str | None = None):
+        items = self.list_work_items(project_id)
+        if order_by:
+            key = order_by.lstrip("-")
+            items.sort(key=lambda wi: wi.get(key) or "", reverse=order_by.startswith("-"))
+        return iter(items)
+
+    def get_work_item(self, project_id: str, work_item_id: str) -> dict:
+        return self._project(project_id)["work_items"][work_item_id]
+
+    # -- States / Labels / Cycles --
+    def list_states(self, project_id: str) -> list[dict]:
+        return list(self._project(project_id)["states"].values())
+
+    def list_labels(self, project_id: str) -> list[dict]:
+        return list(self._project(project_id)["labels"].values())
+
+    def list_cycles(self, project_id: str) -> list[dict]:
+        return list(self._project(project_id)["cycles"].values())
+
+    # -- Workspace Members --
+    def list_members(self) -> list[dict]:
+        return self.members
+
+
+def open_reader(snapshot_path: str | None, base_url: str | None, api_key: str | None,
+                workspace_slug: str | None):
+    """스냅샷 경로가 있으면 Snapshot(.plcol 이면 ColumnarSnapshot), 없으면 PlaneAPI 를 반환
+    (requests 는 필요할 때만 import)"""
+    if snapshot_path and snapshot_path.endswith(".plcol"):
+        from plane_columnar import ColumnarSnapshot
+        return ColumnarSnapshot(snapshot_path)
+    if snapshot_path:
+        return Snapshot.load(snapshot_path)
+    from plane_client import PlaneAPI
+    return PlaneAPI(base_url, api_key, workspace_slug)
+
+
+def fetch_project(api: "PlaneAPI", project: dict) -> dict[str, Any]:
+    """한 프로젝트의 스냅샷 구성 데이터를 API 에서 수집"""
+    pid = project["id"]
+    modules = api.list_modules(pid)
+    module_links: dict[str, list[str]] = {}
+    for m in modules:
+        rows = api.list_module_work_items(pid, m["id"])
+        module_links[m["id"]] = [wid for wid in (link_id(r) for r in rows) if wid]
+    return {
+        "project": project,
+        "states": api.list_states(pid),
+        "labels": api.list_labels(pid),
+        "cycles": api.list_cycles(pid),
+        "modules": modules,
+        "work_items": api.list_work_items(pid),
+        "module_links": module_links,
+    }
+
+
+def update_project(api: "PlaneAPI", snapshot: Snapshot, project_id: str,
+                   lock: "threading.Lock | None" = None) -> int:
+    """스냅샷 이후 변경된 작업 아이템만 반영하고 변경 건수를 반환
+
+    updated_at 내림차순으로 조회하다가 기존 스냅샷의 최신 시각보다 오래된 항목을 만나면
+    페이지 요청을 멈춥니다. 서버가 정렬을 지원하지 않으면 전체 재수집으로 대체합니다.
+    삭제된 항목은 반영되지 않으므로 주기적인 전체 재수집(fetch_project)이 필요합니다.
+    다른 스레드가 스냅샷을 갱신 중이면 그 lock 을 주어 조회는 lock 밖에서, 반영만 lock 안에서 수행합니다.
+    """
+    with lock or nullcontext():
+        current = snapshot.projects[project_id]
+        project = current["project"]
+        watermark = max((wi.get("updated_at") or "" for wi in current["work_items"].values()), default="")
+        old_stamp = {mid: m.get("updated_at") for mid, m in current["modules"].items()}
+    update = _fetch_update(api, project, watermark, old_stamp)
+    with lock or nullcontext():
+        return _apply_update(snapshot, project_id, update)
+
+
+def _fetch_update(api: "PlaneAPI", project: dict, watermark: str,
+                  old_stamp: dict[str, str | None]) -> dict[str, Any]:
+    """update_project 의 조회 단계 (스냅샷은 읽거나 수정하지 않음)"""
+    if not watermark:
+        return {"full": fetch_project(api, project)}
+
+    project_id = project["id"]
+    changed: list[dict] = []
+    prev_ts = None
+    for wi in api.iter_work_items(project_id, order_by="-updated_at"):
+        ts = wi.get("updated_at") or ""
+        if prev_ts is not None and ts > prev_ts:
+            # 정렬이 적용되지 않은 응답 → 조기 종료를 신뢰할 수 없음
+            return {"full": fetch_project(api, project)}
+        prev_ts = ts
+        if ts < watermark:
+            break
+        changed.append(wi)
+
+    modules = api.list_modules(project_id)
+
+    # 모듈 연결은 변경된 아이템이 있거나 모듈 목록이 달라졌을 때만 다시 조회
+    module_links = None
+    module_stamp = {m["id"]: m.get("updated_at") for m in modules}
+    if changed or module_stamp != old_stamp:
+        module_links = {}
+        for m in modules:
+            rows = api.list_module_work_items(project_id, m["id"])
+            module_links[m["id"]] = [wid for wid in (link_id(r) for r in rows) if wid]
+
+    return {
+        "changed": changed,
+        "modules": modules,
+        "module_links": module_links,
+        "states": api.list_states(project_id),
+        "labels": api.list_labels(project_id),
+        "cycles": api.list_cycles(project_id),
+    }
+
+
+def _apply_update(snapshot: Snapshot, project_id: str, update: dict[str, Any]) -> int:
+    """조회한 변경분을 스냅샷에 반영 (조회 사이에 webhook 으로 들어온 더 새로운 항목은 유지)"""
+    if "full" in update:
+        snapshot.set_project(**update["full"])
+        return len(snapshot.projects[project_id]["work_items"])
+
+    current = snapshot.projects[project_id]
+    work_items = dict(current["work_items"])
+    for wi in update["changed"]:
+        cached = work_items.get(wi["id"])
+        if cached and (cached.get("updated_at") or "") > (wi.get("updated_at") or ""):
+            continue
+        work_items[wi["id"]] = wi
+
+    # 조회 중인 스레드가 있을 수 있으므로 기존 dict 를 수정하지 않고 새로 만들어 교체
+    snapshot.set_project(
+        project=current["project"],
+        states=update["states"],
+        labels=update["labels"],
+        cycles=update["cycles"],
+        modules=update["modules"],
+        work_items=list(work_items.values()),
+        module_links=current["module_links"] if update["module_links"] is None else update["module_links"],
+    )
+    return len(update["changed"])
+
+
+def take_snapshot(api: "PlaneAPI", project_names: list[str]) -> Snapshot:
+    """지정한 프로젝트들의 현재 상태를 Snapshot 으로 수집"""
+    snapshot = Snapshot()
+    snapshot.members = api.list_members()
+    for name in project_names:
+        project = api.find_project_by_name(name)
+        if not project:
+            print(f"  ✗ 프로젝트 '{name}'를 찾을 수 없습니다.")
+            continue
+        print(f"  • {project['name']} 수집 중...")
+        snapshot.set_project(**fetch_project(api, project))
+    snapshot.taken_at = datetime.now().isoformat(timespec="seconds")
+    return snapshot
+
+
+def main(argv: list[str] | None = None):
+    load_env_manual()
+    parser = argparse.ArgumentParser(description="Plane Project Snapshot Tool")
+    parser.add_argument("--project", type=str, action="append", help="스냅샷할 프로젝트 이름 (여러 번 지정 가능)")
+    parser.add_argument("--update", action="store_true", help="기존 스냅샷 파일에서 변경된 작업 아이템만 갱신")
+    parser.add_argument("--output", "-o", type=str, default=os.environ.get("PLANE_SNAPSHOT", "snapshot.json.gz"), help="저장할 스냅샷 파일 경로 (.gz 이면 압축)")
+    parser.add_argument("--base-url", type=str, default=os.environ.get("PLANE_BASE_URL"), help="Plane URL")
+    parser.add_argument("--api-key", type=str, default=os.environ.get("PLANE_API_KEY"), help="API Key")
+    parser.add_argument("--workspace", type=str, default=os.environ.get("PLANE_WORKSPACE_SLUG"), help="Workspace Slug")
+
+    args = parser.parse_args(argv)
+
+    projects = args.project or [p for p in [os.environ.get("PLANE_SOURCE_PROJECT")] if p]
+    if not args.api_key or not (projects or args.update):
+        print("Error: API Key와 Project 이름이 필요합니다.")
+        sys.exit(1)
+
+    from plane_client import PlaneAPI
+    api = PlaneAPI(args.base_url, args.api_key, args.workspace)
+    if args.update and os.path.exists(args.output):
+        snapshot = Snapshot.load(args.output)
+        for pid, p in list(snapshot.projects.items()):
+            changed = update_project(api, snapshot, pid)
+            print(f"  • {p['project']['name']}: {changed}개 변경 반영")
+        missing = [name for name in args.project or [] if not snapshot.find_project_by_name(name)]
+        if missing:
+            extra = take_snapshot(api, missing)
+            snapshot.projects.update(extra.projects)
+        snapshot.members = api.list_members()
+        snapshot.taken_at = datetime.now().isoformat(timespec="seconds")
+    else:
+        snapshot = take_snapshot(api, projects)
+    snapshot.save(args.output)
+    print(f"  ✓ 스냅샷 저장됨: {args.output} (프로젝트 {len(snapshot.projects)}개)")
+
+
+if __name__ == "__main__":
+    main()
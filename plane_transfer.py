@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Plane Work Item Transfer
+========================
+조건에 맞는 작업 아이템(예: 특정 레이블이 붙은 백로그 전체)을 JSONL 파일로 내보내고(export),
+JSONL 파일을 대상 프로젝트로 가져옵니다(import). 모듈 단위가 아닌 대량 이동용입니다.
+
+Usage:
+    python plane_transfer.py export --project "소스" --state-group backlog --label bug -o backlog.jsonl
+    python plane_transfer.py import backlog.jsonl --target "대상" --workers 4 --rate 2
+
+- export 는 페이지 단위로 조회하며 바로 파일에 쓰므로 작업 아이템 수와 관계없이 메모리 사용량이 일정합니다.
+  첫 줄은 상태 / 레이블 / 멤버 / 추정치 정보를 담은 header, 이후 한 줄에 작업 아이템 하나입니다.
+- import 는 파일을 (ID, parent) 만 읽어 부모 → 자식 깊이를 계산한 뒤, 깊이별로 파일을 다시 읽으며
+  동시에 생성합니다. 생성 결과는 <파일>.checkpoint 에 바로 기록되어 중단 후 다시 실행하면 이어서 진행합니다.
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterator
+from plane_env import load_env_manual
+from plane_progress import MODES, Progress
+
+if TYPE_CHECKING:
+    from plane_client import PlaneAPI
+
+TRANSFER_VERSION = 1
+
+
+def _active_estimate_id(api: "PlaneAPI", project: dict) -> str | None:
+    if project.get("estimate"):
+        return project["estimate"]
+    estimates = api.list_estimates(project["id"])
+    return estimates[0]["id"] if estimates else None
+
+
+# ──────────────────────────────────────────────────────────────
+#  Export
+# ──────────────────────────────────────────────────────────────
+
+def export_work_items(api: "PlaneAPI", project_name: str, path: str, state_groups: list[str] | None = None,
+                      label_names: list[str] | None = None, progress: Progress | None = None) -> int:
+    """조건에 맞는 작업 아이템을 JSONL 로 저장하고 건수를 반환 (state_groups / label_names 는 OR 조건)"""
+    project = api.find_project_by_name(project_name)
+    if not project:
+        raise ValueError(f"프로젝트 '{project_name}'를 찾을 수 없습니다.")
+    pid = project["id"]
+    states = api.list_states(pid)
+    labels = api.list_labels(pid)
+
+    wanted_states = {s["id"] for s in states if s["group"] in state_groups} if state_groups else None
+    wanted_labels = None
+    if label_names:
+        wanted_labels = {lbl["id"] for lbl in labels if lbl["name"] in label_names}
+        missing = set(label_names) - {lbl["name"] for lbl in labels}
+        if missing:
+            print(f"  ⚠ 레이블을 찾을 수 없습니다: {', '.join(sorted(missing))}")
+
+    estimate_id = _active_estimate_id(api, project)
+    header = {
+        "type": "header",
+        "version": TRANSFER_VERSION,
+        "exported_at": datetime.now().isoformat(timespec="seconds"),
+        "source": {"base_url": api.base_url, "workspace_slug": api.workspace_slug},
+        "project": project,
+        "states": states,
+        "labels": labels,
+        "members": api.list_members(),
+        "estimate_points": api.list_estimate_points(pid, estimate_id) if estimate_id else [],
+        "filters": {"state_groups": state_groups or [], "labels": label_names or []},
+    }
+
+    count = 0
+    tmp_path = path + ".tmp"
+    work_items = api.iter_work_items(pid)
+    if progress:
+        work_items = progress.track(work_items, "내보내기")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(header, ensure_ascii=False) + "\n")
+        for wi in work_items:
+            if wanted_states is not None and wi.get("state") not in wanted_states:
+                continue
+            if wanted_labels is not None and not wanted_labels.intersection(wi.get("labels") or []):
+                continue
+            f.write(json.dumps(wi, ensure_ascii=False) + "\n")
+            count += 1
+    os.replace(tmp_path, path)
+    return count
+
+
+# ──────────────────────────────────────────────────────────────
+#  Import
+# ──────────────────────────────────────────────────────────────
+
+def read_header(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+    if header.get("type") != "header" or header.get("version") != TRANSFER_VERSION:
+        raise ValueError(f"지원하지 않는 전송 파일입니다: {path}")
+    return header
+
+
+def iter_file_items(path: str) -> Iterator[dict]:
+    """header 다음 줄부터 작업 아이템을 한 줄씩 반환"""
+    with open(path, "r", encoding="utf-8") as f:
+        f.readline()
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def compute_depths(path: str) -> dict[str, int]:
+    """파일의 (ID, parent) 만으로 부모 → 자식 깊이 계산 (파일에 없는 부모는 루트로 취급)"""
+    from plane_migrate import topological_sort
+
+    links = [{"id": wi["id"], "parent": wi.get("parent")} for wi in iter_file_items(path)]
+    depths: dict[str, int] = {}
+    for link in topological_sort(links):
+        parent = link["parent"]
+        depths[link["id"]] = depths[parent] + 1 if parent in depths else 0
+    return depths
+
+
+class Checkpoint:
+    """소스 ID → 대상 ID 기록 (한 줄에 하나씩 바로 append, 다시 실행하면 이어서 진행)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.mapping: dict[str, str] = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # 중단 시 마지막 줄이 잘렸을 수 있음
+                        continue
+                    self.mapping[entry["src"]] = entry["tgt"]
+        self._file = open(path, "a", encoding="utf-8")
+
+    def add(self, src_id: str, tgt_id: str) -> None:
+        self.mapping[src_id] = tgt_id
+        self._file.write(json.dumps({"src": src_id, "tgt": tgt_id}) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def import_work_items(api: "PlaneAPI", path: str, target_project_name: str, workers: int = 4,
+                      dry_run: bool = False, progress: Progress | None = None) -> dict:
+    """JSONL 파일의 작업 아이템을 대상 프로젝트에 생성 → 요약 통계 반환"""
+    from plane_migrate import (build_member_names, build_name_mapping, build_state_mapping,
+                               build_user_mapping, build_work_item_payload, external_source_for,
+                               upsert_work_item)
+
+    progress = progress or Progress("off")
+    header = read_header(path)
+    target = api.find_project_by_name(target_project_name)
+    if not target:
+        raise ValueError(f"대상 프로젝트 '{target_project_name}'를 찾을 수 없습니다.")
+    tgt_pid = target["id"]
+
+    tgt_states = api.list_states(tgt_pid)
+    state_mapping = build_state_mapping(header["states"], tgt_states)
+    label_mapping = build_name_mapping(header["labels"], api.list_labels(tgt_pid))
+    user_mapping = build_user_mapping(header["members"], api.list_members())
+    member_names = build_member_names(header["members"])
+    estimate_mapping: dict[str, str] = {}
+    tgt_estimate_id = _active_estimate_id(api, target)
+    if header["estimate_points"] and tgt_estimate_id:
+        tgt_points = {str(p["value"]): p["id"] for p in api.list_estimate_points(tgt_pid, tgt_estimate_id)}
+        estimate_mapping = {p["id"]: tgt_points[str(p["value"])] for p in header["estimate_points"]
+                            if str(p["value"]) in tgt_points}
+    default_state_id = tgt_states[0]["id"] if tgt_states else None
+    external_source = external_source_for(header["project"]["id"])
+    print(f"  ✓ 매핑: States {len(state_mapping)}, Labels {len(label_mapping)}, Users {len(user_mapping)}, "
+          f"Estimate Points {len(estimate_mapping)}")
+
+    depths = compute_depths(path)
+    levels = max(depths.values(), default=-1) + 1
+    checkpoint = Checkpoint(path + ".checkpoint")
+    done = checkpoint.mapping
+    remaining = sum(1 for wid in depths if wid not in done)
+    print(f"  ✓ 작업 아이템 {len(depths)}개 (깊이 {levels}단계), 이미 가져옴 {len(depths) - remaining}개, "
+          f"남음 {remaining}개")
+    summary = {"total": len(depths), "skipped": len(depths) - remaining, "created": 0, "updated": 0,
+               "unchanged": 0, "failed": 0}
+    if dry_run:
+        checkpoint.close()
+        print("  [DRY-RUN] 실제 생성 없음")
+        return summary
+
+    def create(wi: dict) -> tuple[dict, str, dict]:
+        payload = build_work_item_payload(wi, state_mapping, label_mapping, user_mapping, estimate_mapping,
+                                          default_state_id, member_names)
+        if wi.get("parent") in done:
+            payload["parent"] = done[wi["parent"]]
+        payload["external_source"] = external_source
+        payload["external_id"] = wi["id"]
+        action, target_item, _ = upsert_work_item(api, tgt_pid, payload)
+        return wi, action, target_item
+
+    stage = progress.stage("가져오기", total=remaining)
+    window = max(1, workers) * 2
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            # 부모가 먼저 만들어지도록 깊이별로 파일을 다시 읽으며 처리 (한 번에 window 개까지만 대기)
+            for level in range(levels):
+                pending = set()
+                for wi in iter_file_items(path):
+                    if depths.get(wi["id"]) != level or wi["id"] in done:
+                        continue
+                    pending.add(pool.submit(create, wi))
+                    while len(pending) >= window:
+                        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        _collect(finished, checkpoint, summary, stage)
+                while pending:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    _collect(finished, checkpoint, summary, stage)
+    finally:
+        checkpoint.close()
+        stage.finish()
+    return summary
+
+
+def _collect(finished, checkpoint: Checkpoint, summary: dict, stage) -> None:
+    import requests
+
+    for future in finished:
+        try:
+            wi, action, target_item = future.result()
+        except requests.HTTPError as e:
+            summary["failed"] += 1
+            stage.advance(failed=True)
+            print(f"    ✗ {e}")
+            continue
+        checkpoint.add(wi["id"], target_item["id"])
+        summary[action] += 1
+        stage.advance()
+
+
+def main(argv: list[str] | None = None):
+    load_env_manual()
+    parser = argparse.ArgumentParser(description="Plane 작업 아이템 JSONL 내보내기 / 가져오기")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    exp = sub.add_parser("export", help="조건에 맞는 작업 아이템을 JSONL 로 저장")
+    exp.add_argument("--project", type=str, default=os.environ.get("PLANE_SOURCE_PROJECT"), help="소스 프로젝트 이름")
+    exp.add_argument("--state-group", type=str, action="append",
+                     choices=["backlog", "unstarted", "started", "completed", "cancelled"],
+                     help="상태 그룹 (여러 번 지정 가능, 없으면 전체)")
+    exp.add_argument("--label", type=str, action="append", help="레이블 이름 (여러 번 지정 가능, 하나라도 붙은 항목)")
+    exp.add_argument("--output", "-o", type=str, required=True, help="저장할 JSONL 파일 경로")
+
+    imp = sub.add_parser("import", help="JSONL 파일의 작업 아이템을 대상 프로젝트에 생성")
+    imp.add_argument("file", type=str, help="export 로 만든 JSONL 파일")
+    imp.add_argument("--target", type=str, default=os.environ.get("PLANE_TARGET_PROJECT"), help="대상 프로젝트 이름")
+    imp.add_argument("--workers", type=int, default=4, help="동시에 생성할 작업 아이템 수")
+    imp.add_argument("--rate", type=float, default=float(os.environ.get("PLANE_RATE_LIMIT", "1.0")), help="초당 요청 수")
+    imp.add_argument("--burst", type=int, default=5, help="순간적으로 허용할 최대 요청 수")
+    imp.add_argument("--dry-run", action="store_true", help="매핑과 남은 건수만 확인")
+
+    for p in (exp, imp):
+        p.add_argument("--progress", type=str, choices=MODES, default=os.environ.get("PLANE_PROGRESS", "auto"), help="진행 표시 (auto/live/log/off, stderr 로 출력)")
+        p.add_argument("--base-url", type=str, default=os.environ.get("PLANE_BASE_URL"), help="Plane URL")
+        p.add_argument("--api-key", type=str, default=os.environ.get("PLANE_API_KEY"), help="API Key")
+        p.add_argument("--workspace", type=str, default=os.environ.get("PLANE_WORKSPACE_SLUG"), help="Workspace Slug")
+
+    args = parser.parse_args(argv)
+    if not args.api_key:
+        print("Error: API Key가 필요합니다.")
+        sys.exit(1)
+
+    from plane_client import PlaneAPI, RateLimiter, host_limiter
+
+    try:
+        if args.command == "export":
+            if not args.project:
+                print("Error: --project 가 필요합니다.")
+                sys.exit(1)
+            api = PlaneAPI(args.base_url, args.api_key, args.workspace)
+            with Progress(args.progress, apis=[api]) as progress:
+                count = export_work_items(api, args.project, args.output, args.state_group, args.label, progress)
+            print(f"  ✓ {count}개 작업 아이템 저장됨: {args.output} (요청 {api.request_count}회)")
+            return
+
+        if not args.target:
+            print("Error: --target 이 필요합니다.")
+            sys.exit(1)
+        limiter = host_limiter(args.base_url, args.api_key, args.burst) or RateLimiter(args.rate, args.burst)
+        api = PlaneAPI(args.base_url, args.api_key, args.workspace, limiter=limiter)
+        with Progress(args.progress, apis=[api]) as progress:
+            summary = import_work_items(api, args.file, args.target, args.workers, args.dry_run, progress)
+    except (OSError, ValueError) as e:
+        print(f"  ✗ {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print("\n\n중단됨. 다시 실행하면 checkpoint 부터 이어서 진행합니다.")
+        sys.exit(1)
+
+    print(f"  ✓ 생성 {summary['created']}, 갱신 {summary['updated']}, 변경 없음 {summary['unchanged']}, "
+          f"건너뜀 {summary['skipped']}, 실패 {summary['failed']}")
+    if summary["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
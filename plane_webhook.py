@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Plane Webhook Receiver
+======================
+Plane webhook 이벤트(issue, issue_comment, module, cycle)를 받아 로컬 스냅샷에
+upsert / delete 로 바로 반영합니다. 누락된 이벤트에 대비해 낮은 빈도의 전체 재수집(reconciliation)을
+함께 수행합니다.
+
+Usage:
+    python plane_webhook.py --snapshot snapshot.json.gz --port 8766 --secret "webhook-secret"
+    python plane_webhook.py --snapshot snapshot.json.gz --replay recorded_events.jsonl
+
+--replay 파일은 한 줄에 하나의 webhook payload(JSON) 또는
+{"headers": {...}, "body": {...}} 형태의 기록을 담습니다. 서버 없이 이벤트 반영을 검증할 때 사용합니다.
+"""
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+from plane_env import load_env_manual
+from plane_snapshot import Snapshot, fetch_project
+
+if TYPE_CHECKING:
+    from plane_client import PlaneAPI
+
+# webhook event → 스냅샷 컬렉션
+EVENT_KINDS = {
+    "issue": "work_items",
+    "module": "modules",
+    "cycle": "cycles",
+}
+
+
+def verify_signature(secret: str, body: bytes, signature: str | None) -> bool:
+    """X-Plane-Signature 헤더(HMAC-SHA256 hex) 검증"""
+    if not signature:
+        return False
+    expected = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature)
+
+
+def _action(payload: dict) -> str:
+    """create/created/update/updated/delete/deleted 를 upsert 또는 delete 로 정규화"""
+    action = str(payload.get("action", "")).lower()
+    return "delete" if action.startswith("delet") else "upsert"
+
+
+def _project_id(data: dict) -> str | None:
+    return data.get("project") or data.get("project_id")
+
+
+class WebhookReceiver:
+    """webhook payload 를 스냅샷에 반영하고, 직접 반영할 수 없는 변경은 stale 로 기록"""
+
+    def __init__(self, snapshot: Snapshot, secret: str | None = None):
+        self.snapshot = snapshot
+        self.secret = secret
+        # 댓글처럼 스냅샷에 없는 데이터의 변경 → 해당 작업 아이템을 다시 조회해야 함
+        self.stale: dict[str, set[str]] = {}
+        self.applied = 0
+        self.dirty = False
+        self.lock = threading.Lock()
+
+    def apply(self, payload: dict) -> str:
+        """payload 하나를 반영하고 처리 결과를 한 줄로 반환"""
+        event = payload.get("event")
+        data = payload.get("data") or {}
+        if not isinstance(data, dict):
+            return f"ignored {event} (data is not an object)"
+        record_id = data.get("id")
+
+        with self.lock:
+            if event == "issue_comment":
+                wid = data.get("issue") or data.get("work_item")
+                pid = _project_id(data) or (wid and self.snapshot.find_project_of("work_items", wid))
+                if not wid or pid not in self.snapshot.projects:
+                    return f"ignored {event}"
+                self.stale.setdefault(pid, set()).add(wid)
+                return f"stale work_item {wid}"
+
+            kind = EVENT_KINDS.get(event)
+            if not kind or not record_id:
+                return f"ignored {event}"
+            pid = _project_id(data) or self.snapshot.find_project_of(kind, record_id)
+            if pid not in self.snapshot.projects:
+                return f"ignored {event} (project not in snapshot)"
+
+            if _action(payload) == "delete":
+                removed = self.snapshot.delete(pid, kind, record_id)
+                if kind == "work_items" and pid in self.stale:
+                    self.stale[pid].discard(record_id)
+                result = f"delete {kind} {record_id}" + ("" if removed else " (not cached)")
+            else:
+                self.snapshot.upsert(pid, kind, data)
+                if kind == "work_items" and isinstance(data.get("module_ids"), list):
+                    self.snapshot.set_work_item_modules(pid, record_id, data["module_ids"])
+                result = f"upsert {kind} {record_id}"
+            self.applied += 1
+            self.dirty = True
+            return result
+
+    def handle(self, headers, body: bytes) -> tuple[int, str]:
+        """HTTP 요청 하나 처리 → (status, message)"""
+        if self.secret and not verify_signature(self.secret, body, headers.get("X-Plane-Signature")):
+            return 403, "invalid signature"
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            return 400, "invalid json"
+        if not isinstance(payload, dict):
+            return 400, "payload is not a JSON object"
+        if not payload.get("event") and headers.get("X-Plane-Event"):
+            payload["event"] = headers.get("X-Plane-Event")
+        return 200, self.apply(payload)
+
+    def flush_stale(self, api: "PlaneAPI") -> int:
+        """stale 로 표시된 작업 아이템을 다시 조회해 반영"""
+        with self.lock:
+            pending, self.stale = self.stale, {}
+        refreshed = 0
+        for pid, wids in pending.items():
+            for wid in wids:
+                try:
+                    wi = api.get_work_item(pid, wid)
+                except Exception as e:
+                    print(f"  ⚠ 작업 아이템 {wid} 재조회 실패: {e}")
+                    with self.lock:
+                        self.stale.setdefault(pid, set()).add(wid)
+                    continue
+                with self.lock:
+                    self.snapshot.upsert(pid, "work_items", wi)
+                    self.dirty = True
+                refreshed += 1
+        return refreshed
+
+    def reconcile(self, api: "PlaneAPI") -> None:
+        """webhook 누락에 대비한 전체 재수집"""
+        with self.lock:
+            projects = list(self.snapshot.projects.items())
+        for pid, p in projects:
+            fresh = fetch_project(api, p["project"])
+            with self.lock:
+                self.snapshot.set_project(**fresh)
+                self.stale.pop(pid, None)
+                self.dirty = True
+
+
+def replay(receiver: WebhookReceiver, path: str) -> None:
+    """기록된 payload 파일(JSONL)을 순서대로 반영"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            if not isinstance(record, dict):
+                # 한 줄이 깨져도 나머지 기록은 계속 반영
+                print(f"    [{line_no}] skipped (not a JSON object)")
+                continue
+            if "body" in record:
+                body = record["body"]
+                if not isinstance(body, str):
+                    body = json.dumps(body)
+                status, message = receiver.handle(record.get("headers") or {}, body.encode("utf-8"))
+            else:
+                status, message = 200, receiver.apply(record)
+            print(f"    [{line_no}] {status} {message}")
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    receiver: WebhookReceiver  # make_server 에서 주입
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        status, message = self.receiver.handle(self.headers, self.rfile.read(length))
+        data = (message + "\n").encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def run_maintenance(receiver: WebhookReceiver, api: "PlaneAPI | None", snapshot_path: str,
+                    stop: threading.Event, save_interval: float, reconcile_interval: float) -> None:
+    """주기적으로 stale 재조회, 스냅샷 저장, 전체 재수집 수행"""
+    since_reconcile = 0.0
+    while not stop.wait(save_interval):
+        since_reconcile += save_interval
+        try:
+            if api and reconcile_interval > 0 and since_reconcile >= reconcile_interval:
+                receiver.reconcile(api)
+                since_reconcile = 0.0
+                print("  • 전체 재수집(reconciliation) 완료")
+            elif api:
+                receiver.flush_stale(api)
+            with receiver.lock:
+                dirty, receiver.dirty = receiver.dirty, False
+            if dirty:
+                # 저장 중에도 webhook 이 반영되므로 직렬화는 receiver.lock 안에서
+                receiver.snapshot.save(snapshot_path, receiver.lock)
+        except Exception as e:
+            # 저장 실패도 기록만 하고 다음 주기에 재시도 (유지보수 스레드가 멈추지 않도록)
+            with receiver.lock:
+                receiver.dirty = True
+            print(f"  ⚠ 유지보수 작업 실패: {type(e).__name__}: {e}")
+
+
+def main(argv: list[str] | None = None):
+    load_env_manual()
+    parser = argparse.ArgumentParser(description="Plane Webhook Receiver (snapshot invalidation)")
+    parser.add_argument("--snapshot", type=str, default=os.environ.get("PLANE_SNAPSHOT", "snapshot.json.gz"), help="이벤트를 반영할 스냅샷 파일")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="바인드 주소")
+    parser.add_argument("--port", type=int, default=8766, help="포트")
+    parser.add_argument("--secret", type=str, default=os.environ.get("PLANE_WEBHOOK_SECRET"), help="webhook 서명 검증용 secret")
+    parser.add_argument("--replay", type=str, default=None, help="기록된 payload(JSONL)를 반영하고 종료")
+    parser.add_argument("--save-interval", type=float, default=30, help="변경된 스냅샷 저장 및 stale 재조회 주기 (초)")
+    parser.add_argument("--reconcile-interval", type=float, default=6 * 3600, help="전체 재수집 주기 (초, 0이면 사용 안 함)")
+    parser.add_argument("--base-url", type=str, default=os.environ.get("PLANE_BASE_URL"), help="Plane URL")
+    parser.add_argument("--api-key", type=str, default=os.environ.get("PLANE_API_KEY"), help="API Key")
+    parser.add_argument("--workspace", type=str, default=os.environ.get("PLANE_WORKSPACE_SLUG"), help="Workspace Slug")
+
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.snapshot):
+        print(f"Error: 스냅샷 파일 '{args.snapshot}' 이 없습니다. plane snapshot 으로 먼저 생성하세요.")
+        sys.exit(1)
+
+    snapshot = Snapshot.load(args.snapshot)
+    receiver = WebhookReceiver(snapshot, args.secret)
+
+    if args.replay:
+        print(f"  기록된 이벤트 반영 중: {args.replay}")
+        replay(receiver, args.replay)
+        if receiver.dirty:
+            snapshot.save(args.snapshot, receiver.lock)
+        print(f"  ✓ {receiver.applied}개 이벤트 반영, stale {sum(len(v) for v in receiver.stale.values())}개")
+        return
+
+    api = None
+    if args.api_key:
+        from plane_client import PlaneAPI
+        api = PlaneAPI(args.base_url, args.api_key, args.workspace)
+    else:
+        print("  ⚠ API Key 가 없어 stale 재조회와 전체 재수집을 수행하지 않습니다.")
+
+    handler = type("BoundWebhookHandler", (WebhookHandler,), {"receiver": receiver})
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    stop = threading.Event()
+    worker = threading.Thread(
+        target=run_maintenance,
+        args=(receiver, api, args.snapshot, stop, args.save_interval, args.reconcile_interval),
+        name="plane-webhook-maintenance", daemon=True,
+    )
+    worker.start()
+    print(f"  ✓ webhook 대기 중: http://{args.host}:{args.port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n\n중단됨.")
+    finally:
+        stop.set()
+        server.server_close()
+        # 유지보수 스레드의 저장과 같은 임시 파일을 쓰지 않도록 끝날 때까지 기다린 뒤 저장
+        worker.join()
+        if receiver.dirty:
+            snapshot.save(args.snapshot, receiver.lock)
+
+
+if __name__ == "__main__":
+    main()